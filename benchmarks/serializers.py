@@ -0,0 +1,172 @@
+import time
+import datetime
+
+import tasker
+
+
+number_of_iterations = 20000
+number_of_frame_iterations = 200
+frame_size = 100
+
+
+def craft_record(
+    args=(),
+    kwargs=None,
+    report_completion=False,
+):
+    return tasker.task_record.TaskRecord(
+        name='benchmark_task',
+        date=datetime.datetime.utcnow().timestamp(),
+        args=args,
+        kwargs=kwargs,
+        completion_key='benchmark_task.00000000000000000000000000000000' if report_completion else None,
+    ).to_record()
+
+
+payload_factories = {
+    'empty_task': lambda index: craft_record(),
+    'small_args': lambda index: craft_record(
+        args=(
+            'https://www.example.com/path/to/resource/{index}'.format(
+                index=index,
+            ),
+            index,
+        ),
+    ),
+    'kwargs': lambda index: craft_record(
+        kwargs={
+            'url': 'https://www.example.com/path/to/resource/{index}'.format(
+                index=index,
+            ),
+            'timeout': 30,
+            'retries': 3,
+            'follow_redirects': True,
+            'headers': {
+                'User-Agent': 'tasker',
+                'Accept': 'application/json',
+            },
+        },
+        report_completion=True,
+    ),
+    'large_document': lambda index: craft_record(
+        args=(
+            {
+                'id': index,
+                'title': 'a' * 200,
+                'tags': [
+                    'tag_{tag_index}'.format(
+                        tag_index=tag_index,
+                    )
+                    for tag_index in range(50)
+                ],
+                'values': [
+                    value_index * 1.5 + index
+                    for value_index in range(200)
+                ],
+            },
+        ),
+    ),
+}
+
+
+def measure(
+    function,
+    argument,
+    iterations,
+):
+    before = time.perf_counter()
+    for i in range(iterations):
+        function(argument)
+    after = time.perf_counter()
+
+    return iterations / (after - before)
+
+
+print(
+    '{payload:<16} {serializer:<10} {compressor:<8} {size:>8} {encode:>14} {decode:>14} {round_trip:>10}'.format(
+        payload='payload',
+        serializer='serializer',
+        compressor='codec',
+        size='bytes',
+        encode='encode ops/s',
+        decode='decode ops/s',
+        round_trip='lossless',
+    )
+)
+
+for payload_name, payload_factory in payload_factories.items():
+    payload = payload_factory(0)
+
+    for serializer_name in sorted(tasker.encoder.serializer.__serializers__):
+        for compressor_name in ['dummy', 'zlib']:
+            encoder_obj = tasker.encoder.encoder.Encoder(
+                compressor_name=compressor_name,
+                serializer_name=serializer_name,
+                compression_level=1,
+            )
+
+            encoded = encoder_obj.encode(payload)
+
+            print(
+                '{payload:<16} {serializer:<10} {compressor:<8} {size:>8} {encode:>14,.0f} {decode:>14,.0f} {round_trip:>10}'.format(
+                    payload=payload_name,
+                    serializer=serializer_name,
+                    compressor=compressor_name,
+                    size=len(encoded),
+                    encode=measure(
+                        function=encoder_obj.encode,
+                        argument=payload,
+                        iterations=number_of_iterations,
+                    ),
+                    decode=measure(
+                        function=encoder_obj.decode,
+                        argument=encoded,
+                        iterations=number_of_iterations,
+                    ),
+                    round_trip=str(encoder_obj.decode(encoded) == payload),
+                )
+            )
+
+print()
+print(
+    '{payload:<16} {serializer:<10} {size:>12} {encode:>14} {decode:>14}'.format(
+        payload='frame payload',
+        serializer='serializer',
+        size='bytes/task',
+        encode='tasks/s enc',
+        decode='tasks/s dec',
+    )
+)
+
+for payload_name, payload_factory in payload_factories.items():
+    frame = [
+        payload_factory(index)
+        for index in range(frame_size)
+    ]
+
+    for serializer_name in sorted(tasker.encoder.serializer.__serializers__):
+        encoder_obj = tasker.encoder.encoder.Encoder(
+            compressor_name='zlib',
+            serializer_name=serializer_name,
+            compression_level=1,
+        )
+
+        encoded_frame = encoder_obj.encode_frame(frame)
+
+        print(
+            '{payload:<16} {serializer:<10} {size:>12.1f} {encode:>14,.0f} {decode:>14,.0f}'.format(
+                payload=payload_name,
+                serializer=serializer_name,
+                size=len(encoded_frame) / frame_size,
+                encode=measure(
+                    function=encoder_obj.encode_frame,
+                    argument=frame,
+                    iterations=number_of_frame_iterations,
+                ) * frame_size,
+                decode=measure(
+                    function=encoder_obj.decode_frame,
+                    argument=encoded_frame,
+                    iterations=number_of_frame_iterations,
+                ) * frame_size,
+            )
+        )
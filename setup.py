@@ -11,7 +11,7 @@ setuptools.setup(
     install_requires=[
         'redis',
         'hiredis',
-        'msgpack-python',
+        'msgpack>=1.0',
         'psutil',
         'aiohttp',
         'aioredis',
@@ -1,6 +1,8 @@
+from . import batch_sizer
 from . import scheduler
 from . import supervisor
 from . import task_queue
+from . import task_record
 from . import worker
 
 from . import connector
@@ -0,0 +1,66 @@
+import math
+
+
+class BatchSizer:
+    def __init__(
+        self,
+        initial_batch_size,
+        min_batch_size,
+        max_batch_size,
+        target_batch_duration,
+        smoothing_factor,
+    ):
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.target_batch_duration = target_batch_duration
+        self.smoothing_factor = smoothing_factor
+
+        self.batch_size = min(
+            max(initial_batch_size, min_batch_size),
+            max_batch_size,
+        )
+        self.average_task_duration = None
+
+    def update(
+        self,
+        number_of_tasks,
+        duration,
+        queue_length=None,
+    ):
+        if number_of_tasks <= 0:
+            return self.batch_size
+
+        task_duration = duration / number_of_tasks
+        if self.average_task_duration is None:
+            self.average_task_duration = task_duration
+        else:
+            self.average_task_duration += self.smoothing_factor * (
+                task_duration - self.average_task_duration
+            )
+
+        if self.average_task_duration > 0:
+            desired_batch_size = math.floor(self.target_batch_duration / self.average_task_duration)
+        else:
+            desired_batch_size = self.max_batch_size
+
+        if queue_length is not None:
+            desired_batch_size = min(
+                desired_batch_size,
+                math.ceil((queue_length + number_of_tasks) / 2),
+            )
+
+        desired_batch_size = min(
+            desired_batch_size,
+            self.batch_size * 2,
+        )
+        desired_batch_size = max(
+            desired_batch_size,
+            self.batch_size // 2,
+        )
+
+        self.batch_size = min(
+            max(desired_batch_size, self.min_batch_size),
+            self.max_batch_size,
+        )
+
+        return self.batch_size
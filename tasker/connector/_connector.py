@@ -31,6 +31,27 @@ class Connector:
     ):
         raise NotImplementedError()
 
+    def key_refresh(
+        self,
+        key,
+        value,
+        ttl,
+    ):
+        raise NotImplementedError()
+
+    def key_increment(
+        self,
+        key,
+        amount,
+    ):
+        raise NotImplementedError()
+
+    def keys_exist(
+        self,
+        keys,
+    ):
+        raise NotImplementedError()
+
     def pop(
         self,
         key,
@@ -42,6 +63,31 @@ class Connector:
         self,
         key,
         count,
+        timeout=0,
+    ):
+        raise NotImplementedError()
+
+    def pop_bulk_with_len(
+        self,
+        key,
+        count,
+        timeout=0,
+    ):
+        raise NotImplementedError()
+
+    def move_bulk(
+        self,
+        key,
+        destination,
+        count,
+        timeout=0,
+    ):
+        raise NotImplementedError()
+
+    def move_all(
+        self,
+        key,
+        destination,
     ):
         raise NotImplementedError()
 
@@ -59,6 +105,135 @@ class Connector:
     ):
         raise NotImplementedError()
 
+    def push_front(
+        self,
+        key,
+        value,
+    ):
+        raise NotImplementedError()
+
+    def priority_push_bulk(
+        self,
+        key,
+        values,
+        priorities,
+    ):
+        raise NotImplementedError()
+
+    def priority_pop_bulk(
+        self,
+        key,
+        count,
+        timeout=0,
+    ):
+        raise NotImplementedError()
+
+    def priority_len(
+        self,
+        key,
+    ):
+        raise NotImplementedError()
+
+    def delayed_push_bulk(
+        self,
+        key,
+        values,
+        due_times,
+    ):
+        raise NotImplementedError()
+
+    def delayed_pop_due(
+        self,
+        key,
+        now,
+        count,
+    ):
+        raise NotImplementedError()
+
+    def delayed_move_due(
+        self,
+        key,
+        destination,
+        now,
+        count,
+    ):
+        raise NotImplementedError()
+
+    def delayed_move_due_to_priority(
+        self,
+        key,
+        destination,
+        now,
+        count,
+    ):
+        raise NotImplementedError()
+
+    def delayed_move_due_to_stream(
+        self,
+        key,
+        destination,
+        now,
+        count,
+    ):
+        raise NotImplementedError()
+
+    def delayed_len(
+        self,
+        key,
+    ):
+        raise NotImplementedError()
+
+    def stream_add_bulk(
+        self,
+        key,
+        values,
+    ):
+        raise NotImplementedError()
+
+    def stream_read_group(
+        self,
+        key,
+        group_name,
+        consumer_name,
+        count,
+        timeout=0,
+    ):
+        raise NotImplementedError()
+
+    def stream_ack(
+        self,
+        key,
+        group_name,
+        receipts,
+    ):
+        raise NotImplementedError()
+
+    def stream_touch(
+        self,
+        key,
+        group_name,
+        consumer_name,
+        receipts,
+    ):
+        raise NotImplementedError()
+
+    def stream_requeue_idle(
+        self,
+        key,
+        group_name,
+        consumer_name,
+        min_idle_time,
+        count,
+    ):
+        raise NotImplementedError()
+
+    def stream_len(
+        self,
+        key,
+        group_name,
+    ):
+        raise NotImplementedError()
+
     def add_to_set(
         self,
         set_name,
@@ -73,6 +248,13 @@ class Connector:
     ):
         raise NotImplementedError()
 
+    def remove_from_set_bulk(
+        self,
+        set_name,
+        values,
+    ):
+        raise NotImplementedError()
+
     def is_member_of_set(
         self,
         set_name,
@@ -80,6 +262,12 @@ class Connector:
     ):
         raise NotImplementedError()
 
+    def get_set_members(
+        self,
+        set_name,
+    ):
+        raise NotImplementedError()
+
     def len(
         self,
         key,
@@ -0,0 +1,195 @@
+pop_bulk = '''
+    local count = tonumber(ARGV[1])
+    local values = {}
+
+    if count > 0 then
+        values = redis.call('LPOP', KEYS[1], count) or {}
+    end
+
+    return {values, redis.call('LLEN', KEYS[1])}
+'''
+
+move_bulk = '''
+    local count = tonumber(ARGV[1])
+    local values = {}
+
+    if count > 0 then
+        values = redis.call('LPOP', KEYS[1], count) or {}
+    end
+
+    for i = 1, #values, 1000 do
+        redis.call('RPUSH', KEYS[2], unpack(values, i, math.min(i + 999, #values)))
+    end
+
+    return values
+'''
+
+move_all = '''
+    local moved = 0
+
+    while redis.call('LMOVE', KEYS[1], KEYS[2], 'RIGHT', 'LEFT') do
+        moved = moved + 1
+    end
+
+    return moved
+'''
+
+priority_push_bulk = '''
+    local number_of_values = #ARGV / 2
+    local sequence = redis.call('INCRBY', KEYS[2], number_of_values) - number_of_values
+    local members = {}
+
+    for i = 1, #ARGV, 2 do
+        sequence = sequence + 1
+
+        local score = (255 - tonumber(ARGV[i])) * 35184372088832 + sequence
+        table.insert(members, string.format('%.0f', score))
+        table.insert(members, string.format('%.0f', sequence) .. ':' .. ARGV[i + 1])
+
+        if #members >= 2000 then
+            redis.call('ZADD', KEYS[1], unpack(members))
+            members = {}
+        end
+    end
+
+    if #members > 0 then
+        redis.call('ZADD', KEYS[1], unpack(members))
+    end
+
+    return number_of_values
+'''
+
+priority_pop_bulk = '''
+    local members = redis.call('ZPOPMIN', KEYS[1], ARGV[1])
+    local values = {}
+
+    for i = 1, #members, 2 do
+        local separator = string.find(members[i], ':', 1, true)
+        table.insert(values, string.sub(members[i], separator + 1))
+    end
+
+    return values
+'''
+
+priority_remove_bulk = '''
+    local values = {}
+
+    for i = 1, #ARGV do
+        if redis.call('ZREM', KEYS[1], ARGV[i]) == 1 then
+            local separator = string.find(ARGV[i], ':', 1, true)
+            table.insert(values, string.sub(ARGV[i], separator + 1))
+        else
+            table.insert(values, false)
+        end
+    end
+
+    return values
+'''
+
+delayed_push_bulk = '''
+    local number_of_values = #ARGV / 2
+    local sequence = redis.call('INCRBY', KEYS[2], number_of_values) - number_of_values
+    local members = {}
+
+    for i = 1, #ARGV, 2 do
+        sequence = sequence + 1
+
+        table.insert(members, ARGV[i])
+        table.insert(members, string.format('%.0f', sequence) .. ':' .. ARGV[i + 1])
+
+        if #members >= 2000 then
+            redis.call('ZADD', KEYS[1], unpack(members))
+            members = {}
+        end
+    end
+
+    if #members > 0 then
+        redis.call('ZADD', KEYS[1], unpack(members))
+    end
+
+    return number_of_values
+'''
+
+delayed_pop_due = '''
+    local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+    local values = {}
+
+    for i = 1, #members do
+        local separator = string.find(members[i], ':', 1, true)
+        table.insert(values, string.sub(members[i], separator + 1))
+    end
+
+    for i = 1, #members, 1000 do
+        redis.call('ZREM', KEYS[1], unpack(members, i, math.min(i + 999, #members)))
+    end
+
+    return values
+'''
+
+delayed_move_due = '''
+    local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+    local values = {}
+
+    for i = 1, #members do
+        local separator = string.find(members[i], ':', 1, true)
+        table.insert(values, string.sub(members[i], separator + 1))
+    end
+
+    for i = 1, #members, 1000 do
+        local last = math.min(i + 999, #members)
+
+        redis.call('ZREM', KEYS[1], unpack(members, i, last))
+        redis.call('RPUSH', KEYS[2], unpack(values, i, last))
+    end
+
+    return #members
+'''
+
+delayed_move_due_to_priority = '''
+    local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+    local sequence = redis.call('INCRBY', KEYS[3], #members) - #members
+    local priority_members = {}
+
+    for i = 1, #members do
+        sequence = sequence + 1
+
+        local separator = string.find(members[i], ':', 1, true)
+        local value = string.sub(members[i], separator + 1)
+        local priority_separator = string.find(value, ':', 1, true)
+        local priority = math.min(math.max(tonumber(string.sub(value, 1, priority_separator - 1)), 0), 255)
+
+        local score = (255 - priority) * 35184372088832 + sequence
+        table.insert(priority_members, string.format('%.0f', score))
+        table.insert(priority_members, string.format('%.0f', sequence) .. ':' .. string.sub(value, priority_separator + 1))
+
+        if #priority_members >= 2000 then
+            redis.call('ZADD', KEYS[2], unpack(priority_members))
+            priority_members = {}
+        end
+    end
+
+    if #priority_members > 0 then
+        redis.call('ZADD', KEYS[2], unpack(priority_members))
+    end
+
+    for i = 1, #members, 1000 do
+        redis.call('ZREM', KEYS[1], unpack(members, i, math.min(i + 999, #members)))
+    end
+
+    return #members
+'''
+
+delayed_move_due_to_stream = '''
+    local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+
+    for i = 1, #members do
+        local separator = string.find(members[i], ':', 1, true)
+        redis.call('XADD', KEYS[2], '*', 'value', string.sub(members[i], separator + 1))
+    end
+
+    for i = 1, #members, 1000 do
+        redis.call('ZREM', KEYS[1], unpack(members, i, math.min(i + 999, #members)))
+    end
+
+    return #members
+'''
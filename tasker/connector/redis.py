@@ -1,6 +1,7 @@
 import redis
 
 from . import _connector
+from . import _scripts
 
 
 class Connector(
@@ -33,6 +34,37 @@ class Connector(
             socket_timeout=60,
         )
 
+        self.pop_bulk_script = self.connection.register_script(
+            script=_scripts.pop_bulk,
+        )
+        self.move_bulk_script = self.connection.register_script(
+            script=_scripts.move_bulk,
+        )
+        self.move_all_script = self.connection.register_script(
+            script=_scripts.move_all,
+        )
+        self.priority_push_bulk_script = self.connection.register_script(
+            script=_scripts.priority_push_bulk,
+        )
+        self.priority_pop_bulk_script = self.connection.register_script(
+            script=_scripts.priority_pop_bulk,
+        )
+        self.delayed_push_bulk_script = self.connection.register_script(
+            script=_scripts.delayed_push_bulk,
+        )
+        self.delayed_pop_due_script = self.connection.register_script(
+            script=_scripts.delayed_pop_due,
+        )
+        self.delayed_move_due_script = self.connection.register_script(
+            script=_scripts.delayed_move_due,
+        )
+        self.delayed_move_due_to_priority_script = self.connection.register_script(
+            script=_scripts.delayed_move_due_to_priority,
+        )
+        self.delayed_move_due_to_stream_script = self.connection.register_script(
+            script=_scripts.delayed_move_due_to_stream,
+        )
+
     def key_set(
         self,
         key,
@@ -62,11 +94,60 @@ class Connector(
     ):
         return self.connection.delete(*keys)
 
+    def key_refresh(
+        self,
+        key,
+        value,
+        ttl,
+    ):
+        return self.connection.set(
+            name=key,
+            value=value,
+            px=ttl,
+        )
+
+    def key_increment(
+        self,
+        key,
+        amount,
+    ):
+        return self.connection.incrby(
+            name=key,
+            amount=amount,
+        )
+
+    def keys_exist(
+        self,
+        keys,
+    ):
+        pipeline = self.connection.pipeline()
+
+        for key in keys:
+            pipeline.exists(key)
+
+        return [
+            bool(exists)
+            for exists in pipeline.execute()
+        ]
+
     def pop(
         self,
         key,
         timeout=0,
     ):
+        if timeout:
+            value = self.connection.blpop(
+                keys=[
+                    key,
+                ],
+                timeout=timeout,
+            )
+
+            if value is None:
+                return None
+            else:
+                return value[1]
+
         value = self.connection.lpop(
             name=key,
         )
@@ -80,18 +161,96 @@ class Connector(
         self,
         key,
         count,
+        timeout=0,
     ):
-        pipeline = self.connection.pipeline()
+        values, remaining = self.pop_bulk_with_len(
+            key=key,
+            count=count,
+            timeout=timeout,
+        )
 
-        pipeline.lrange(key, 0, count - 1)
-        pipeline.ltrim(key, count, -1)
+        return values
 
-        value = pipeline.execute()
+    def pop_bulk_with_len(
+        self,
+        key,
+        count,
+        timeout=0,
+    ):
+        values, remaining = self.pop_bulk_script(
+            keys=[
+                key,
+            ],
+            args=[
+                count,
+            ],
+        )
+
+        if values or not timeout:
+            return values, remaining
+
+        first_value = self.pop(
+            key=key,
+            timeout=timeout,
+        )
+        if first_value is None:
+            return [], 0
+
+        values, remaining = self.pop_bulk_with_len(
+            key=key,
+            count=count - 1,
+        )
 
-        if len(value) == 1:
+        return [first_value] + values, remaining
+
+    def move_bulk(
+        self,
+        key,
+        destination,
+        count,
+        timeout=0,
+    ):
+        values = self.move_bulk_script(
+            keys=[
+                key,
+                destination,
+            ],
+            args=[
+                count,
+            ],
+        )
+
+        if values or not timeout:
+            return values
+
+        first_value = self.connection.execute_command(
+            'BLMOVE',
+            key,
+            destination,
+            'LEFT',
+            'RIGHT',
+            timeout,
+        )
+        if first_value is None:
             return []
-        else:
-            return value[0]
+
+        return [first_value] + self.move_bulk(
+            key=key,
+            destination=destination,
+            count=count - 1,
+        )
+
+    def move_all(
+        self,
+        key,
+        destination,
+    ):
+        return self.move_all_script(
+            keys=[
+                key,
+                destination,
+            ],
+        )
 
     def push(
         self,
@@ -107,6 +266,386 @@ class Connector(
     ):
         return self.connection.rpush(key, *values)
 
+    def push_front(
+        self,
+        key,
+        value,
+    ):
+        return self.connection.lpush(key, value)
+
+    def priority_push_bulk(
+        self,
+        key,
+        values,
+        priorities,
+    ):
+        args = []
+        for value, priority in zip(values, priorities):
+            args.append(min(max(int(priority), 0), 255))
+            args.append(value)
+
+        return self.priority_push_bulk_script(
+            keys=[
+                key,
+                '{key}.sequence'.format(
+                    key=key,
+                ),
+            ],
+            args=args,
+        )
+
+    def priority_pop_bulk(
+        self,
+        key,
+        count,
+        timeout=0,
+    ):
+        values = self.priority_pop_bulk_script(
+            keys=[
+                key,
+            ],
+            args=[
+                count,
+            ],
+        )
+
+        if values or not timeout:
+            return values
+
+        member = self.connection.bzpopmin(
+            keys=[
+                key,
+            ],
+            timeout=timeout,
+        )
+        if member is None:
+            return []
+
+        first_value = member[1].split(b':', 1)[1]
+        if count == 1:
+            return [first_value]
+
+        return [first_value] + self.priority_pop_bulk(
+            key=key,
+            count=count - 1,
+        )
+
+    def priority_len(
+        self,
+        key,
+    ):
+        return self.connection.zcard(
+            name=key,
+        )
+
+    def delayed_push_bulk(
+        self,
+        key,
+        values,
+        due_times,
+    ):
+        args = []
+        for value, due_time in zip(values, due_times):
+            args.append(repr(float(due_time)))
+            args.append(value)
+
+        return self.delayed_push_bulk_script(
+            keys=[
+                key,
+                '{key}.sequence'.format(
+                    key=key,
+                ),
+            ],
+            args=args,
+        )
+
+    def delayed_pop_due(
+        self,
+        key,
+        now,
+        count,
+    ):
+        return self.delayed_pop_due_script(
+            keys=[
+                key,
+            ],
+            args=[
+                repr(float(now)),
+                count,
+            ],
+        )
+
+    def delayed_move_due(
+        self,
+        key,
+        destination,
+        now,
+        count,
+    ):
+        return self.delayed_move_due_script(
+            keys=[
+                key,
+                destination,
+            ],
+            args=[
+                repr(float(now)),
+                count,
+            ],
+        )
+
+    def delayed_move_due_to_priority(
+        self,
+        key,
+        destination,
+        now,
+        count,
+    ):
+        return self.delayed_move_due_to_priority_script(
+            keys=[
+                key,
+                destination,
+                '{destination}.sequence'.format(
+                    destination=destination,
+                ),
+            ],
+            args=[
+                repr(float(now)),
+                count,
+            ],
+        )
+
+    def delayed_move_due_to_stream(
+        self,
+        key,
+        destination,
+        now,
+        count,
+    ):
+        return self.delayed_move_due_to_stream_script(
+            keys=[
+                key,
+                destination,
+            ],
+            args=[
+                repr(float(now)),
+                count,
+            ],
+        )
+
+    def delayed_len(
+        self,
+        key,
+    ):
+        return self.connection.zcard(
+            name=key,
+        )
+
+    def stream_add_bulk(
+        self,
+        key,
+        values,
+    ):
+        pipeline = self.connection.pipeline(
+            transaction=False,
+        )
+
+        for value in values:
+            pipeline.xadd(
+                name=key,
+                fields={
+                    'value': value,
+                },
+            )
+
+        return pipeline.execute()
+
+    def stream_create_group(
+        self,
+        key,
+        group_name,
+    ):
+        try:
+            self.connection.xgroup_create(
+                name=key,
+                groupname=group_name,
+                id='0',
+                mkstream=True,
+            )
+        except redis.exceptions.ResponseError as exception:
+            if 'BUSYGROUP' not in str(exception):
+                raise exception
+
+    def stream_read_group(
+        self,
+        key,
+        group_name,
+        consumer_name,
+        count,
+        timeout=0,
+    ):
+        if timeout:
+            block = max(int(timeout * 1000), 1)
+        else:
+            block = None
+
+        try:
+            streams = self.connection.xreadgroup(
+                groupname=group_name,
+                consumername=consumer_name,
+                streams={
+                    key: '>',
+                },
+                count=count,
+                block=block,
+            )
+        except redis.exceptions.ResponseError as exception:
+            if 'NOGROUP' not in str(exception):
+                raise exception
+
+            self.stream_create_group(
+                key=key,
+                group_name=group_name,
+            )
+
+            return self.stream_read_group(
+                key=key,
+                group_name=group_name,
+                consumer_name=consumer_name,
+                count=count,
+                timeout=timeout,
+            )
+
+        if not streams:
+            return []
+
+        return [
+            (entry_id, fields[b'value'])
+            for entry_id, fields in streams[0][1]
+        ]
+
+    def stream_ack(
+        self,
+        key,
+        group_name,
+        receipts,
+    ):
+        if not receipts:
+            return 0
+
+        pipeline = self.connection.pipeline(
+            transaction=False,
+        )
+
+        pipeline.xack(key, group_name, *receipts)
+        pipeline.xdel(key, *receipts)
+
+        acked, deleted = pipeline.execute()
+
+        return acked
+
+    def stream_touch(
+        self,
+        key,
+        group_name,
+        consumer_name,
+        receipts,
+    ):
+        if not receipts:
+            return []
+
+        return self.connection.xclaim(
+            name=key,
+            groupname=group_name,
+            consumername=consumer_name,
+            min_idle_time=0,
+            message_ids=receipts,
+            justid=True,
+        )
+
+    def stream_requeue_idle(
+        self,
+        key,
+        group_name,
+        consumer_name,
+        min_idle_time,
+        count,
+    ):
+        requeued = 0
+        start_id = '0-0'
+
+        while True:
+            try:
+                reply = self.connection.xautoclaim(
+                    name=key,
+                    groupname=group_name,
+                    consumername=consumer_name,
+                    min_idle_time=min_idle_time,
+                    start_id=start_id,
+                    count=count,
+                )
+            except redis.exceptions.ResponseError as exception:
+                if 'NOGROUP' not in str(exception):
+                    raise exception
+
+                return requeued
+
+            start_id = reply[0]
+            entries = [
+                (entry_id, fields)
+                for entry_id, fields in reply[1]
+                if entry_id is not None
+            ]
+
+            if entries:
+                pipeline = self.connection.pipeline()
+
+                entry_ids = []
+                for entry_id, fields in entries:
+                    entry_ids.append(entry_id)
+                    if not fields:
+                        continue
+
+                    pipeline.xadd(
+                        name=key,
+                        fields={
+                            'value': fields[b'value'],
+                        },
+                    )
+                    requeued += 1
+
+                pipeline.xack(key, group_name, *entry_ids)
+                pipeline.xdel(key, *entry_ids)
+                pipeline.execute()
+
+            if start_id in (b'0-0', '0-0'):
+                return requeued
+
+    def stream_len(
+        self,
+        key,
+        group_name,
+    ):
+        pipeline = self.connection.pipeline(
+            transaction=False,
+        )
+
+        pipeline.xlen(
+            name=key,
+        )
+        pipeline.xpending(
+            name=key,
+            groupname=group_name,
+        )
+
+        stream_len, pending = pipeline.execute(
+            raise_on_error=False,
+        )
+
+        if isinstance(pending, dict):
+            return stream_len - pending['pending']
+        else:
+            return stream_len
+
     def add_to_set(
         self,
         set_name,
@@ -125,6 +664,18 @@ class Connector(
 
         return bool(removed)
 
+    def remove_from_set_bulk(
+        self,
+        set_name,
+        values,
+    ):
+        if not values:
+            return 0
+
+        removed = self.connection.srem(set_name, *values)
+
+        return removed
+
     def is_member_of_set(
         self,
         set_name,
@@ -137,6 +688,14 @@ class Connector(
 
         return is_memeber
 
+    def get_set_members(
+        self,
+        set_name,
+    ):
+        return self.connection.smembers(
+            name=set_name,
+        )
+
     def len(
         self,
         key,
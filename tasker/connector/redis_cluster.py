@@ -1,13 +1,16 @@
 import redis
 import random
+import time
 
 from . import _connector
+from . import _scripts
 
 
 class Connector(
     _connector.Connector,
 ):
     name = 'redis_cluster'
+    wait_poll_interval = 0.05
 
     def __init__(
         self,
@@ -33,6 +36,40 @@ class Connector(
 
         self.master_connection = self.connections[0]
 
+        self.pop_bulk_script = self.master_connection.register_script(
+            script=_scripts.pop_bulk,
+        )
+        self.move_bulk_script = self.master_connection.register_script(
+            script=_scripts.move_bulk,
+        )
+        self.move_all_script = self.master_connection.register_script(
+            script=_scripts.move_all,
+        )
+        self.priority_push_bulk_script = self.master_connection.register_script(
+            script=_scripts.priority_push_bulk,
+        )
+        self.priority_pop_bulk_script = self.master_connection.register_script(
+            script=_scripts.priority_pop_bulk,
+        )
+        self.priority_remove_bulk_script = self.master_connection.register_script(
+            script=_scripts.priority_remove_bulk,
+        )
+        self.delayed_push_bulk_script = self.master_connection.register_script(
+            script=_scripts.delayed_push_bulk,
+        )
+        self.delayed_pop_due_script = self.master_connection.register_script(
+            script=_scripts.delayed_pop_due,
+        )
+        self.delayed_move_due_script = self.master_connection.register_script(
+            script=_scripts.delayed_move_due,
+        )
+        self.delayed_move_due_to_priority_script = self.master_connection.register_script(
+            script=_scripts.delayed_move_due_to_priority,
+        )
+        self.delayed_move_due_to_stream_script = self.master_connection.register_script(
+            script=_scripts.delayed_move_due_to_stream,
+        )
+
         random.shuffle(self.connections)
 
     def rotate_connections(
@@ -69,6 +106,42 @@ class Connector(
     ):
         return self.master_connection.delete(*keys)
 
+    def key_refresh(
+        self,
+        key,
+        value,
+        ttl,
+    ):
+        return self.master_connection.set(
+            name=key,
+            value=value,
+            px=ttl,
+        )
+
+    def key_increment(
+        self,
+        key,
+        amount,
+    ):
+        return self.master_connection.incrby(
+            name=key,
+            amount=amount,
+        )
+
+    def keys_exist(
+        self,
+        keys,
+    ):
+        pipeline = self.master_connection.pipeline()
+
+        for key in keys:
+            pipeline.exists(key)
+
+        return [
+            bool(exists)
+            for exists in pipeline.execute()
+        ]
+
     def pop(
         self,
         key,
@@ -86,27 +159,179 @@ class Connector(
             else:
                 self.rotate_connections()
 
-        return None
+        if not timeout:
+            return None
+
+        return self.wait_pop(
+            key=key,
+            timeout=timeout,
+        )
+
+    def wait_for_value(
+        self,
+        pop_function,
+        timeout,
+        **kwargs
+    ):
+        if len(self.connections) == 1:
+            return pop_function(
+                connection=self.connections[0],
+                timeout=timeout,
+                **kwargs
+            )
+
+        deadline = time.monotonic() + timeout
+
+        while True:
+            for connection in self.connections:
+                value = pop_function(
+                    connection=connection,
+                    timeout=None,
+                    **kwargs
+                )
+
+                if value:
+                    return value
+                else:
+                    self.rotate_connections()
+
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                return None
+
+            time.sleep(min(self.wait_poll_interval, remaining_time))
+
+    def pop_from_connection(
+        self,
+        connection,
+        key,
+        timeout,
+    ):
+        if timeout is None:
+            return connection.lpop(
+                name=key,
+            )
+
+        value = connection.blpop(
+            keys=[
+                key,
+            ],
+            timeout=timeout,
+        )
+
+        if value:
+            return value[1]
+        else:
+            return None
+
+    def wait_pop(
+        self,
+        key,
+        timeout,
+    ):
+        return self.wait_for_value(
+            pop_function=self.pop_from_connection,
+            timeout=timeout,
+            key=key,
+        )
 
     def pop_bulk(
         self,
         key,
         count,
+        timeout=0,
+    ):
+        values, remaining = self.pop_bulk_with_len(
+            key=key,
+            count=count,
+            timeout=timeout,
+        )
+
+        return values
+
+    def pop_bulk_with_len(
+        self,
+        key,
+        count,
+        timeout=0,
     ):
         values = []
+        remaining = 0
         connections = self.connections
         current_count = count
 
-        for connection in connections:
-            pipeline = connection.pipeline()
+        for connection_index, connection in enumerate(connections):
+            node_values, node_remaining = self.pop_bulk_script(
+                keys=[
+                    key,
+                ],
+                args=[
+                    current_count,
+                ],
+                client=connection,
+            )
+
+            remaining += node_remaining
+
+            if node_values:
+                values += node_values
+            else:
+                self.rotate_connections()
+
+                continue
+
+            if len(values) == count:
+                for unvisited_connection in connections[connection_index + 1:]:
+                    remaining += unvisited_connection.llen(
+                        name=key,
+                    )
+
+                return values, remaining
+
+            current_count = count - len(values)
 
-            pipeline.lrange(key, 0, current_count - 1)
-            pipeline.ltrim(key, current_count, -1)
+        if values or not timeout:
+            return values, remaining
+
+        first_value = self.wait_pop(
+            key=key,
+            timeout=timeout,
+        )
+        if first_value is None:
+            return [], 0
+
+        values, remaining = self.pop_bulk_with_len(
+            key=key,
+            count=count - 1,
+        )
+
+        return [first_value] + values, remaining
+
+    def move_bulk(
+        self,
+        key,
+        destination,
+        count,
+        timeout=0,
+    ):
+        values = []
+        connections = self.connections
+        current_count = count
 
-            value = pipeline.execute()
+        for connection in connections:
+            node_values = self.move_bulk_script(
+                keys=[
+                    key,
+                    destination,
+                ],
+                args=[
+                    current_count,
+                ],
+                client=connection,
+            )
 
-            if len(value) != 1:
-                values += value[0]
+            if node_values:
+                values += node_values
             else:
                 self.rotate_connections()
 
@@ -117,7 +342,66 @@ class Connector(
 
             current_count = count - len(values)
 
-        return values
+        if values or not timeout:
+            return values
+
+        first_value = self.wait_for_value(
+            pop_function=self.move_from_connection,
+            timeout=timeout,
+            key=key,
+            destination=destination,
+        )
+        if first_value is None:
+            return []
+
+        return [first_value] + self.move_bulk(
+            key=key,
+            destination=destination,
+            count=count - 1,
+        )
+
+    def move_from_connection(
+        self,
+        connection,
+        key,
+        destination,
+        timeout,
+    ):
+        if timeout is None:
+            return connection.execute_command(
+                'LMOVE',
+                key,
+                destination,
+                'LEFT',
+                'RIGHT',
+            )
+
+        return connection.execute_command(
+            'BLMOVE',
+            key,
+            destination,
+            'LEFT',
+            'RIGHT',
+            timeout,
+        )
+
+    def move_all(
+        self,
+        key,
+        destination,
+    ):
+        moved = 0
+
+        for connection in self.connections:
+            moved += self.move_all_script(
+                keys=[
+                    key,
+                    destination,
+                ],
+                client=connection,
+            )
+
+        return moved
 
     def push(
         self,
@@ -141,6 +425,613 @@ class Connector(
 
         return push_returned_value
 
+    def push_front(
+        self,
+        key,
+        value,
+    ):
+        push_returned_value = self.connections[0].lpush(key, value)
+
+        self.rotate_connections()
+
+        return push_returned_value
+
+    def priority_push_bulk(
+        self,
+        key,
+        values,
+        priorities,
+    ):
+        args = []
+        for value, priority in zip(values, priorities):
+            args.append(min(max(int(priority), 0), 255))
+            args.append(value)
+
+        push_returned_value = self.priority_push_bulk_script(
+            keys=[
+                key,
+                '{key}.sequence'.format(
+                    key=key,
+                ),
+            ],
+            args=args,
+            client=self.connections[0],
+        )
+
+        self.rotate_connections()
+
+        return push_returned_value
+
+    def priority_pop_bulk(
+        self,
+        key,
+        count,
+        timeout=0,
+    ):
+        candidates = []
+
+        for connection in self.connections:
+            members = connection.zrange(
+                name=key,
+                start=0,
+                end=count - 1,
+                withscores=True,
+            )
+
+            for member, score in members:
+                candidates.append(
+                    (
+                        score,
+                        member,
+                        connection,
+                    )
+                )
+
+        candidates.sort(
+            key=lambda candidate: candidate[0],
+        )
+
+        members_by_connection = {}
+        for score, member, connection in candidates[:count]:
+            members_by_connection.setdefault(
+                connection,
+                [],
+            ).append(
+                (
+                    score,
+                    member,
+                )
+            )
+
+        popped = []
+        for connection, members in members_by_connection.items():
+            node_values = self.priority_remove_bulk_script(
+                keys=[
+                    key,
+                ],
+                args=[
+                    member
+                    for score, member in members
+                ],
+                client=connection,
+            )
+
+            for (score, member), value in zip(members, node_values):
+                if value:
+                    popped.append(
+                        (
+                            score,
+                            value,
+                        )
+                    )
+
+        if popped or not timeout:
+            popped.sort(
+                key=lambda popped_value: popped_value[0],
+            )
+
+            return [
+                value
+                for score, value in popped
+            ]
+
+        first_value = self.wait_for_value(
+            pop_function=self.priority_pop_from_connection,
+            timeout=timeout,
+            key=key,
+        )
+        if first_value is None:
+            return []
+
+        if count == 1:
+            return [first_value]
+
+        return [first_value] + self.priority_pop_bulk(
+            key=key,
+            count=count - 1,
+        )
+
+    def priority_pop_from_connection(
+        self,
+        connection,
+        key,
+        timeout,
+    ):
+        if timeout is None:
+            members = connection.zpopmin(
+                name=key,
+            )
+            if not members:
+                return None
+
+            member = members[0][0]
+        else:
+            popped_member = connection.bzpopmin(
+                keys=[
+                    key,
+                ],
+                timeout=timeout,
+            )
+            if popped_member is None:
+                return None
+
+            member = popped_member[1]
+
+        return member.split(b':', 1)[1]
+
+    def priority_len(
+        self,
+        key,
+    ):
+        total_len = 0
+
+        for connection in self.connections:
+            total_len += connection.zcard(
+                name=key,
+            )
+
+        return total_len
+
+    def delayed_push_bulk(
+        self,
+        key,
+        values,
+        due_times,
+    ):
+        args = []
+        for value, due_time in zip(values, due_times):
+            args.append(repr(float(due_time)))
+            args.append(value)
+
+        push_returned_value = self.delayed_push_bulk_script(
+            keys=[
+                key,
+                '{key}.sequence'.format(
+                    key=key,
+                ),
+            ],
+            args=args,
+            client=self.connections[0],
+        )
+
+        self.rotate_connections()
+
+        return push_returned_value
+
+    def delayed_pop_due(
+        self,
+        key,
+        now,
+        count,
+    ):
+        values = []
+
+        for connection in self.connections:
+            values += self.delayed_pop_due_script(
+                keys=[
+                    key,
+                ],
+                args=[
+                    repr(float(now)),
+                    count - len(values),
+                ],
+                client=connection,
+            )
+
+            if len(values) == count:
+                break
+
+        return values
+
+    def delayed_move_due(
+        self,
+        key,
+        destination,
+        now,
+        count,
+    ):
+        moved = 0
+
+        for connection in self.connections:
+            moved += self.delayed_move_due_script(
+                keys=[
+                    key,
+                    destination,
+                ],
+                args=[
+                    repr(float(now)),
+                    count - moved,
+                ],
+                client=connection,
+            )
+
+            if moved == count:
+                break
+
+        return moved
+
+    def delayed_move_due_to_priority(
+        self,
+        key,
+        destination,
+        now,
+        count,
+    ):
+        moved = 0
+
+        for connection in self.connections:
+            moved += self.delayed_move_due_to_priority_script(
+                keys=[
+                    key,
+                    destination,
+                    '{destination}.sequence'.format(
+                        destination=destination,
+                    ),
+                ],
+                args=[
+                    repr(float(now)),
+                    count - moved,
+                ],
+                client=connection,
+            )
+
+            if moved == count:
+                break
+
+        return moved
+
+    def delayed_move_due_to_stream(
+        self,
+        key,
+        destination,
+        now,
+        count,
+    ):
+        moved = 0
+
+        for connection in self.connections:
+            moved += self.delayed_move_due_to_stream_script(
+                keys=[
+                    key,
+                    destination,
+                ],
+                args=[
+                    repr(float(now)),
+                    count - moved,
+                ],
+                client=connection,
+            )
+
+            if moved == count:
+                break
+
+        return moved
+
+    def delayed_len(
+        self,
+        key,
+    ):
+        total_len = 0
+
+        for connection in self.connections:
+            total_len += connection.zcard(
+                name=key,
+            )
+
+        return total_len
+
+    def stream_add_bulk(
+        self,
+        key,
+        values,
+    ):
+        pipeline = self.connections[0].pipeline(
+            transaction=False,
+        )
+
+        for value in values:
+            pipeline.xadd(
+                name=key,
+                fields={
+                    'value': value,
+                },
+            )
+
+        added_ids = pipeline.execute()
+
+        self.rotate_connections()
+
+        return added_ids
+
+    def stream_create_group(
+        self,
+        connection,
+        key,
+        group_name,
+    ):
+        try:
+            connection.xgroup_create(
+                name=key,
+                groupname=group_name,
+                id='0',
+                mkstream=True,
+            )
+        except redis.exceptions.ResponseError as exception:
+            if 'BUSYGROUP' not in str(exception):
+                raise exception
+
+    def stream_read_group_from_connection(
+        self,
+        connection,
+        key,
+        group_name,
+        consumer_name,
+        count,
+        block,
+    ):
+        try:
+            streams = connection.xreadgroup(
+                groupname=group_name,
+                consumername=consumer_name,
+                streams={
+                    key: '>',
+                },
+                count=count,
+                block=block,
+            )
+        except redis.exceptions.ResponseError as exception:
+            if 'NOGROUP' not in str(exception):
+                raise exception
+
+            self.stream_create_group(
+                connection=connection,
+                key=key,
+                group_name=group_name,
+            )
+
+            return self.stream_read_group_from_connection(
+                connection=connection,
+                key=key,
+                group_name=group_name,
+                consumer_name=consumer_name,
+                count=count,
+                block=block,
+            )
+
+        if not streams:
+            return []
+
+        return [
+            ((connection, entry_id), fields[b'value'])
+            for entry_id, fields in streams[0][1]
+        ]
+
+    def stream_read_group(
+        self,
+        key,
+        group_name,
+        consumer_name,
+        count,
+        timeout=0,
+    ):
+        entries = []
+        connections = self.connections
+
+        for connection in connections:
+            entries += self.stream_read_group_from_connection(
+                connection=connection,
+                key=key,
+                group_name=group_name,
+                consumer_name=consumer_name,
+                count=count - len(entries),
+                block=None,
+            )
+
+            if len(entries) == count:
+                return entries
+            else:
+                self.rotate_connections()
+
+        if entries or not timeout:
+            return entries
+
+        entries = self.wait_for_value(
+            pop_function=self.stream_wait_group_from_connection,
+            timeout=timeout,
+            key=key,
+            group_name=group_name,
+            consumer_name=consumer_name,
+            count=count,
+        )
+        if entries is None:
+            return []
+
+        return entries
+
+    def stream_wait_group_from_connection(
+        self,
+        connection,
+        key,
+        group_name,
+        consumer_name,
+        count,
+        timeout,
+    ):
+        if timeout is None:
+            block = None
+        else:
+            block = max(int(timeout * 1000), 1)
+
+        return self.stream_read_group_from_connection(
+            connection=connection,
+            key=key,
+            group_name=group_name,
+            consumer_name=consumer_name,
+            count=count,
+            block=block,
+        )
+
+    def stream_ack(
+        self,
+        key,
+        group_name,
+        receipts,
+    ):
+        connection_to_entry_ids = {}
+        for connection, entry_id in receipts:
+            connection_to_entry_ids.setdefault(connection, []).append(entry_id)
+
+        acked = 0
+        for connection, entry_ids in connection_to_entry_ids.items():
+            pipeline = connection.pipeline(
+                transaction=False,
+            )
+
+            pipeline.xack(key, group_name, *entry_ids)
+            pipeline.xdel(key, *entry_ids)
+
+            connection_acked, connection_deleted = pipeline.execute()
+            acked += connection_acked
+
+        return acked
+
+    def stream_touch(
+        self,
+        key,
+        group_name,
+        consumer_name,
+        receipts,
+    ):
+        connection_to_entry_ids = {}
+        for connection, entry_id in receipts:
+            connection_to_entry_ids.setdefault(connection, []).append(entry_id)
+
+        touched = []
+        for connection, entry_ids in connection_to_entry_ids.items():
+            touched += connection.xclaim(
+                name=key,
+                groupname=group_name,
+                consumername=consumer_name,
+                min_idle_time=0,
+                message_ids=entry_ids,
+                justid=True,
+            )
+
+        return touched
+
+    def stream_requeue_idle(
+        self,
+        key,
+        group_name,
+        consumer_name,
+        min_idle_time,
+        count,
+    ):
+        requeued = 0
+
+        for connection in self.connections:
+            start_id = '0-0'
+
+            while True:
+                try:
+                    reply = connection.xautoclaim(
+                        name=key,
+                        groupname=group_name,
+                        consumername=consumer_name,
+                        min_idle_time=min_idle_time,
+                        start_id=start_id,
+                        count=count,
+                    )
+                except redis.exceptions.ResponseError as exception:
+                    if 'NOGROUP' not in str(exception):
+                        raise exception
+
+                    break
+
+                start_id = reply[0]
+                entries = [
+                    (entry_id, fields)
+                    for entry_id, fields in reply[1]
+                    if entry_id is not None
+                ]
+
+                if entries:
+                    pipeline = connection.pipeline()
+
+                    entry_ids = []
+                    for entry_id, fields in entries:
+                        entry_ids.append(entry_id)
+                        if not fields:
+                            continue
+
+                        pipeline.xadd(
+                            name=key,
+                            fields={
+                                'value': fields[b'value'],
+                            },
+                        )
+                        requeued += 1
+
+                    pipeline.xack(key, group_name, *entry_ids)
+                    pipeline.xdel(key, *entry_ids)
+                    pipeline.execute()
+
+                if start_id in (b'0-0', '0-0'):
+                    break
+
+        return requeued
+
+    def stream_len(
+        self,
+        key,
+        group_name,
+    ):
+        total_len = 0
+
+        for connection in self.connections:
+            pipeline = connection.pipeline(
+                transaction=False,
+            )
+
+            pipeline.xlen(
+                name=key,
+            )
+            pipeline.xpending(
+                name=key,
+                groupname=group_name,
+            )
+
+            stream_len, pending = pipeline.execute(
+                raise_on_error=False,
+            )
+
+            if isinstance(pending, dict):
+                total_len += stream_len - pending['pending']
+            else:
+                total_len += stream_len
+
+        return total_len
+
     def add_to_set(
         self,
         set_name,
@@ -159,6 +1050,18 @@ class Connector(
 
         return bool(removed)
 
+    def remove_from_set_bulk(
+        self,
+        set_name,
+        values,
+    ):
+        if not values:
+            return 0
+
+        removed = self.master_connection.srem(set_name, *values)
+
+        return removed
+
     def is_member_of_set(
         self,
         set_name,
@@ -171,6 +1074,14 @@ class Connector(
 
         return is_memeber
 
+    def get_set_members(
+        self,
+        set_name,
+    ):
+        return self.master_connection.smembers(
+            name=set_name,
+        )
+
     def len(
         self,
         key,
@@ -1,3 +1,6 @@
+from . import deadline_timer
 from . import heartbeater
 from . import killer
+from . import prefetcher
 from . import profiler
+from . import reaper
@@ -0,0 +1,113 @@
+import ctypes
+import heapq
+import threading
+import time
+
+from .. import logger
+
+
+class DeadlineTimer(threading.Thread):
+    def __init__(
+        self,
+        exception,
+    ):
+        super().__init__()
+
+        self.exception = exception
+
+        self.deadlines = {}
+        self.deadlines_heap = []
+        self.condition = threading.Condition()
+
+        self._stop_event = threading.Event()
+        self._stop_event.clear()
+
+        self.logger = logger.logger.Logger(
+            logger_name='deadline_timer',
+        )
+
+        self.daemon = True
+
+    def set_deadline(
+        self,
+        thread_id,
+        timeout,
+    ):
+        deadline = time.monotonic() + timeout
+
+        with self.condition:
+            self.deadlines[thread_id] = deadline
+            heapq.heappush(
+                self.deadlines_heap,
+                (
+                    deadline,
+                    thread_id,
+                ),
+            )
+
+            if self.deadlines_heap[0][0] == deadline:
+                self.condition.notify()
+
+    def clear_deadline(
+        self,
+        thread_id,
+    ):
+        with self.condition:
+            self.deadlines.pop(
+                thread_id,
+                None,
+            )
+
+            if len(self.deadlines_heap) > 2 * len(self.deadlines) + 1024:
+                self.deadlines_heap = [
+                    (deadline, heap_thread_id)
+                    for deadline, heap_thread_id in self.deadlines_heap
+                    if self.deadlines.get(heap_thread_id) == deadline
+                ]
+                heapq.heapify(self.deadlines_heap)
+
+    def run(
+        self,
+    ):
+        with self.condition:
+            while not self._stop_event.is_set():
+                now = time.monotonic()
+
+                while self.deadlines_heap and self.deadlines_heap[0][0] <= now:
+                    deadline, thread_id = heapq.heappop(self.deadlines_heap)
+                    if self.deadlines.get(thread_id) != deadline:
+                        continue
+
+                    del self.deadlines[thread_id]
+
+                    try:
+                        ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                            ctypes.c_long(thread_id),
+                            ctypes.py_object(self.exception),
+                        )
+                    except Exception as exception:
+                        self.logger.error(
+                            msg=exception,
+                        )
+
+                if self.deadlines_heap:
+                    wait_timeout = self.deadlines_heap[0][0] - now
+                else:
+                    wait_timeout = None
+
+                self.condition.wait(
+                    timeout=wait_timeout,
+                )
+
+    def stop(
+        self,
+    ):
+        self._stop_event.set()
+
+        with self.condition:
+            self.condition.notify()
+
+    def __del__(
+        self,
+    ):
+        self.stop()
@@ -30,6 +30,13 @@ class Heartbeater(threading.Thread):
         sleep_duration = 0
 
         while self._stop_event.is_set():
+            try:
+                self.monitor_client.flush_if_due()
+            except Exception as exception:
+                self.logger.error(
+                    msg=exception,
+                )
+
             if sleep_duration < self.interval:
                 time.sleep(0.1)
                 sleep_duration += 0.1
@@ -50,6 +57,13 @@ class Heartbeater(threading.Thread):
     ):
         self._stop_event.clear()
 
+        try:
+            self.monitor_client.flush()
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
     def __del__(
         self,
     ):
@@ -5,7 +5,17 @@ import os
 import psutil
 
 
-class LocalKiller:
+class LocalValue:
+    def __init__(
+        self,
+        value,
+    ):
+        self.value = value
+
+
+class Killer:
+    orphan_check_interval = 1.0
+
     def __init__(
         self,
         pid,
@@ -17,74 +27,129 @@ class LocalKiller:
         critical_timeout_signal,
         memory_limit,
         memory_limit_signal,
+        memory_sample_interval=0.5,
     ):
-        self.sleep_interval = 0.5
-
-        self.soft_timeout = soft_timeout
-        self.hard_timeout = hard_timeout
-        self.critical_timeout = critical_timeout
         self.memory_limit = memory_limit
-
-        self.soft_timeout_signal = soft_timeout_signal
-        self.hard_timeout_signal = hard_timeout_signal
-        self.critical_timeout_signal = critical_timeout_signal
         self.memory_limit_signal = memory_limit_signal
+        self.memory_sample_interval = memory_sample_interval
+
+        self.timeouts = [
+            (soft_timeout, soft_timeout_signal),
+            (hard_timeout, hard_timeout_signal),
+            (critical_timeout, critical_timeout_signal),
+        ]
 
-        self.time_elapsed = 0.0
+        self.max_wait_timeout = self.orphan_check_interval
+        for timeout, timeout_signal in self.timeouts:
+            if timeout != 0:
+                self.max_wait_timeout = min(self.max_wait_timeout, timeout / 2)
 
-        self.stop_event = threading.Event()
-        self.stop_event.clear()
+        self.started_at = self.create_value('d', 0.0)
+        self.elapsed_time = 0.0
 
         self.created = False
 
         self.pid_to_kill = pid
 
-    def killing_loop(
+    def create_value(
         self,
+        typecode,
+        value,
     ):
-        while self.stop_event.wait():
-            if not psutil.pid_exists(self.pid_to_kill):
-                return
+        raise NotImplementedError()
+
+    def create_killing_loop(
+        self,
+    ):
+        raise NotImplementedError()
 
+    def killing_loop(
+        self,
+    ):
+        try:
             process = psutil.Process(self.pid_to_kill)
-            if self.memory_limit != 0 and process.memory_info().rss >= self.memory_limit:
-                os.kill(self.pid_to_kill, self.memory_limit_signal)
+        except psutil.NoSuchProcess:
+            return
+
+        next_memory_sample = time.monotonic()
+        fired_timeouts = 0
+
+        while True:
+            now = time.monotonic()
+            started_at = self.started_at.value
+            wait_timeout = self.max_wait_timeout
+
+            try:
+                if not process.is_running():
+                    return
+
+                if started_at:
+                    elapsed_time = now - started_at
+
+                    for index, (timeout, timeout_signal) in enumerate(self.timeouts):
+                        if timeout == 0:
+                            continue
+
+                        if elapsed_time < timeout:
+                            fired_timeouts &= ~(1 << index)
+                            wait_timeout = min(wait_timeout, timeout - elapsed_time)
+                        elif not fired_timeouts & (1 << index) and self.started_at.value == started_at:
+                            fired_timeouts |= 1 << index
+                            os.kill(self.pid_to_kill, timeout_signal)
+
+                    if self.memory_limit != 0:
+                        if now >= next_memory_sample:
+                            if process.memory_info().rss >= self.memory_limit:
+                                os.kill(self.pid_to_kill, self.memory_limit_signal)
+
+                            next_memory_sample = now + self.memory_sample_interval
+
+                        wait_timeout = min(wait_timeout, next_memory_sample - now)
+            except (
+                ProcessLookupError,
+                psutil.NoSuchProcess,
+            ):
+                return
 
-            if self.soft_timeout != 0 and self.time_elapsed >= self.soft_timeout:
-                os.kill(self.pid_to_kill, self.soft_timeout_signal)
+            time.sleep(wait_timeout)
 
-            if self.hard_timeout != 0 and self.time_elapsed >= self.hard_timeout:
-                os.kill(self.pid_to_kill, self.hard_timeout_signal)
+    def start(
+        self,
+    ):
+        if not self.created:
+            self.create_killing_loop()
 
-            if self.critical_timeout != 0 and self.time_elapsed >= self.critical_timeout:
-                os.kill(self.pid_to_kill, self.critical_timeout_signal)
+            self.created = True
 
-            time.sleep(self.sleep_interval)
-            self.time_elapsed += self.sleep_interval
+        if not self.started_at.value:
+            self.started_at.value = time.monotonic() - self.elapsed_time
 
-    def start(
+    def restart(
         self,
     ):
         if not self.created:
-            killing_loop_thread = threading.Thread(
-                target=self.killing_loop,
-            )
-            killing_loop_thread.daemon = True
-            killing_loop_thread.start()
+            self.create_killing_loop()
 
             self.created = True
 
-        self.stop_event.set()
+        self.elapsed_time = 0.0
+        self.started_at.value = time.monotonic()
 
     def stop(
         self,
     ):
-        self.stop_event.clear()
+        started_at = self.started_at.value
+        if started_at:
+            self.elapsed_time = time.monotonic() - started_at
+            self.started_at.value = 0.0
 
     def reset(
         self,
     ):
-        self.time_elapsed = 0.0
+        self.elapsed_time = 0.0
+
+        if self.started_at.value:
+            self.started_at.value = time.monotonic()
 
     def __del__(
         self,
@@ -92,91 +157,47 @@ class LocalKiller:
         self.stop()
 
 
-class RemoteKiller:
-    def __init__(
-        self,
-        pid,
-        soft_timeout,
-        soft_timeout_signal,
-        hard_timeout,
-        hard_timeout_signal,
-        critical_timeout,
-        critical_timeout_signal,
-        memory_limit,
-        memory_limit_signal,
-    ):
-        self.sleep_interval = 0.5
-
-        self.soft_timeout = soft_timeout
-        self.hard_timeout = hard_timeout
-        self.critical_timeout = critical_timeout
-        self.memory_limit = memory_limit
-
-        self.soft_timeout_signal = soft_timeout_signal
-        self.hard_timeout_signal = hard_timeout_signal
-        self.critical_timeout_signal = critical_timeout_signal
-        self.memory_limit_signal = memory_limit_signal
-
-        self.time_elapsed = multiprocessing.Value('d', 0.0)
-
-        self.stop_event = multiprocessing.Event()
-        self.stop_event.clear()
-
-        self.created = False
-
-        self.pid_to_kill = pid
-
-    def killing_loop(
+class LocalKiller(
+    Killer,
+):
+    def create_value(
         self,
+        typecode,
+        value,
     ):
-        while self.stop_event.wait():
-            if not psutil.pid_exists(self.pid_to_kill):
-                return
-
-            process = psutil.Process(self.pid_to_kill)
-            if self.memory_limit != 0 and process.memory_info().rss >= self.memory_limit:
-                os.kill(self.pid_to_kill, self.memory_limit_signal)
-
-            with self.time_elapsed.get_lock():
-                if self.soft_timeout != 0 and self.time_elapsed.value >= self.soft_timeout:
-                    os.kill(self.pid_to_kill, self.soft_timeout_signal)
-
-                if self.hard_timeout != 0 and self.time_elapsed.value >= self.hard_timeout:
-                    os.kill(self.pid_to_kill, self.hard_timeout_signal)
-
-                if self.critical_timeout != 0 and self.time_elapsed.value >= self.critical_timeout:
-                    os.kill(self.pid_to_kill, self.critical_timeout_signal)
-
-                self.time_elapsed.value += self.sleep_interval
+        return LocalValue(
+            value=value,
+        )
 
-            time.sleep(self.sleep_interval)
-
-    def start(
+    def create_killing_loop(
         self,
     ):
-        if not self.created:
-            killing_loop_process = multiprocessing.Process(
-                target=self.killing_loop,
-            )
-            killing_loop_process.daemon = True
-            killing_loop_process.start()
+        killing_loop_thread = threading.Thread(
+            target=self.killing_loop,
+        )
+        killing_loop_thread.daemon = True
+        killing_loop_thread.start()
 
-            self.created = True
 
-        self.stop_event.set()
-
-    def stop(
-        self,
-    ):
-        self.stop_event.clear()
-
-    def reset(
+class RemoteKiller(
+    Killer,
+):
+    def create_value(
         self,
+        typecode,
+        value,
     ):
-        with self.time_elapsed.get_lock():
-            self.time_elapsed.value = 0.0
+        return multiprocessing.Value(
+            typecode,
+            value,
+            lock=False,
+        )
 
-    def __del__(
+    def create_killing_loop(
         self,
     ):
-        self.stop()
+        killing_loop_process = multiprocessing.Process(
+            target=self.killing_loop,
+        )
+        killing_loop_process.daemon = True
+        killing_loop_process.start()
@@ -0,0 +1,140 @@
+import queue
+import threading
+
+from .. import logger
+
+
+class Prefetcher(threading.Thread):
+    def __init__(
+        self,
+        fetch_function,
+        batch_size,
+        prefetch_batches,
+        timeout,
+    ):
+        super().__init__()
+
+        self.fetch_function = fetch_function
+        self.batch_size = batch_size
+        self.timeout = timeout
+
+        self.batches = queue.Queue(
+            maxsize=prefetch_batches,
+        )
+        self.leftover_tasks = []
+        self.unqueued_tasks = []
+
+        self._stop_event = threading.Event()
+        self._stop_event.clear()
+
+        self.logger = logger.logger.Logger(
+            logger_name='prefetcher',
+        )
+
+        self.daemon = True
+
+    def run(
+        self,
+    ):
+        while not self._stop_event.is_set():
+            try:
+                tasks = self.fetch_function(
+                    number_of_tasks=self.batch_size,
+                    timeout=self.timeout,
+                )
+            except Exception as exception:
+                self.logger.error(
+                    msg=exception,
+                )
+
+                tasks = []
+
+            if not tasks:
+                if self.timeout == 0:
+                    self._stop_event.wait(
+                        timeout=1.0,
+                    )
+
+                continue
+
+            while True:
+                try:
+                    self.batches.put(
+                        item=tasks,
+                        timeout=0.1,
+                    )
+
+                    break
+                except queue.Full:
+                    if self._stop_event.is_set():
+                        self.unqueued_tasks += tasks
+
+                        break
+
+    def get_tasks(
+        self,
+        number_of_tasks,
+        timeout=0,
+    ):
+        if not self.leftover_tasks:
+            try:
+                self.leftover_tasks = self.batches.get(
+                    timeout=timeout,
+                )
+            except queue.Empty:
+                return []
+
+        tasks = self.leftover_tasks[:number_of_tasks]
+        self.leftover_tasks = self.leftover_tasks[number_of_tasks:]
+
+        return tasks
+
+    def stop(
+        self,
+    ):
+        self._stop_event.set()
+
+        if self.is_alive():
+            self.join()
+
+        remaining_tasks = self.leftover_tasks + self.unqueued_tasks
+        self.leftover_tasks = []
+        self.unqueued_tasks = []
+
+        while True:
+            try:
+                remaining_tasks += self.batches.get_nowait()
+            except queue.Empty:
+                break
+
+        return remaining_tasks
+
+
+class DummyPrefetcher:
+    def __init__(
+        self,
+        fetch_function,
+        *args,
+        **kwargs
+    ):
+        self.fetch_function = fetch_function
+
+    def start(
+        self,
+    ):
+        pass
+
+    def get_tasks(
+        self,
+        number_of_tasks,
+        timeout=0,
+    ):
+        return self.fetch_function(
+            number_of_tasks=number_of_tasks,
+            timeout=timeout,
+        )
+
+    def stop(
+        self,
+    ):
+        return []
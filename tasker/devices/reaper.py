@@ -0,0 +1,74 @@
+import threading
+
+from .. import logger
+
+
+class Reaper(threading.Thread):
+    def __init__(
+        self,
+        queue,
+        queue_name,
+    ):
+        super().__init__()
+
+        self.queue = queue
+        self.queue_name = queue_name
+        self.interval = queue.consumer_timeout / 3
+
+        self._stop_event = threading.Event()
+        self._stop_event.clear()
+
+        self.logger = logger.logger.Logger(
+            logger_name='reaper',
+        )
+
+        self.daemon = True
+
+    def run(
+        self,
+    ):
+        while not self._stop_event.is_set():
+            try:
+                self.queue.keep_alive(
+                    queue_name=self.queue_name,
+                )
+                self.queue.requeue_dead_consumers(
+                    queue_name=self.queue_name,
+                )
+            except Exception as exception:
+                self.logger.error(
+                    msg=exception,
+                )
+
+            self._stop_event.wait(
+                timeout=self.interval,
+            )
+
+    def stop(
+        self,
+    ):
+        self._stop_event.set()
+
+    def __del__(
+        self,
+    ):
+        self.stop()
+
+
+class DummyReaper:
+    def __init__(
+        self,
+        *args,
+        **kwargs
+    ):
+        pass
+
+    def start(
+        self,
+    ):
+        pass
+
+    def stop(
+        self,
+    ):
+        pass
@@ -1,9 +1,11 @@
 class Compressor:
     name = ''
+    id = 0
 
     @staticmethod
     def compress(
         data,
+        level=None,
     ):
         raise NotImplementedError()
 
@@ -7,12 +7,20 @@ class Compressor(
     _compressor.Compressor,
 ):
     name = 'bzip2'
+    id = 3
 
     @staticmethod
     def compress(
         data,
+        level=None,
     ):
-        compressed_object = bz2.compress(data)
+        if level is None:
+            compressed_object = bz2.compress(data)
+        else:
+            compressed_object = bz2.compress(
+                data,
+                compresslevel=level,
+            )
 
         return compressed_object
 
@@ -5,10 +5,12 @@ class Compressor(
     _compressor.Compressor,
 ):
     name = 'dummy'
+    id = 0
 
     @staticmethod
     def compress(
         data,
+        level=None,
     ):
         compressed_object = data
 
@@ -7,12 +7,20 @@ class Compressor(
     _compressor.Compressor,
 ):
     name = 'gzip'
+    id = 2
 
     @staticmethod
     def compress(
         data,
+        level=None,
     ):
-        compressed_object = gzip.compress(data)
+        if level is None:
+            compressed_object = gzip.compress(data)
+        else:
+            compressed_object = gzip.compress(
+                data,
+                compresslevel=level,
+            )
 
         return compressed_object
 
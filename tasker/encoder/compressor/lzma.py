@@ -7,12 +7,20 @@ class Compressor(
     _compressor.Compressor,
 ):
     name = 'lzma'
+    id = 4
 
     @staticmethod
     def compress(
         data,
+        level=None,
     ):
-        compressed_object = lzma.compress(data)
+        if level is None:
+            compressed_object = lzma.compress(data)
+        else:
+            compressed_object = lzma.compress(
+                data,
+                preset=level,
+            )
 
         return compressed_object
 
@@ -7,12 +7,20 @@ class Compressor(
     _compressor.Compressor,
 ):
     name = 'zlib'
+    id = 1
 
     @staticmethod
     def compress(
         data,
+        level=None,
     ):
-        compressed_object = zlib.compress(data)
+        if level is None:
+            compressed_object = zlib.compress(data)
+        else:
+            compressed_object = zlib.compress(
+                data,
+                level,
+            )
 
         return compressed_object
 
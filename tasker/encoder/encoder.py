@@ -1,19 +1,73 @@
+import time
+
 from . import compressor
 from . import serializer
 
 
 class Encoder:
+    envelope_marker = 0xc1
+    frame_envelope_marker = 0xc2
+    envelope_header_size = 2
+
+    compressors_by_id = {
+        compressor_class.id: compressor_class
+        for compressor_class in compressor.__compressors__.values()
+    }
+    serializers_by_id = {
+        serializer_class.id: serializer_class
+        for serializer_class in serializer.__serializers__.values()
+    }
+
     def __init__(
         self,
         compressor_name,
         serializer_name,
+        compression_level=None,
+        adaptive_compression=False,
+        compression_threshold=1024,
     ):
         self.compressor_name = compressor_name
         self.serializer_name = serializer_name
+        self.compression_level = compression_level
+        self.adaptive_compression = adaptive_compression
+        self.compression_threshold = compression_threshold
 
         self.compressor = compressor.__compressors__[compressor_name]
         self.serializer = serializer.__serializers__[serializer_name]
 
+        self.envelope_header = bytes(
+            [
+                self.envelope_marker,
+                self.serializer.id << 4 | self.compressor.id,
+            ]
+        )
+        self.raw_envelope_header = bytes(
+            [
+                self.envelope_marker,
+                self.serializer.id << 4 | compressor.dummy.Compressor.id,
+            ]
+        )
+        self.frame_envelope_header = bytes(
+            [
+                self.frame_envelope_marker,
+                self.serializer.id << 4 | self.compressor.id,
+            ]
+        )
+        self.raw_frame_envelope_header = bytes(
+            [
+                self.frame_envelope_marker,
+                self.serializer.id << 4 | compressor.dummy.Compressor.id,
+            ]
+        )
+
+        self.compression_statistics = {
+            'compressed_payloads': 0,
+            'raw_payloads': 0,
+            'uncompressed_bytes': 0,
+            'compressed_bytes': 0,
+            'compression_time': 0.0,
+        }
+
     def encode(
         self,
         data,
@@ -21,18 +75,112 @@ class Encoder:
         serialized_data = self.serializer.serialize(
             data=data,
         )
+
+        return self.compress_payload(
+            serialized_data=serialized_data,
+            envelope_header=self.envelope_header,
+            raw_envelope_header=self.raw_envelope_header,
+        )
+
+    def encode_frame(
+        self,
+        values,
+    ):
+        serialized_data = self.serializer.serialize(
+            data=list(values),
+        )
+
+        return self.compress_payload(
+            serialized_data=serialized_data,
+            envelope_header=self.frame_envelope_header,
+            raw_envelope_header=self.raw_frame_envelope_header,
+        )
+
+    def compress_payload(
+        self,
+        serialized_data,
+        envelope_header,
+        raw_envelope_header,
+    ):
+        if self.adaptive_compression and len(serialized_data) < self.compression_threshold:
+            self.compression_statistics['raw_payloads'] += 1
+
+            return raw_envelope_header + serialized_data
+
+        compression_start_time = time.perf_counter()
         compressed_serialized_data = self.compressor.compress(
             data=serialized_data,
+            level=self.compression_level,
+        )
+        self.compression_statistics['compression_time'] += time.perf_counter() - compression_start_time
+        self.compression_statistics['uncompressed_bytes'] += len(serialized_data)
+        self.compression_statistics['compressed_bytes'] += len(compressed_serialized_data)
+
+        if self.adaptive_compression and len(compressed_serialized_data) >= len(serialized_data):
+            self.compression_statistics['raw_payloads'] += 1
+
+            return raw_envelope_header + serialized_data
+
+        self.compression_statistics['compressed_payloads'] += 1
+
+        return envelope_header + compressed_serialized_data
+
+    def get_compression_statistics(
+        self,
+    ):
+        compression_statistics = self.compression_statistics.copy()
+
+        if compression_statistics['uncompressed_bytes']:
+            compression_statistics['compression_ratio'] = compression_statistics['compressed_bytes'] / compression_statistics['uncompressed_bytes']
+        else:
+            compression_statistics['compression_ratio'] = 1.0
+
+        return compression_statistics
+
+    def is_frame(
+        self,
+        data,
+    ):
+        return len(data) >= self.envelope_header_size and data[0] == self.frame_envelope_marker
+
+    def unpack_envelope(
+        self,
+        data_view,
+    ):
+        codecs_id = data_view[1]
+
+        try:
+            data_compressor = self.compressors_by_id[codecs_id & 0x0f]
+            data_serializer = self.serializers_by_id[codecs_id >> 4]
+        except KeyError:
+            raise ValueError(
+                'unknown codecs in envelope header: {codecs_id:#04x}'.format(
+                    codecs_id=codecs_id,
+                )
+            )
+
+        decompressed_data = data_compressor.decompress(
+            data=data_view[self.envelope_header_size:],
+        )
+        unserialized_decompressed_data = data_serializer.unserialize(
+            data=decompressed_data,
         )
 
-        return compressed_serialized_data
+        return unserialized_decompressed_data
 
     def decode(
         self,
         data,
     ):
+        data_view = memoryview(data)
+
+        if len(data_view) >= self.envelope_header_size and data_view[0] == self.envelope_marker:
+            return self.unpack_envelope(
+                data_view=data_view,
+            )
+
         decompressed_data = self.compressor.decompress(
-            data=data,
+            data=data_view,
         )
         unserialized_decompressed_data = self.serializer.unserialize(
             data=decompressed_data,
@@ -40,12 +188,30 @@ class Encoder:
 
         return unserialized_decompressed_data
 
+    def decode_frame(
+        self,
+        data,
+    ):
+        data_view = memoryview(data)
+
+        if not self.is_frame(
+            data=data_view,
+        ):
+            raise ValueError('data is not an encoded frame')
+
+        return self.unpack_envelope(
+            data_view=data_view,
+        )
+
     def __getstate__(
         self,
     ):
         state = {
             'compressor_name': self.compressor_name,
             'serializer_name': self.serializer_name,
+            'compression_level': self.compression_level,
+            'adaptive_compression': self.adaptive_compression,
+            'compression_threshold': self.compression_threshold,
         }
 
         return state
@@ -57,4 +223,7 @@ class Encoder:
         self.__init__(
             compressor_name=value['compressor_name'],
             serializer_name=value['serializer_name'],
+            compression_level=value['compression_level'],
+            adaptive_compression=value['adaptive_compression'],
+            compression_threshold=value['compression_threshold'],
         )
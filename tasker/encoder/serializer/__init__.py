@@ -1,3 +1,5 @@
+from . import json
+from . import marshal
 from . import msgpack
 from . import pickle
 
@@ -5,6 +7,8 @@ from . import _serializer
 
 
 __serializers__ = {
+    json.Serializer.name: json.Serializer,
+    marshal.Serializer.name: marshal.Serializer,
     msgpack.Serializer.name: msgpack.Serializer,
     pickle.Serializer.name: pickle.Serializer,
 }
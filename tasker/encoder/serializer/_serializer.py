@@ -1,5 +1,6 @@
 class Serializer:
     name = ''
+    id = 0
 
     @staticmethod
     def serialize(
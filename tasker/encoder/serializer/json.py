@@ -0,0 +1,43 @@
+import json
+
+from . import _serializer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class Serializer(
+    _serializer.Serializer,
+):
+    name = 'json'
+    id = 4
+
+    @staticmethod
+    def serialize(
+        data,
+    ):
+        if orjson is not None:
+            return orjson.dumps(data)
+
+        serialized_object = json.dumps(
+            data,
+            ensure_ascii=False,
+            separators=(',', ':'),
+        ).encode('utf-8')
+
+        return serialized_object
+
+    @staticmethod
+    def unserialize(
+        data,
+    ):
+        if orjson is not None:
+            return orjson.loads(data)
+
+        unserialized_object = json.loads(
+            str(data, 'utf-8'),
+        )
+
+        return unserialized_object
@@ -0,0 +1,29 @@
+import marshal
+
+from . import _serializer
+
+
+class Serializer(
+    _serializer.Serializer,
+):
+    name = 'marshal'
+    id = 3
+
+    @staticmethod
+    def serialize(
+        data,
+    ):
+        serialized_object = marshal.dumps(
+            data,
+            marshal.version,
+        )
+
+        return serialized_object
+
+    @staticmethod
+    def unserialize(
+        data,
+    ):
+        unserialized_object = marshal.loads(data)
+
+        return unserialized_object
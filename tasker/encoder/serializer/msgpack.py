@@ -1,3 +1,8 @@
+import datetime
+import decimal
+import struct
+import uuid
+
 import msgpack
 
 from . import _serializer
@@ -7,12 +12,154 @@ class Serializer(
     _serializer.Serializer,
 ):
     name = 'msgpack'
+    id = 2
+
+    datetime_ext_type = 1
+    decimal_ext_type = 2
+    uuid_ext_type = 3
+    tuple_ext_type = 4
+
+    datetime_struct = struct.Struct('!HBBBBBI')
+    utc_offset_struct = struct.Struct('!i')
+
+    ext_buffer_size = 256
+
+    @staticmethod
+    def pack_ext_type(
+        obj,
+    ):
+        if isinstance(obj, tuple):
+            return msgpack.ExtType(
+                code=Serializer.tuple_ext_type,
+                data=msgpack.packb(
+                    list(obj),
+                    default=Serializer.pack_ext_type,
+                    use_bin_type=True,
+                    strict_types=True,
+                    buf_size=Serializer.ext_buffer_size,
+                ),
+            )
+
+        if isinstance(obj, datetime.datetime):
+            packed_datetime = Serializer.datetime_struct.pack(
+                obj.year,
+                obj.month,
+                obj.day,
+                obj.hour,
+                obj.minute,
+                obj.second,
+                obj.microsecond,
+            )
+
+            utc_offset = obj.utcoffset()
+            if utc_offset is not None:
+                packed_datetime += Serializer.utc_offset_struct.pack(
+                    utc_offset // datetime.timedelta(seconds=1),
+                )
+
+            return msgpack.ExtType(
+                code=Serializer.datetime_ext_type,
+                data=packed_datetime,
+            )
+
+        if isinstance(obj, decimal.Decimal):
+            return msgpack.ExtType(
+                code=Serializer.decimal_ext_type,
+                data=str(obj).encode('utf-8'),
+            )
+
+        if isinstance(obj, uuid.UUID):
+            return msgpack.ExtType(
+                code=Serializer.uuid_ext_type,
+                data=obj.bytes,
+            )
+
+        if isinstance(obj, dict):
+            return dict(obj)
+
+        if isinstance(obj, list):
+            return list(obj)
+
+        if isinstance(obj, str):
+            return str(obj)
+
+        if isinstance(obj, bytes):
+            return bytes(obj)
+
+        if isinstance(obj, int):
+            return int(obj)
+
+        if isinstance(obj, float):
+            return float(obj)
+
+        raise TypeError(
+            'object of type {type_name} is not msgpack serializable'.format(
+                type_name=type(obj).__name__,
+            )
+        )
+
+    @staticmethod
+    def unpack_ext_type(
+        code,
+        data,
+    ):
+        if code == Serializer.tuple_ext_type:
+            return tuple(
+                Serializer.unserialize(
+                    data=data,
+                )
+            )
+
+        if code == Serializer.datetime_ext_type:
+            year, month, day, hour, minute, second, microsecond = Serializer.datetime_struct.unpack_from(data)
+
+            if len(data) > Serializer.datetime_struct.size:
+                utc_offset, = Serializer.utc_offset_struct.unpack_from(
+                    data,
+                    Serializer.datetime_struct.size,
+                )
+                tzinfo = datetime.timezone(
+                    datetime.timedelta(
+                        seconds=utc_offset,
+                    )
+                )
+            else:
+                tzinfo = None
+
+            return datetime.datetime(
+                year=year,
+                month=month,
+                day=day,
+                hour=hour,
+                minute=minute,
+                second=second,
+                microsecond=microsecond,
+                tzinfo=tzinfo,
+            )
+
+        if code == Serializer.decimal_ext_type:
+            return decimal.Decimal(data.decode('utf-8'))
+
+        if code == Serializer.uuid_ext_type:
+            return uuid.UUID(
+                bytes=data,
+            )
+
+        return msgpack.ExtType(
+            code=code,
+            data=data,
+        )
 
     @staticmethod
     def serialize(
         data,
     ):
-        serialized_object = msgpack.dumps(data)
+        serialized_object = msgpack.packb(
+            data,
+            default=Serializer.pack_ext_type,
+            use_bin_type=True,
+            strict_types=True,
+        )
 
         return serialized_object
 
@@ -20,9 +167,11 @@ class Serializer(
     def unserialize(
         data,
     ):
-        unserialized_object = msgpack.loads(
-            packed=data,
-            encoding='utf-8',
+        unserialized_object = msgpack.unpackb(
+            data,
+            ext_hook=Serializer.unpack_ext_type,
+            raw=False,
+            strict_map_key=False,
         )
 
         return unserialized_object
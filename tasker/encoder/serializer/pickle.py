@@ -7,6 +7,7 @@ class Serializer(
     _serializer.Serializer,
 ):
     name = 'pickle'
+    id = 1
 
     @staticmethod
     def serialize(
@@ -24,7 +25,7 @@ class Serializer(
         data,
     ):
         unserialized_object = pickle.loads(
-            data=data,
+            data,
             encoding='utf-8',
         )
 
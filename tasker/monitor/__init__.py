@@ -1,4 +1,8 @@
 from . import client
+from . import collector
+from . import exposition
+from . import histogram
 from . import message
+from . import rates
 from . import server
 from . import statistics
@@ -1,34 +1,204 @@
+import random
 import socket
+import threading
+import time
 
+from . import histogram
 from . import message
 
 
 class StatisticsClient:
+    histogram_resolution = histogram.Histogram.resolution
+    histogram_sub_bucket_bits = histogram.Histogram.sub_bucket_bits
+    histogram_sub_bucket_count = histogram.Histogram.sub_bucket_count
+    histogram_last_bucket_index = histogram.Histogram.number_of_buckets - 1
+
     def __init__(
         self,
         stats_server,
         host_name,
         worker_name,
+        flush_interval=1.0,
+        flush_size=1000,
+        registration_interval=30.0,
     ):
         self.stats_server = stats_server
         self.host_name = host_name
         self.worker_name = worker_name
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.registration_interval = registration_interval
+
+        self.source_id = random.randint(1, 2 ** 32 - 1)
+        self.registered = False
+        self.last_registration_time = None
 
         self.statistics_socket = socket.socket(
             family=socket.AF_INET,
             type=socket.SOCK_DGRAM,
         )
 
+        self.pending_metrics = {}
+        self.number_of_pending_events = 0
+        self.last_flush_time = time.monotonic()
+        self.pending_metrics_lock = threading.Lock()
+
+        self.thread_latency_counts = threading.local()
+        self.latency_counts = []
+
+        self.counters_sources = []
+        self.reported_counters = {}
+
     def increment_stats(
         self,
         message_type,
         message_value,
     ):
-        message_serialized_data = message.Message.serialize(
+        with self.pending_metrics_lock:
+            self.pending_metrics[message_type] = self.pending_metrics.get(message_type, 0) + message_value
+            self.number_of_pending_events += 1
+
+            if self.number_of_pending_events < self.flush_size and time.monotonic() - self.last_flush_time < self.flush_interval:
+                return
+
+            pending_metrics, pending_histograms = self.take_pending_metrics()
+
+        self.send_metrics(
+            metrics=pending_metrics,
+            histograms=pending_histograms,
+        )
+
+    def record_latency(
+        self,
+        latency_type,
+        value,
+        count=1,
+    ):
+        try:
+            latency_counts = self.thread_latency_counts.counts[latency_type]
+        except (
+            AttributeError,
+            KeyError,
+        ):
+            latency_counts = self.create_latency_counts(
+                latency_type=latency_type,
+            )
+
+        scaled_value = int(value * self.histogram_resolution)
+        if scaled_value < self.histogram_sub_bucket_count:
+            if scaled_value < 0:
+                scaled_value = 0
+
+            latency_counts[scaled_value] += count
+        else:
+            shift = scaled_value.bit_length() - self.histogram_sub_bucket_bits - 1
+            bucket_index = (shift << self.histogram_sub_bucket_bits) + (scaled_value >> shift)
+            if bucket_index > self.histogram_last_bucket_index:
+                bucket_index = self.histogram_last_bucket_index
+
+            latency_counts[bucket_index] += count
+
+    def create_latency_counts(
+        self,
+        latency_type,
+    ):
+        try:
+            thread_counts = self.thread_latency_counts.counts
+        except AttributeError:
+            thread_counts = {}
+            self.thread_latency_counts.counts = thread_counts
+
+        latency_counts = [0] * histogram.Histogram.number_of_buckets
+        thread_counts[latency_type] = latency_counts
+
+        with self.pending_metrics_lock:
+            self.latency_counts.append(
+                (
+                    latency_type,
+                    latency_counts,
+                    [0] * histogram.Histogram.number_of_buckets,
+                )
+            )
+
+        return latency_counts
+
+    def take_pending_histograms(
+        self,
+    ):
+        pending_histograms = {}
+
+        for latency_type, latency_counts, flushed_counts in self.latency_counts:
+            current_counts = latency_counts[:]
+            if current_counts == flushed_counts:
+                continue
+
+            bucket_counts = pending_histograms.setdefault(
+                latency_type,
+                {},
+            )
+            for bucket_index, (current_count, flushed_count) in enumerate(zip(current_counts, flushed_counts)):
+                if current_count != flushed_count:
+                    bucket_counts[bucket_index] = bucket_counts.get(bucket_index, 0) + current_count - flushed_count
+
+            flushed_counts[:] = current_counts
+
+        return pending_histograms
+
+    def add_counters_source(
+        self,
+        counters_function,
+    ):
+        with self.pending_metrics_lock:
+            self.counters_sources.append(counters_function)
+
+    def take_pending_counters(
+        self,
+    ):
+        for counters_function in self.counters_sources:
+            for counter_name, counter_value in counters_function().items():
+                counter_delta = counter_value - self.reported_counters.get(counter_name, 0)
+                if counter_delta <= 0:
+                    continue
+
+                self.pending_metrics[counter_name] = self.pending_metrics.get(counter_name, 0) + counter_delta
+                self.reported_counters[counter_name] = counter_value
+
+    def take_pending_metrics(
+        self,
+    ):
+        self.take_pending_counters()
+
+        pending_metrics = self.pending_metrics
+        pending_histograms = self.take_pending_histograms()
+
+        self.pending_metrics = {}
+        self.number_of_pending_events = 0
+        self.last_flush_time = time.monotonic()
+
+        return pending_metrics, pending_histograms
+
+    def send_metrics(
+        self,
+        metrics,
+        histograms,
+    ):
+        if not metrics and not histograms:
+            return
+
+        self.receive_replies()
+
+        now = time.monotonic()
+        include_names = not self.registered or now - self.last_registration_time >= self.registration_interval
+        if include_names:
+            self.last_registration_time = now
+
+        message_serialized_data = message.Message.serialize_metrics(
             hostname=self.host_name,
             worker_name=self.worker_name,
-            message_type=message_type,
-            message_value=message_value,
+            metrics=metrics,
+            histograms=histograms,
+            source_id=self.source_id,
+            include_names=include_names,
         )
 
         self.statistics_socket.sendto(
@@ -39,6 +209,58 @@ class StatisticsClient:
             ),
         )
 
+    def receive_replies(
+        self,
+    ):
+        while True:
+            try:
+                reply_data = self.statistics_socket.recv(
+                    message.Message.header_struct.size,
+                    socket.MSG_DONTWAIT,
+                )
+            except OSError:
+                return
+
+            try:
+                flags, source_id = message.Message.unserialize_reply(
+                    message=reply_data,
+                )
+            except ValueError:
+                continue
+
+            if source_id != self.source_id:
+                continue
+
+            if flags & message.Message.flag_ack:
+                self.registered = True
+            elif flags & message.Message.flag_nack:
+                self.registered = False
+
+    def flush(
+        self,
+    ):
+        with self.pending_metrics_lock:
+            pending_metrics, pending_histograms = self.take_pending_metrics()
+
+        self.send_metrics(
+            metrics=pending_metrics,
+            histograms=pending_histograms,
+        )
+
+    def flush_if_due(
+        self,
+    ):
+        with self.pending_metrics_lock:
+            if time.monotonic() - self.last_flush_time < self.flush_interval:
+                return
+
+            pending_metrics, pending_histograms = self.take_pending_metrics()
+
+        self.send_metrics(
+            metrics=pending_metrics,
+            histograms=pending_histograms,
+        )
+
     def increment_success(
         self,
         value=1,
@@ -87,6 +309,11 @@ class StatisticsClient:
     def __del__(
         self,
     ):
+        try:
+            self.flush()
+        except Exception:
+            pass
+
         self.statistics_socket.close()
 
     def __getstate__(
@@ -96,6 +323,9 @@ class StatisticsClient:
             'stats_server': self.stats_server,
             'host_name': self.host_name,
             'worker_name': self.worker_name,
+            'flush_interval': self.flush_interval,
+            'flush_size': self.flush_size,
+            'registration_interval': self.registration_interval,
         }
 
         return state
@@ -108,6 +338,9 @@ class StatisticsClient:
             stats_server=value['stats_server'],
             host_name=value['host_name'],
             worker_name=value['worker_name'],
+            flush_interval=value['flush_interval'],
+            flush_size=value['flush_size'],
+            registration_interval=value['registration_interval'],
         )
 
 
@@ -117,6 +350,9 @@ class StatisticsDummyClient:
         stats_server,
         host_name,
         worker_name,
+        flush_interval=1.0,
+        flush_size=1000,
+        registration_interval=30.0,
     ):
         pass
 
@@ -127,6 +363,30 @@ class StatisticsDummyClient:
     ):
         pass
 
+    def record_latency(
+        self,
+        latency_type,
+        value,
+        count=1,
+    ):
+        pass
+
+    def add_counters_source(
+        self,
+        counters_function,
+    ):
+        pass
+
+    def flush(
+        self,
+    ):
+        pass
+
+    def flush_if_due(
+        self,
+    ):
+        pass
+
     def increment_success(
         self,
         value=1,
@@ -0,0 +1,290 @@
+import asyncio
+import aioredis
+
+
+class QueueDepthNode:
+    def __init__(
+        self,
+        redis_server,
+    ):
+        self.redis_server = redis_server
+        self.connection = None
+
+        self.cursor = 0
+        self.key_types = {}
+        self.scanned_keys = set()
+        self.queues = {}
+        self.streams = {}
+
+
+class QueueDepthCollector:
+    ignored_key_suffixes = (
+        '_lock',
+        '.sequence',
+        '.consumers',
+    )
+    ignored_key_infixes = (
+        '.heartbeat.',
+    )
+    length_commands = {
+        b'list': 'llen',
+        b'set': 'scard',
+        b'zset': 'zcard',
+        b'stream': 'xlen',
+    }
+
+    def __init__(
+        self,
+        redis_servers,
+        interval=2.0,
+        scan_count=1000,
+        max_scans_per_collection=10,
+        pool_size=2,
+    ):
+        self.nodes = [
+            QueueDepthNode(
+                redis_server=redis_server,
+            )
+            for redis_server in redis_servers
+        ]
+        self.interval = interval
+        self.scan_count = scan_count
+        self.max_scans_per_collection = max_scans_per_collection
+        self.pool_size = pool_size
+
+        self.queues = {}
+        self.streams = {}
+
+    def is_queue_key(
+        self,
+        key_name,
+    ):
+        if key_name.endswith(self.ignored_key_suffixes):
+            return False
+
+        for ignored_key_infix in self.ignored_key_infixes:
+            if ignored_key_infix in key_name:
+                return False
+
+        return True
+
+    async def connect(
+        self,
+        node,
+    ):
+        if node.connection is None:
+            node.connection = await aioredis.create_redis_pool(
+                address=(
+                    node.redis_server['host'],
+                    node.redis_server['port'],
+                ),
+                password=node.redis_server['password'],
+                db=node.redis_server['database'],
+                minsize=1,
+                maxsize=self.pool_size,
+            )
+
+        return node.connection
+
+    async def discover_keys(
+        self,
+        node,
+    ):
+        connection = await self.connect(
+            node=node,
+        )
+
+        new_keys = []
+        for scan_number in range(self.max_scans_per_collection):
+            node.cursor, keys = await connection.scan(
+                cursor=node.cursor,
+                count=self.scan_count,
+            )
+
+            for key in keys:
+                key_name = key.decode('utf-8')
+                if not self.is_queue_key(
+                    key_name=key_name,
+                ):
+                    continue
+
+                node.scanned_keys.add(key_name)
+                if key_name not in node.key_types:
+                    new_keys.append(key_name)
+
+            if node.cursor == 0:
+                for key_name in list(node.key_types):
+                    if key_name not in node.scanned_keys:
+                        del node.key_types[key_name]
+                node.scanned_keys = set()
+
+                break
+
+        if new_keys:
+            pipeline = connection.pipeline()
+            for key_name in new_keys:
+                pipeline.type(key_name)
+            key_types = await pipeline.execute(
+                return_exceptions=True,
+            )
+
+            for key_name, key_type in zip(new_keys, key_types):
+                if not isinstance(key_type, Exception):
+                    node.key_types[key_name] = key_type
+
+    async def collect_node(
+        self,
+        node,
+    ):
+        await self.discover_keys(
+            node=node,
+        )
+
+        key_names = [
+            key_name
+            for key_name, key_type in node.key_types.items()
+            if key_type in self.length_commands
+        ]
+        if not key_names:
+            node.queues = {}
+            node.streams = {}
+
+            return node.queues
+
+        connection = await self.connect(
+            node=node,
+        )
+        pipeline = connection.pipeline()
+        for key_name in key_names:
+            length_command = getattr(pipeline, self.length_commands[node.key_types[key_name]])
+            length_command(key_name)
+        key_lengths = await pipeline.execute(
+            return_exceptions=True,
+        )
+
+        queues = {}
+        for key_name, key_length in zip(key_names, key_lengths):
+            if isinstance(key_length, Exception):
+                del node.key_types[key_name]
+
+                continue
+
+            queues[key_name] = key_length
+
+        node.queues = queues
+        node.streams = await self.collect_streams(
+            node=node,
+            connection=connection,
+        )
+
+        return node.queues
+
+    async def collect_streams(
+        self,
+        node,
+        connection,
+    ):
+        stream_names = [
+            key_name
+            for key_name in node.queues
+            if node.key_types.get(key_name) == b'stream'
+        ]
+        if not stream_names:
+            return {}
+
+        pipeline = connection.pipeline()
+        for stream_name in stream_names:
+            pipeline.xinfo_groups(stream_name)
+        streams_groups = await pipeline.execute(
+            return_exceptions=True,
+        )
+
+        streams = {}
+        for stream_name, stream_groups in zip(stream_names, streams_groups):
+            if isinstance(stream_groups, Exception):
+                continue
+
+            pending = sum(
+                stream_group[b'pending']
+                for stream_group in stream_groups
+            )
+            streams[stream_name] = {
+                'pending': pending,
+                'lag': max(node.queues[stream_name] - pending, 0),
+            }
+
+        return streams
+
+    async def collect(
+        self,
+    ):
+        nodes_queues = await asyncio.gather(
+            *[
+                self.collect_node(
+                    node=node,
+                )
+                for node in self.nodes
+            ],
+            return_exceptions=True,
+        )
+
+        queues = {}
+        streams = {}
+        for node, node_queues in zip(self.nodes, nodes_queues):
+            if isinstance(node_queues, Exception):
+                self.close_node(
+                    node=node,
+                )
+                node_queues = node.queues
+
+            for key_name, key_length in node_queues.items():
+                queues[key_name] = queues.get(key_name, 0) + key_length
+
+            for stream_name, stream_info in node.streams.items():
+                stream_totals = streams.setdefault(
+                    stream_name,
+                    {
+                        'pending': 0,
+                        'lag': 0,
+                    },
+                )
+                stream_totals['pending'] += stream_info['pending']
+                stream_totals['lag'] += stream_info['lag']
+
+        self.queues = queues
+        self.streams = streams
+
+        return self.queues
+
+    async def collect_forever(
+        self,
+        on_collect=None,
+    ):
+        while True:
+            try:
+                queues = await self.collect()
+
+                if on_collect is not None:
+                    on_collect(queues)
+            except Exception as exception:
+                print(str(exception))
+
+            await asyncio.sleep(
+                delay=self.interval,
+            )
+
+    def close_node(
+        self,
+        node,
+    ):
+        if node.connection is not None:
+            node.connection.close()
+            node.connection = None
+
+    def close(
+        self,
+    ):
+        for node in self.nodes:
+            self.close_node(
+                node=node,
+            )
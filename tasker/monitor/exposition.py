@@ -0,0 +1,253 @@
+from . import histogram
+
+
+class MetricsExposition:
+    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(
+        self,
+        statistics_obj,
+    ):
+        self.statistics_obj = statistics_obj
+
+        self.worker_counters_lines = {}
+        self.latency_histograms_lines = {}
+        self.rates_lines = ''
+        self.queue_depths_lines = ''
+        self.stream_pending_lines = ''
+        self.stream_lag_lines = ''
+
+        self.snapshot = b''
+
+    @staticmethod
+    def escape_label_value(
+        label_value,
+    ):
+        return str(label_value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    @staticmethod
+    def format_labels(
+        labels,
+    ):
+        return ','.join(
+            '{label_name}="{label_value}"'.format(
+                label_name=label_name,
+                label_value=MetricsExposition.escape_label_value(
+                    label_value=label_value,
+                ),
+            )
+            for label_name, label_value in labels
+        )
+
+    @staticmethod
+    def format_family(
+        name,
+        metric_type,
+        description,
+        lines,
+    ):
+        return '# HELP {name} {description}\n# TYPE {name} {metric_type}\n{lines}'.format(
+            name=name,
+            metric_type=metric_type,
+            description=description,
+            lines=lines,
+        )
+
+    def render_worker_counters(
+        self,
+        hostname,
+        worker_name,
+    ):
+        worker_metrics = self.statistics_obj.workers[hostname][worker_name]
+
+        return ''.join(
+            'tasker_tasks_total{{{labels}}} {value}\n'.format(
+                labels=self.format_labels(
+                    labels=(
+                        ('hostname', hostname),
+                        ('worker', worker_name),
+                        ('type', metric_type),
+                    ),
+                ),
+                value=metric_value,
+            )
+            for metric_type, metric_value in worker_metrics.items()
+        )
+
+    def render_latency_histograms(
+        self,
+        worker_name,
+    ):
+        lines = []
+
+        for latency_type, latency_histogram in self.statistics_obj.latencies[worker_name].items():
+            labels = (
+                ('worker', worker_name),
+                ('type', latency_type),
+            )
+            cumulative_count = 0
+            approximate_sum = 0.0
+
+            for bucket_index, bucket_count in enumerate(latency_histogram.counts):
+                if not bucket_count:
+                    continue
+
+                lower_bound, upper_bound = histogram.Histogram.get_bucket_bounds(
+                    bucket_index=bucket_index,
+                )
+                cumulative_count += bucket_count
+                approximate_sum += bucket_count * (lower_bound + upper_bound) / 2
+
+                lines.append(
+                    'tasker_task_latency_seconds_bucket{{{labels}}} {value}\n'.format(
+                        labels=self.format_labels(
+                            labels=labels + (('le', repr(upper_bound)),),
+                        ),
+                        value=cumulative_count,
+                    )
+                )
+
+            lines.append(
+                'tasker_task_latency_seconds_bucket{{{labels}}} {value}\n'.format(
+                    labels=self.format_labels(
+                        labels=labels + (('le', '+Inf'),),
+                    ),
+                    value=latency_histogram.total_count,
+                )
+            )
+            lines.append(
+                'tasker_task_latency_seconds_sum{{{labels}}} {value}\n'.format(
+                    labels=self.format_labels(
+                        labels=labels,
+                    ),
+                    value=repr(approximate_sum),
+                )
+            )
+            lines.append(
+                'tasker_task_latency_seconds_count{{{labels}}} {value}\n'.format(
+                    labels=self.format_labels(
+                        labels=labels,
+                    ),
+                    value=latency_histogram.total_count,
+                )
+            )
+
+        return ''.join(lines)
+
+    def update_rates(
+        self,
+        rates,
+    ):
+        self.rates_lines = ''.join(
+            'tasker_tasks_rate{{{labels}}} {value}\n'.format(
+                labels=self.format_labels(
+                    labels=(
+                        ('type', rate_name),
+                    ),
+                ),
+                value=repr(float(rate_value)),
+            )
+            for rate_name, rate_value in rates.items()
+        )
+
+    def update_queue_depths(
+        self,
+        queues,
+    ):
+        self.queue_depths_lines = ''.join(
+            'tasker_queue_depth{{{labels}}} {value}\n'.format(
+                labels=self.format_labels(
+                    labels=(
+                        ('queue', queue_name),
+                    ),
+                ),
+                value=queue_depth,
+            )
+            for queue_name, queue_depth in sorted(queues.items())
+        )
+
+    def update_streams(
+        self,
+        streams,
+    ):
+        self.stream_pending_lines = ''.join(
+            'tasker_stream_pending{{{labels}}} {value}\n'.format(
+                labels=self.format_labels(
+                    labels=(
+                        ('queue', stream_name),
+                    ),
+                ),
+                value=stream_info['pending'],
+            )
+            for stream_name, stream_info in sorted(streams.items())
+        )
+        self.stream_lag_lines = ''.join(
+            'tasker_stream_lag{{{labels}}} {value}\n'.format(
+                labels=self.format_labels(
+                    labels=(
+                        ('queue', stream_name),
+                    ),
+                ),
+                value=stream_info['lag'],
+            )
+            for stream_name, stream_info in sorted(streams.items())
+        )
+
+    def refresh(
+        self,
+    ):
+        updated_workers, updated_latencies = self.statistics_obj.take_updates()
+
+        for hostname, worker_name in updated_workers:
+            self.worker_counters_lines[(hostname, worker_name)] = self.render_worker_counters(
+                hostname=hostname,
+                worker_name=worker_name,
+            )
+
+        for worker_name in updated_latencies:
+            self.latency_histograms_lines[worker_name] = self.render_latency_histograms(
+                worker_name=worker_name,
+            )
+
+        families = [
+            self.format_family(
+                name='tasker_tasks_total',
+                metric_type='counter',
+                description='Number of task events reported by each worker.',
+                lines=''.join(self.worker_counters_lines.values()),
+            ),
+            self.format_family(
+                name='tasker_tasks_rate',
+                metric_type='gauge',
+                description='Global task events per second.',
+                lines=self.rates_lines,
+            ),
+            self.format_family(
+                name='tasker_queue_depth',
+                metric_type='gauge',
+                description='Number of entries in each queue.',
+                lines=self.queue_depths_lines,
+            ),
+            self.format_family(
+                name='tasker_stream_pending',
+                metric_type='gauge',
+                description='Number of stream entries delivered to a consumer and not yet acked.',
+                lines=self.stream_pending_lines,
+            ),
+            self.format_family(
+                name='tasker_stream_lag',
+                metric_type='gauge',
+                description='Number of stream entries not yet delivered to any consumer.',
+                lines=self.stream_lag_lines,
+            ),
+            self.format_family(
+                name='tasker_task_latency_seconds',
+                metric_type='histogram',
+                description='Task latencies by worker and stage.',
+                lines=''.join(self.latency_histograms_lines.values()),
+            ),
+        ]
+
+        self.snapshot = ''.join(families).encode('utf-8')
+
+        return self.snapshot
@@ -0,0 +1,112 @@
+class Histogram:
+    sub_bucket_bits = 4
+    sub_bucket_count = 1 << sub_bucket_bits
+    max_exponent = 40
+    number_of_buckets = sub_bucket_count * (max_exponent + 1)
+    resolution = 1000000
+
+    def __init__(
+        self,
+    ):
+        self.counts = [0] * self.number_of_buckets
+        self.total_count = 0
+
+    def record(
+        self,
+        value,
+        count=1,
+    ):
+        scaled_value = int(value * self.resolution)
+
+        if scaled_value < self.sub_bucket_count:
+            if scaled_value < 0:
+                scaled_value = 0
+
+            bucket_index = scaled_value
+        else:
+            shift = scaled_value.bit_length() - self.sub_bucket_bits - 1
+            bucket_index = (shift << self.sub_bucket_bits) + (scaled_value >> shift)
+
+            if bucket_index >= self.number_of_buckets:
+                bucket_index = self.number_of_buckets - 1
+
+        self.counts[bucket_index] += count
+        self.total_count += count
+
+    @classmethod
+    def get_bucket_bounds(
+        cls,
+        bucket_index,
+    ):
+        if bucket_index < cls.sub_bucket_count:
+            return (
+                bucket_index / cls.resolution,
+                (bucket_index + 1) / cls.resolution,
+            )
+
+        shift = (bucket_index >> cls.sub_bucket_bits) - 1
+        mantissa = cls.sub_bucket_count + (bucket_index & (cls.sub_bucket_count - 1))
+
+        return (
+            (mantissa << shift) / cls.resolution,
+            ((mantissa + 1) << shift) / cls.resolution,
+        )
+
+    def get_bucket_counts(
+        self,
+    ):
+        return {
+            bucket_index: bucket_count
+            for bucket_index, bucket_count in enumerate(self.counts)
+            if bucket_count
+        }
+
+    def merge_bucket_counts(
+        self,
+        bucket_counts,
+    ):
+        for bucket_index, bucket_count in bucket_counts.items():
+            if bucket_index >= self.number_of_buckets:
+                bucket_index = self.number_of_buckets - 1
+
+            self.counts[bucket_index] += bucket_count
+            self.total_count += bucket_count
+
+    def merge(
+        self,
+        histogram,
+    ):
+        self.merge_bucket_counts(
+            bucket_counts=histogram.get_bucket_counts(),
+        )
+
+    def percentile(
+        self,
+        percentile,
+    ):
+        if self.total_count == 0:
+            return 0.0
+
+        target_count = max(self.total_count * percentile / 100, 1)
+        cumulative_count = 0
+
+        for bucket_index, bucket_count in enumerate(self.counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= target_count:
+                lower_bound, upper_bound = self.get_bucket_bounds(
+                    bucket_index=bucket_index,
+                )
+
+                return (lower_bound + upper_bound) / 2
+
+        return 0.0
+
+    def get_summary(
+        self,
+    ):
+        return {
+            'count': self.total_count,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
@@ -1,7 +1,52 @@
-import pickle
+import struct
 
 
 class Message:
+    version = 1
+
+    flag_names = 0x01
+    flag_histograms = 0x02
+    flag_ack = 0x04
+    flag_nack = 0x08
+
+    compression_metric_names = (
+        'compressed_payloads',
+        'raw_payloads',
+        'uncompressed_bytes',
+        'compressed_bytes',
+        'compression_time_us',
+    )
+    metric_names = (
+        'success',
+        'failure',
+        'retry',
+        'process',
+        'heartbeat',
+    ) + compression_metric_names
+    metric_ids = {
+        metric_name: metric_id
+        for metric_id, metric_name in enumerate(metric_names)
+    }
+
+    latency_names = (
+        'queue_wait',
+        'decode',
+        'work',
+        'report_complete',
+    )
+    latency_ids = {
+        latency_name: latency_id
+        for latency_id, latency_name in enumerate(latency_names)
+    }
+
+    header_struct = struct.Struct('!BBI')
+    names_struct = struct.Struct('!HH')
+    metric_struct = struct.Struct('!BQ')
+    histograms_struct = struct.Struct('!H')
+    histogram_bucket_struct = struct.Struct('!BHI')
+
+    max_registrations = 65536
+
     @staticmethod
     def serialize(
         hostname,
@@ -9,38 +54,244 @@ class Message:
         message_type,
         message_value,
     ):
-        message = [
-            hostname,
-            worker_name,
-            message_type,
-            message_value,
-        ]
-
-        serialized_message = pickle.dumps(
-            obj=message,
+        return Message.serialize_metrics(
+            hostname=hostname,
+            worker_name=worker_name,
+            metrics={
+                message_type: message_value,
+            },
+        )
+
+    @staticmethod
+    def serialize_metrics(
+        hostname,
+        worker_name,
+        metrics,
+        histograms=None,
+        source_id=0,
+        include_names=True,
+    ):
+        flags = 0
+        if include_names:
+            flags |= Message.flag_names
+        if histograms:
+            flags |= Message.flag_histograms
+
+        serialized_message = bytearray(
+            Message.header_struct.pack(
+                Message.version,
+                flags,
+                source_id,
+            )
         )
 
-        return serialized_message
+        if include_names:
+            encoded_hostname = hostname.encode('utf-8')
+            encoded_worker_name = worker_name.encode('utf-8')
+
+            serialized_message += Message.names_struct.pack(
+                len(encoded_hostname),
+                len(encoded_worker_name),
+            )
+            serialized_message += encoded_hostname
+            serialized_message += encoded_worker_name
+
+        if histograms:
+            histogram_buckets = []
+            for latency_name, bucket_counts in histograms.items():
+                try:
+                    latency_id = Message.latency_ids[latency_name]
+                except KeyError:
+                    raise ValueError(
+                        'unknown latency: {latency_name}'.format(
+                            latency_name=latency_name,
+                        )
+                    )
+
+                for bucket_index, bucket_count in bucket_counts.items():
+                    histogram_buckets.append(
+                        Message.histogram_bucket_struct.pack(
+                            latency_id,
+                            bucket_index,
+                            bucket_count,
+                        )
+                    )
+
+            serialized_message += Message.histograms_struct.pack(
+                len(histogram_buckets),
+            )
+            serialized_message += b''.join(histogram_buckets)
+
+        for metric_name, metric_value in metrics.items():
+            try:
+                metric_id = Message.metric_ids[metric_name]
+            except KeyError:
+                raise ValueError(
+                    'unknown metric: {metric_name}'.format(
+                        metric_name=metric_name,
+                    )
+                )
+
+            serialized_message += Message.metric_struct.pack(
+                metric_id,
+                metric_value,
+            )
+
+        return bytes(serialized_message)
+
+    @staticmethod
+    def serialize_reply(
+        source_id,
+        flags,
+    ):
+        return Message.header_struct.pack(
+            Message.version,
+            flags,
+            source_id,
+        )
+
+    @staticmethod
+    def unserialize_reply(
+        message,
+    ):
+        try:
+            version, flags, source_id = Message.header_struct.unpack(message)
+        except struct.error:
+            raise ValueError('reply has an invalid size')
+
+        if version != Message.version:
+            raise ValueError(
+                'unsupported message version: {version}'.format(
+                    version=version,
+                )
+            )
+
+        return flags, source_id
 
     @staticmethod
     def unserialize(
         message,
+        registrations=None,
     ):
-        unserialized_message = pickle.loads(
-            data=message,
-            encoding='utf-8',
-        )
+        message_view = memoryview(message)
+
+        try:
+            version, flags, source_id = Message.header_struct.unpack_from(message_view)
+        except struct.error:
+            raise ValueError('message is too short')
+
+        if version != Message.version:
+            raise ValueError(
+                'unsupported message version: {version}'.format(
+                    version=version,
+                )
+            )
+
+        offset = Message.header_struct.size
+
+        if flags & Message.flag_names:
+            try:
+                hostname_length, worker_name_length = Message.names_struct.unpack_from(
+                    message_view,
+                    offset,
+                )
+            except struct.error:
+                raise ValueError('message is too short')
+
+            offset += Message.names_struct.size
+            names_end = offset + hostname_length + worker_name_length
+            if names_end > len(message_view):
+                raise ValueError('message is too short')
+
+            hostname = str(message_view[offset:offset + hostname_length], 'utf-8')
+            worker_name = str(message_view[offset + hostname_length:names_end], 'utf-8')
+            offset = names_end
+
+            if registrations is not None and source_id != 0:
+                registrations.pop(source_id, None)
+                registrations[source_id] = (
+                    hostname,
+                    worker_name,
+                )
+
+                if len(registrations) > Message.max_registrations:
+                    del registrations[next(iter(registrations))]
+        else:
+            if registrations is None:
+                raise UnregisteredSourceError(source_id)
 
-        hostname = unserialized_message[0]
-        worker_name = unserialized_message[1]
-        message_type = unserialized_message[2]
-        message_value = unserialized_message[3]
+            try:
+                hostname, worker_name = registrations.pop(source_id)
+            except KeyError:
+                raise UnregisteredSourceError(source_id)
 
-        message = {
+            registrations[source_id] = (
+                hostname,
+                worker_name,
+            )
+
+        histograms = {}
+        if flags & Message.flag_histograms:
+            try:
+                number_of_buckets, = Message.histograms_struct.unpack_from(
+                    message_view,
+                    offset,
+                )
+            except struct.error:
+                raise ValueError('message is too short')
+
+            offset += Message.histograms_struct.size
+            histograms_end = offset + number_of_buckets * Message.histogram_bucket_struct.size
+            if histograms_end > len(message_view):
+                raise ValueError('message histograms are truncated')
+
+            try:
+                for latency_id, bucket_index, bucket_count in Message.histogram_bucket_struct.iter_unpack(
+                    message_view[offset:histograms_end],
+                ):
+                    latency_name = Message.latency_names[latency_id]
+                    if latency_name not in histograms:
+                        histograms[latency_name] = {}
+
+                    histograms[latency_name][bucket_index] = bucket_count
+            except IndexError:
+                raise ValueError('unknown latency id')
+
+            offset = histograms_end
+
+        metrics_view = message_view[offset:]
+        if len(metrics_view) % Message.metric_struct.size != 0:
+            raise ValueError('message metrics are truncated')
+
+        metrics = {}
+        try:
+            for metric_id, metric_value in Message.metric_struct.iter_unpack(metrics_view):
+                metric_name = Message.metric_names[metric_id]
+                metrics[metric_name] = metrics.get(metric_name, 0) + metric_value
+        except IndexError:
+            raise ValueError('unknown metric id')
+
+        return {
+            'source_id': source_id,
+            'registration': bool(flags & Message.flag_names),
             'hostname': hostname,
             'worker_name': worker_name,
-            'type': message_type,
-            'value': message_value,
+            'metrics': metrics,
+            'histograms': histograms,
         }
 
-        return message
+
+class UnregisteredSourceError(
+    ValueError,
+):
+    def __init__(
+        self,
+        source_id,
+    ):
+        super().__init__(
+            'unregistered message source: {source_id}'.format(
+                source_id=source_id,
+            )
+        )
+
+        self.source_id = source_id
@@ -33,8 +33,7 @@ taskerDashboard.controller(
     [
         "$scope",
         "$location",
-        "$interval",
-        function dashboardController($scope, $location, $interval) {
+        function dashboardController($scope, $location) {
             var domain = location.hostname + (location.port ? ":" + location.port: "");
             var websocket = new WebSocket("ws://" + domain + "/ws/statistics");
 
@@ -54,6 +53,9 @@ taskerDashboard.controller(
             $scope.statistics = {};
             $scope.workers = [];
             $scope.queues = {};
+            $scope.streams = {};
+            $scope.latencies = {};
+            $scope.compression = {};
 
             $scope.workersTableSortBy = "hostname";
             $scope.workersTableSortByReverse = true;
@@ -63,20 +65,23 @@ taskerDashboard.controller(
             };
             websocket.onopen = function(event) {
                 $scope.websocketConnected = true;
-                websocket.send("metrics");
-                websocket.send("queues");
-                websocket.send("workers");
+                websocket.send("subscribe");
             };
-            websocket.onmessage = function(event) {
-                var message = JSON.parse(event.data);
 
-                if (message.type === "metrics") {
-                    $scope.metrics = message.data.metrics;
-                    $scope.rates = message.data.rates;
-                } else if (message.type === "queues") {
-                    $scope.queues = message.data;
-                } else if (message.type === "workers") {
-                    $scope.workers = message.data;
+            var handleSection = function(sectionName, sectionData) {
+                if (sectionName === "metrics") {
+                    $scope.metrics = sectionData.metrics;
+                    $scope.rates = sectionData.rates;
+                } else if (sectionName === "queues") {
+                    $scope.queues = sectionData;
+                } else if (sectionName === "streams") {
+                    $scope.streams = sectionData;
+                } else if (sectionName === "latencies") {
+                    $scope.latencies = sectionData;
+                } else if (sectionName === "compression") {
+                    $scope.compression = sectionData;
+                } else if (sectionName === "workers") {
+                    $scope.workers = sectionData;
 
                     var statistics = {};
 
@@ -102,19 +107,21 @@ taskerDashboard.controller(
                 }
             };
 
-            $interval(
-                function() {
-                    websocket.send("metrics");
-                },
-                1000
-            );
-            $interval(
-                function() {
-                    websocket.send("queues");
-                    websocket.send("workers");
-                },
-                2000
-            );
+            websocket.onmessage = function(event) {
+                var message = JSON.parse(event.data);
+
+                $scope.$apply(
+                    function() {
+                        if (message.type === "snapshot") {
+                            for (var sectionName in message.data) {
+                                handleSection(sectionName, message.data[sectionName]);
+                            }
+                        } else {
+                            handleSection(message.type, message.data);
+                        }
+                    }
+                );
+            };
         }
     ]
 );
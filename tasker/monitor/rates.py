@@ -0,0 +1,162 @@
+class RollingWindow:
+    max_number_of_buckets = 60
+
+    def __init__(
+        self,
+        duration,
+    ):
+        self.duration = duration
+        self.bucket_duration = max(1, duration // self.max_number_of_buckets)
+        self.number_of_buckets = max(1, duration // self.bucket_duration)
+
+        self.buckets = [0] * self.number_of_buckets
+        self.bucket_index = 0
+        self.ticks_in_bucket = 0
+        self.window_sum = 0
+        self.number_of_ticks = 0
+
+    def add(
+        self,
+        value,
+    ):
+        if self.ticks_in_bucket == self.bucket_duration:
+            self.bucket_index = (self.bucket_index + 1) % self.number_of_buckets
+            self.window_sum -= self.buckets[self.bucket_index]
+            self.buckets[self.bucket_index] = 0
+            self.ticks_in_bucket = 0
+
+        self.buckets[self.bucket_index] += value
+        self.window_sum += value
+        self.ticks_in_bucket += 1
+        self.number_of_ticks += 1
+
+    def get_covered_ticks(
+        self,
+    ):
+        return min(
+            self.number_of_ticks,
+            (self.number_of_buckets - 1) * self.bucket_duration + self.ticks_in_bucket,
+        )
+
+
+class RollingRate:
+    def __init__(
+        self,
+        windows,
+    ):
+        self.windows = {
+            window_name: RollingWindow(
+                duration=window_duration,
+            )
+            for window_name, window_duration in windows.items()
+        }
+
+        self.last_total = None
+        self.pending_total = None
+        self.last_update_tick = 0
+
+    def tick(
+        self,
+    ):
+        if self.pending_total is None or self.last_total is None:
+            delta = 0
+        else:
+            delta = self.pending_total - self.last_total
+
+        if self.pending_total is not None:
+            self.last_total = self.pending_total
+
+        for rolling_window in self.windows.values():
+            rolling_window.add(
+                value=delta,
+            )
+
+    def get_rates(
+        self,
+        tick_duration,
+    ):
+        rates = {}
+        for window_name, rolling_window in self.windows.items():
+            covered_ticks = rolling_window.get_covered_ticks()
+            if covered_ticks == 0:
+                rates[window_name] = 0.0
+            else:
+                rates[window_name] = rolling_window.window_sum / (covered_ticks * tick_duration)
+
+        return rates
+
+
+class RatesStore:
+    default_windows = {
+        '1s': 1,
+        '1m': 60,
+        '5m': 300,
+        '1h': 3600,
+    }
+
+    def __init__(
+        self,
+        windows=None,
+        tick_duration=1.0,
+        expiration_ticks=None,
+    ):
+        if windows is None:
+            windows = self.default_windows
+
+        self.windows = windows
+        self.tick_duration = tick_duration
+
+        if expiration_ticks is None:
+            expiration_ticks = max(windows.values())
+        self.expiration_ticks = expiration_ticks
+
+        self.series = {}
+        self.number_of_ticks = 0
+
+    def update(
+        self,
+        series_key,
+        total,
+    ):
+        rolling_rate = self.series.get(series_key)
+        if rolling_rate is None:
+            rolling_rate = RollingRate(
+                windows=self.windows,
+            )
+            rolling_rate.last_total = total
+            self.series[series_key] = rolling_rate
+
+        rolling_rate.pending_total = total
+        rolling_rate.last_update_tick = self.number_of_ticks
+
+    def tick(
+        self,
+    ):
+        self.number_of_ticks += 1
+
+        expired_series_keys = []
+        for series_key, rolling_rate in self.series.items():
+            if self.number_of_ticks - rolling_rate.last_update_tick > self.expiration_ticks:
+                expired_series_keys.append(series_key)
+
+                continue
+
+            rolling_rate.tick()
+
+        for series_key in expired_series_keys:
+            del self.series[series_key]
+
+    def get_rates(
+        self,
+        series_key,
+    ):
+        rolling_rate = self.series.get(series_key)
+        if rolling_rate is None:
+            return {
+                window_name: 0.0
+                for window_name in self.windows
+            }
+
+        return rolling_rate.get_rates(
+            tick_duration=self.tick_duration,
+        )
@@ -1,14 +1,18 @@
 import os
 import asyncio
 import functools
-import aioredis
+import json
 import aiohttp
 import aiohttp.web
 import uvloop
 import argparse
 
+from .. import logger
+from . import collector
+from . import exposition
 from . import statistics
 from . import message
+from . import rates
 
 
 class StatisticsUDPServer:
@@ -17,6 +21,11 @@ class StatisticsUDPServer:
         statistics_obj,
     ):
         self.statistics_obj = statistics_obj
+        self.registrations = {}
+
+        self.logger = logger.logger.Logger(
+            logger_name='statistics_udp_server',
+        )
 
     def connection_made(
         self,
@@ -34,13 +43,94 @@ class StatisticsUDPServer:
         try:
             message_obj = message.Message.unserialize(
                 message=message_data,
+                registrations=self.registrations,
             )
 
             self.statistics_obj.process_report(
                 message=message_obj,
             )
+        except message.UnregisteredSourceError as exception:
+            self.transport.sendto(
+                message.Message.serialize_reply(
+                    source_id=exception.source_id,
+                    flags=message.Message.flag_nack,
+                ),
+                addr,
+            )
+
+            return
         except ValueError as exception:
-            print(str(exception))
+            self.logger.warning(
+                msg=str(exception),
+            )
+
+            return
+
+        if message_obj['registration']:
+            self.transport.sendto(
+                message.Message.serialize_reply(
+                    source_id=message_obj['source_id'],
+                    flags=message.Message.flag_ack,
+                ),
+                addr,
+            )
+
+
+class StatisticsSubscriber:
+    def __init__(
+        self,
+        websocket_obj,
+    ):
+        self.websocket_obj = websocket_obj
+
+        self.pending_sections = {}
+        self.sections_available = asyncio.Event()
+        self.sender_task = None
+
+    def publish(
+        self,
+        sections,
+    ):
+        self.pending_sections.update(sections)
+        self.sections_available.set()
+
+    def start(
+        self,
+    ):
+        self.sender_task = asyncio.ensure_future(self.send_snapshots())
+
+    def stop(
+        self,
+    ):
+        if self.sender_task is not None:
+            self.sender_task.cancel()
+
+    async def send_snapshots(
+        self,
+    ):
+        while not self.websocket_obj.closed:
+            await self.sections_available.wait()
+
+            self.sections_available.clear()
+            pending_sections = self.pending_sections
+            self.pending_sections = {}
+
+            snapshot_data = ', '.join(
+                '"{section_name}": {section}'.format(
+                    section_name=section_name,
+                    section=section,
+                )
+                for section_name, section in pending_sections.items()
+            )
+
+            try:
+                await self.websocket_obj.send_str(
+                    data='{{"type": "snapshot", "data": {{{snapshot_data}}}}}'.format(
+                        snapshot_data=snapshot_data,
+                    ),
+                )
+            except ConnectionError:
+                break
 
 
 class StatisticsWebServer:
@@ -59,16 +149,20 @@ class StatisticsWebServer:
             'retry_per_second': 0,
             'failure_per_second': 0,
         }
-        self.statistics_metrics = [
-            {
-                'process': 0,
-                'success': 0,
-                'retry': 0,
-                'failure': 0,
-            }
-        ] * 5
+        self.rates_store = rates.RatesStore()
 
         self.redis_servers = redis_servers
+        self.queue_depth_collector = collector.QueueDepthCollector(
+            redis_servers=self.redis_servers,
+        )
+
+        self.metrics_exposition = exposition.MetricsExposition(
+            statistics_obj=self.statistics_obj,
+        )
+
+        self.subscribers = set()
+        self.serialized_sections = {}
+        self.update_snapshot()
 
         self.event_loop = event_loop
         self.app = aiohttp.web.Application(
@@ -80,6 +174,11 @@ class StatisticsWebServer:
             path='/ws/statistics',
             handler=self.handle_get_ws_statistics,
         )
+        self.app.router.add_route(
+            method='GET',
+            path='/metrics',
+            handler=self.handle_get_metrics,
+        )
         self.app.router.add_route(
             method='GET',
             path='/',
@@ -106,6 +205,22 @@ class StatisticsWebServer:
 
         self.webserver_future = self.event_loop.run_until_complete(self.server)
         self.event_loop.create_task(self.update_rates())
+        self.event_loop.create_task(
+            self.queue_depth_collector.collect_forever(
+                on_collect=self.update_queue_depths,
+            )
+        )
+
+    def update_queue_depths(
+        self,
+        queues,
+    ):
+        self.metrics_exposition.update_queue_depths(
+            queues=queues,
+        )
+        self.metrics_exposition.update_streams(
+            streams=self.queue_depth_collector.streams,
+        )
 
     async def update_rates(
         self,
@@ -116,43 +231,142 @@ class StatisticsWebServer:
                 loop=self.event_loop,
             )
 
-            self.statistics_metrics = self.statistics_metrics[1:]
-            self.statistics_metrics.append(
-                {
-                    'process': self.statistics_obj.metrics['process'],
-                    'success': self.statistics_obj.metrics['success'],
-                    'retry': self.statistics_obj.metrics['retry'],
-                    'failure': self.statistics_obj.metrics['failure'],
-                }
+            self.update_rates_store()
+
+            self.metrics_exposition.update_rates(
+                rates=self.statistics_rates,
             )
+            self.metrics_exposition.refresh()
 
-            metrics_differences_sums = {
-                'process': [],
-                'success': [],
-                'retry': [],
-                'failure': [],
-            }
-            for metric_name in metrics_differences_sums:
-                for metrics in self.statistics_metrics:
-                    for metric_name, metric_value in metrics.items():
-                        metrics_differences_sums[metric_name].append(metric_value)
-
-            for metric_name, matric_values in metrics_differences_sums.items():
-                metrics_differences = [
-                    j - i
-                    for i, j in zip(
-                        matric_values[:-1],
-                        matric_values[1:],
+            self.publish_snapshot()
+
+    def update_rates_store(
+        self,
+    ):
+        for metric_name, metric_value in self.statistics_obj.metrics.items():
+            self.rates_store.update(
+                series_key=('global', metric_name),
+                total=metric_value,
+            )
+
+        for hostname, workers in self.statistics_obj.workers.items():
+            for worker_name, worker_metrics in workers.items():
+                for metric_name, metric_value in worker_metrics.items():
+                    self.rates_store.update(
+                        series_key=('worker', hostname, worker_name, metric_name),
+                        total=metric_value,
                     )
-                ]
-                metrics_differences_sums[metric_name] = sum(metrics_differences)
 
-            self.statistics_rates = {
-                'process_per_second': metrics_differences_sums['process'] / 5,
-                'success_per_second': metrics_differences_sums['success'] / 5,
-                'retry_per_second': metrics_differences_sums['retry'] / 5,
-                'failure_per_second': metrics_differences_sums['failure'] / 5,
-            }
+        for queue_name, queue_length in self.queue_depth_collector.queues.items():
+            self.rates_store.update(
+                series_key=('queue', queue_name),
+                total=queue_length,
+            )
+
+        self.rates_store.tick()
+
+        for metric_name in [
+            'process',
+            'success',
+            'retry',
+            'failure',
+        ]:
+            rate_name = '{metric_name}_per_second'.format(
+                metric_name=metric_name,
+            )
+            self.statistics_rates[rate_name] = self.rates_store.get_rates(
+                series_key=('global', metric_name),
+            )['1m']
+
+    def get_rates(
+        self,
+    ):
+        global_rates = {}
+        workers_rates = []
+        queues_rates = {}
+
+        for series_key in self.rates_store.series:
+            series_rates = self.rates_store.get_rates(
+                series_key=series_key,
+            )
+
+            if series_key[0] == 'global':
+                global_rates[series_key[1]] = series_rates
+            elif series_key[0] == 'worker':
+                workers_rates.append(
+                    {
+                        'hostname': series_key[1],
+                        'name': series_key[2],
+                        'type': series_key[3],
+                        'rates': series_rates,
+                    }
+                )
+            elif series_key[0] == 'queue':
+                queues_rates[series_key[1]] = series_rates
+
+        return {
+            'global': global_rates,
+            'workers': workers_rates,
+            'queues': queues_rates,
+        }
+
+    def get_workers_list(
+        self,
+    ):
+        workers_dict = self.statistics_obj.workers
+        workers_list = []
+
+        for hostname in workers_dict:
+            for worker_name in workers_dict[hostname]:
+                worker_metrics = workers_dict[hostname][worker_name]
+
+                workers_list.append(
+                    {
+                        'hostname': hostname,
+                        'name': worker_name,
+                        'metrics': worker_metrics,
+                    }
+                )
+
+        return workers_list
+
+    def update_snapshot(
+        self,
+    ):
+        sections = {
+            'metrics': {
+                'metrics': self.statistics_obj.metrics,
+                'rates': self.statistics_rates,
+            },
+            'queues': self.queue_depth_collector.queues,
+            'streams': self.queue_depth_collector.streams,
+            'workers': self.get_workers_list(),
+            'latencies': self.statistics_obj.get_latencies_summary(),
+            'compression': self.statistics_obj.get_compression_summary(),
+            'rates': self.get_rates(),
+        }
+
+        changed_sections = {}
+        for section_name, section_data in sections.items():
+            serialized_section = json.dumps(section_data)
+
+            if self.serialized_sections.get(section_name) != serialized_section:
+                self.serialized_sections[section_name] = serialized_section
+                changed_sections[section_name] = serialized_section
+
+        return changed_sections
+
+    def publish_snapshot(
+        self,
+    ):
+        changed_sections = self.update_snapshot()
+        if not changed_sections:
+            return
+
+        for subscriber in self.subscribers:
+            subscriber.publish(
+                sections=changed_sections,
+            )
 
     async def handle_get_ws_statistics(
         self,
@@ -162,89 +376,51 @@ class StatisticsWebServer:
 
         await websocket_obj.prepare(request)
 
-        async for message in websocket_obj:
-            if message.type == aiohttp.WSMsgType.TEXT:
-                if message.data == 'metrics':
-                    await websocket_obj.send_json(
-                        data={
-                            'type': 'metrics',
-                            'data': {
-                                'metrics': self.statistics_obj.metrics,
-                                'rates': self.statistics_rates,
-                            },
-                        },
-                    )
-                elif message.data == 'queues':
-                    queues = {}
-                    redis_connections = []
-
-                    for redis_server in self.redis_servers:
-                        redis_connection = await aioredis.create_redis(
-                            address=(
-                                redis_server['host'],
-                                redis_server['port'],
-                            ),
-                            password=redis_server['password'],
-                            db=redis_server['database'],
-                            loop=self.event_loop,
-                        )
-                        redis_connections.append(redis_connection)
-
-                    for redis_connection in redis_connections:
-                        redis_keys = await redis_connection.keys('*')
-                        for key_name in redis_keys:
-                            key_name = key_name.decode('utf-8')
-
-                            if key_name.endswith('_lock'):
-                                continue
-                            elif key_name.endswith('.results'):
-                                key_len = await redis_connection.scard(key_name)
-                            else:
-                                key_len = await redis_connection.llen(key_name)
-
-                            current_key_len = queues.get(
-                                key_name,
-                                0,
-                            )
-                            current_key_len += key_len
-                            queues[key_name] = current_key_len
-
-                    await websocket_obj.send_json(
-                        data={
-                            'type': 'queues',
-                            'data': queues,
-                        },
-                    )
+        subscriber = None
 
-                    for redis_connection in redis_connections:
-                        redis_connection.close()
-                elif message.data == 'workers':
-                    workers_dict = self.statistics_obj.workers
-                    workers_list = []
-
-                    for hostname in workers_dict:
-                        for worker_name in workers_dict[hostname]:
-                            worker_metrics = workers_dict[hostname][worker_name]
-
-                            workers_list.append(
-                                {
-                                    'hostname': hostname,
-                                    'name': worker_name,
-                                    'metrics': worker_metrics,
-                                }
-                            )
-
-                    await websocket_obj.send_json(
-                        data={
-                            'type': 'workers',
-                            'data': workers_list,
-                        },
+        try:
+            async for message in websocket_obj:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    continue
+
+                if message.data == 'subscribe':
+                    if subscriber is None:
+                        subscriber = StatisticsSubscriber(
+                            websocket_obj=websocket_obj,
+                        )
+                        subscriber.publish(
+                            sections=self.serialized_sections,
+                        )
+                        subscriber.start()
+
+                        self.subscribers.add(subscriber)
+                elif message.data in self.serialized_sections:
+                    await websocket_obj.send_str(
+                        data='{{"type": "{section_name}", "data": {section}}}'.format(
+                            section_name=message.data,
+                            section=self.serialized_sections[message.data],
+                        ),
                     )
+        finally:
+            if subscriber is not None:
+                self.subscribers.discard(subscriber)
+                subscriber.stop()
 
         await websocket_obj.close()
 
         return websocket_obj
 
+    async def handle_get_metrics(
+        self,
+        request,
+    ):
+        return aiohttp.web.Response(
+            body=self.metrics_exposition.snapshot,
+            headers={
+                'Content-Type': self.metrics_exposition.content_type,
+            },
+        )
+
     async def handle_get_root(
         self,
         request,
@@ -292,6 +468,7 @@ class StatisticsServer:
         self,
     ):
         self.web_server_future.close()
+        self.statistics_web_server.queue_depth_collector.close()
 
 
 def main():
@@ -1,4 +1,10 @@
+from . import histogram
+from . import message
+
+
 class Statistics:
+    compression_metric_names = message.Message.compression_metric_names
+
     def __init__(
         self,
     ):
@@ -11,6 +17,11 @@ class Statistics:
         }
 
         self.workers = {}
+        self.latencies = {}
+        self.compression = {}
+
+        self.updated_workers = set()
+        self.updated_latencies = set()
 
     def process_report(
         self,
@@ -22,15 +33,20 @@ class Statistics:
         self.process_report_worker_statistics(
             message=message,
         )
+        self.process_report_latencies(
+            message=message,
+        )
+        self.process_report_compression(
+            message=message,
+        )
 
     def process_report_metrics(
         self,
         message,
     ):
-        report_type = message['type']
-        report_value = message['value']
-
-        self.metrics[report_type] += report_value
+        for report_type, report_value in message['metrics'].items():
+            if report_type in self.metrics:
+                self.metrics[report_type] += report_value
 
     def process_report_worker_statistics(
         self,
@@ -38,8 +54,6 @@ class Statistics:
     ):
         report_hostname = message['hostname']
         report_worker_name = message['worker_name']
-        report_type = message['type']
-        report_value = message['value']
 
         if report_hostname not in self.workers:
             self.workers[report_hostname] = {
@@ -60,4 +74,104 @@ class Statistics:
                 'heartbeat': 0,
             }
 
-        self.workers[report_hostname][report_worker_name][report_type] += report_value
+        worker_metrics = self.workers[report_hostname][report_worker_name]
+        for report_type, report_value in message['metrics'].items():
+            if report_type in worker_metrics:
+                worker_metrics[report_type] += report_value
+
+        self.updated_workers.add(
+            (
+                report_hostname,
+                report_worker_name,
+            )
+        )
+
+    def process_report_latencies(
+        self,
+        message,
+    ):
+        histograms = message.get('histograms')
+        if not histograms:
+            return
+
+        report_worker_name = message['worker_name']
+        if report_worker_name not in self.latencies:
+            self.latencies[report_worker_name] = {}
+
+        worker_latencies = self.latencies[report_worker_name]
+        for latency_type, bucket_counts in histograms.items():
+            if latency_type not in worker_latencies:
+                worker_latencies[latency_type] = histogram.Histogram()
+
+            worker_latencies[latency_type].merge_bucket_counts(
+                bucket_counts=bucket_counts,
+            )
+
+        self.updated_latencies.add(report_worker_name)
+
+    def process_report_compression(
+        self,
+        message,
+    ):
+        report_worker_name = message['worker_name']
+        worker_compression = None
+
+        for report_type in self.compression_metric_names:
+            report_value = message['metrics'].get(report_type)
+            if not report_value:
+                continue
+
+            if worker_compression is None:
+                worker_compression = self.compression.setdefault(
+                    report_worker_name,
+                    {
+                        compression_metric_name: 0
+                        for compression_metric_name in self.compression_metric_names
+                    },
+                )
+
+            worker_compression[report_type] += report_value
+
+    def get_compression_summary(
+        self,
+    ):
+        compression_summary = {}
+
+        for worker_name, worker_compression in self.compression.items():
+            if worker_compression['uncompressed_bytes']:
+                compression_ratio = worker_compression['compressed_bytes'] / worker_compression['uncompressed_bytes']
+            else:
+                compression_ratio = 1.0
+
+            compression_summary[worker_name] = {
+                'compressed_payloads': worker_compression['compressed_payloads'],
+                'raw_payloads': worker_compression['raw_payloads'],
+                'uncompressed_bytes': worker_compression['uncompressed_bytes'],
+                'compressed_bytes': worker_compression['compressed_bytes'],
+                'compression_ratio': compression_ratio,
+                'compression_time': worker_compression['compression_time_us'] / 1000000,
+            }
+
+        return compression_summary
+
+    def get_latencies_summary(
+        self,
+    ):
+        return {
+            worker_name: {
+                latency_type: latency_histogram.get_summary()
+                for latency_type, latency_histogram in worker_latencies.items()
+            }
+            for worker_name, worker_latencies in self.latencies.items()
+        }
+
+    def take_updates(
+        self,
+    ):
+        updated_workers = self.updated_workers
+        updated_latencies = self.updated_latencies
+
+        self.updated_workers = set()
+        self.updated_latencies = set()
+
+        return updated_workers, updated_latencies
@@ -3,6 +3,7 @@ import time
 import unittest
 import requests
 import asyncio
+import socket
 
 from .. import client
 from .. import server
@@ -115,3 +116,265 @@ from .. import message
 #                     message_type=message_type.name,
 #                 ),
 #             )
+
+
+class StatisticsClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server_socket = socket.socket(
+            family=socket.AF_INET,
+            type=socket.SOCK_DGRAM,
+        )
+        self.server_socket.bind(('127.0.0.1', 0))
+        self.server_socket.settimeout(1.0)
+
+        self.client = client.StatisticsClient(
+            stats_server={
+                'host': '127.0.0.1',
+                'port': self.server_socket.getsockname()[1],
+            },
+            host_name='host_1',
+            worker_name='worker_1',
+            flush_interval=60.0,
+            flush_size=3,
+        )
+
+    def tearDown(self):
+        self.server_socket.close()
+
+    def receive_message(self):
+        data = self.server_socket.recv(65535)
+
+        return message.Message.unserialize(
+            message=data,
+        )
+
+    def test_flush_on_size(self):
+        self.client.increment_success()
+        self.client.increment_success()
+        self.client.increment_process(
+            value=2,
+        )
+
+        received_message = self.receive_message()
+        self.assertEqual(received_message['hostname'], 'host_1')
+        self.assertEqual(received_message['worker_name'], 'worker_1')
+        self.assertEqual(
+            received_message['metrics'],
+            {
+                'success': 2,
+                'process': 2,
+            },
+        )
+
+    def test_flush(self):
+        self.client.increment_failure()
+        self.client.flush()
+
+        received_message = self.receive_message()
+        self.assertEqual(
+            received_message['metrics'],
+            {
+                'failure': 1,
+            },
+        )
+
+        self.client.flush()
+        self.server_socket.settimeout(0.2)
+        with self.assertRaises(socket.timeout):
+            self.server_socket.recv(65535)
+
+    def send_reply(self, client_address, flags):
+        self.server_socket.sendto(
+            message.Message.serialize_reply(
+                source_id=self.client.source_id,
+                flags=flags,
+            ),
+            client_address,
+        )
+        time.sleep(0.05)
+
+    def test_registration(self):
+        registrations = {}
+
+        self.client.increment_success()
+        self.client.flush()
+        first_message_data, client_address = self.server_socket.recvfrom(65535)
+        first_message = message.Message.unserialize(
+            message=first_message_data,
+            registrations=registrations,
+        )
+        self.assertTrue(first_message['registration'])
+        self.assertEqual(first_message['metrics'], {'success': 1})
+        self.assertEqual(
+            registrations,
+            {
+                self.client.source_id: ('host_1', 'worker_1'),
+            },
+        )
+
+        self.client.increment_failure()
+        self.client.flush()
+        unacked_message = message.Message.unserialize(
+            message=self.server_socket.recv(65535),
+        )
+        self.assertTrue(unacked_message['registration'])
+        self.assertEqual(unacked_message['metrics'], {'failure': 1})
+
+        self.send_reply(
+            client_address=client_address,
+            flags=message.Message.flag_ack,
+        )
+
+        self.client.increment_retry()
+        self.client.flush()
+        second_message_data = self.server_socket.recv(65535)
+        with self.assertRaises(ValueError):
+            message.Message.unserialize(
+                message=second_message_data,
+            )
+
+        second_message = message.Message.unserialize(
+            message=second_message_data,
+            registrations=registrations,
+        )
+        self.assertEqual(second_message['hostname'], 'host_1')
+        self.assertEqual(second_message['worker_name'], 'worker_1')
+        self.assertEqual(second_message['metrics'], {'retry': 1})
+        self.assertFalse(second_message['registration'])
+
+        self.send_reply(
+            client_address=client_address,
+            flags=message.Message.flag_nack,
+        )
+
+        self.client.increment_retry()
+        self.client.flush()
+        third_message = message.Message.unserialize(
+            message=self.server_socket.recv(65535),
+        )
+        self.assertTrue(third_message['registration'])
+        self.assertEqual(third_message['metrics'], {'retry': 1})
+
+    def test_statistics_process_deltas(self):
+        statistics_obj = statistics.Statistics()
+        statistics_obj.process_report(
+            message={
+                'hostname': 'host_1',
+                'worker_name': 'worker_1',
+                'metrics': {
+                    'success': 5,
+                    'process': 6,
+                },
+            },
+        )
+        self.assertEqual(statistics_obj.metrics['success'], 5)
+        self.assertEqual(statistics_obj.metrics['process'], 6)
+        self.assertEqual(statistics_obj.workers['host_1']['worker_1']['success'], 5)
+
+    def test_latencies(self):
+        self.client.record_latency(
+            latency_type='work',
+            value=0.01,
+            count=4,
+        )
+        self.client.flush()
+
+        received_message = self.receive_message()
+        self.assertEqual(received_message['metrics'], {})
+        self.assertEqual(sum(received_message['histograms']['work'].values()), 4)
+
+        statistics_obj = statistics.Statistics()
+        statistics_obj.process_report(
+            message=received_message,
+        )
+        statistics_obj.process_report(
+            message=received_message,
+        )
+
+        latencies_summary = statistics_obj.get_latencies_summary()
+        self.assertEqual(latencies_summary['worker_1']['work']['count'], 8)
+        self.assertAlmostEqual(latencies_summary['worker_1']['work']['p99'], 0.01, delta=0.01 * 0.07)
+
+    def test_latencies_from_threads(self):
+        def record_latencies():
+            for i in range(100):
+                self.client.record_latency(
+                    latency_type='queue_wait',
+                    value=0.002,
+                )
+
+        recording_threads = [
+            threading.Thread(
+                target=record_latencies,
+            )
+            for i in range(4)
+        ]
+        for recording_thread in recording_threads:
+            recording_thread.start()
+        for recording_thread in recording_threads:
+            recording_thread.join()
+
+        self.client.flush()
+        received_message = self.receive_message()
+        self.assertEqual(sum(received_message['histograms']['queue_wait'].values()), 400)
+
+        self.client.flush()
+        self.server_socket.settimeout(0.2)
+        with self.assertRaises(socket.timeout):
+            self.server_socket.recv(65535)
+
+        self.client.record_latency(
+            latency_type='queue_wait',
+            value=0.002,
+            count=3,
+        )
+        self.client.flush()
+        self.server_socket.settimeout(1.0)
+        received_message = self.receive_message()
+        self.assertEqual(sum(received_message['histograms']['queue_wait'].values()), 3)
+
+    def test_counters_source(self):
+        counters = {
+            'compressed_payloads': 2,
+            'compressed_bytes': 100,
+            'uncompressed_bytes': 400,
+        }
+        self.client.add_counters_source(
+            counters_function=lambda: counters,
+        )
+
+        self.client.increment_success()
+        self.client.flush()
+        received_message = self.receive_message()
+        self.assertEqual(
+            received_message['metrics'],
+            {
+                'success': 1,
+                'compressed_payloads': 2,
+                'compressed_bytes': 100,
+                'uncompressed_bytes': 400,
+            },
+        )
+
+        counters['compressed_payloads'] = 3
+        counters['compressed_bytes'] = 150
+        self.client.flush()
+        received_message = self.receive_message()
+        self.assertEqual(
+            received_message['metrics'],
+            {
+                'compressed_payloads': 1,
+                'compressed_bytes': 50,
+            },
+        )
+
+        statistics_obj = statistics.Statistics()
+        statistics_obj.process_report(
+            message=received_message,
+        )
+        self.assertEqual(statistics_obj.workers['host_1']['worker_1']['success'], 0)
+        self.assertNotIn('compressed_bytes', statistics_obj.workers['host_1']['worker_1'])
+        compression_summary = statistics_obj.get_compression_summary()
+        self.assertEqual(compression_summary['worker_1']['compressed_payloads'], 1)
+        self.assertEqual(compression_summary['worker_1']['compressed_bytes'], 50)
+        self.assertEqual(compression_summary['worker_1']['compression_ratio'], 1.0)
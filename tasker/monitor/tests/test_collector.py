@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+
+import redis
+
+from .. import collector
+
+
+class QueueDepthCollectorTestCase(unittest.TestCase):
+    redis_server = {
+        'host': '127.0.0.1',
+        'port': 6379,
+        'password': 'e082ebf6c7fff3997c4bb1cb64d6bdecd0351fa270402d98d35acceef07c6b97',
+        'database': 0,
+    }
+
+    def setUp(self):
+        self.redis_connection = redis.StrictRedis(
+            host=self.redis_server['host'],
+            port=self.redis_server['port'],
+            password=self.redis_server['password'],
+            db=self.redis_server['database'],
+        )
+        self.key_names = [
+            'collector_queue',
+            'collector_queue.results',
+            'collector_queue.delayed',
+            'collector_queue.delayed.sequence',
+            'collector_queue.consumers',
+            'collector_queue.heartbeat.consumer_1',
+            'collector_queue_lock',
+            'collector_priority_queue',
+            'collector_stream_queue',
+        ]
+        self.redis_connection.delete(*self.key_names)
+
+        self.redis_connection.rpush('collector_queue', 'a', 'b', 'c')
+        self.redis_connection.sadd('collector_queue.results', 'a')
+        self.redis_connection.zadd('collector_queue.delayed', {'1:a': 1, '2:b': 2})
+        self.redis_connection.set('collector_queue.delayed.sequence', 2)
+        self.redis_connection.sadd('collector_queue.consumers', 'consumer_1')
+        self.redis_connection.set('collector_queue.heartbeat.consumer_1', 1)
+        self.redis_connection.set('collector_queue_lock', 1)
+        self.redis_connection.zadd('collector_priority_queue', {'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        self.redis_connection.xadd('collector_stream_queue', {'value': 'a'})
+
+        self.event_loop = asyncio.new_event_loop()
+        self.queue_depth_collector = collector.QueueDepthCollector(
+            redis_servers=[
+                self.redis_server,
+            ],
+            scan_count=10,
+            max_scans_per_collection=100000,
+        )
+
+    def tearDown(self):
+        self.queue_depth_collector.close()
+        self.event_loop.run_until_complete(asyncio.sleep(0.01))
+        self.event_loop.close()
+        self.redis_connection.delete(*self.key_names)
+
+    def collect(self):
+        return self.event_loop.run_until_complete(
+            self.queue_depth_collector.collect(),
+        )
+
+    def test_collect(self):
+        queues = self.collect()
+
+        self.assertEqual(queues['collector_queue'], 3)
+        self.assertEqual(queues['collector_queue.results'], 1)
+        self.assertEqual(queues['collector_queue.delayed'], 2)
+        self.assertEqual(queues['collector_priority_queue'], 4)
+        self.assertEqual(queues['collector_stream_queue'], 1)
+
+        for ignored_key_name in [
+            'collector_queue.delayed.sequence',
+            'collector_queue.consumers',
+            'collector_queue.heartbeat.consumer_1',
+            'collector_queue_lock',
+        ]:
+            self.assertNotIn(ignored_key_name, queues)
+
+        self.assertIs(self.queue_depth_collector.queues, queues)
+
+    def test_key_changes(self):
+        self.collect()
+
+        self.redis_connection.rpush('collector_queue', 'd')
+        self.redis_connection.delete('collector_priority_queue')
+        self.redis_connection.rpush('collector_priority_queue', 'a')
+
+        queues = self.collect()
+        self.assertEqual(queues['collector_queue'], 4)
+        self.assertNotIn('collector_priority_queue', queues)
+
+        queues = self.collect()
+        self.assertEqual(queues['collector_priority_queue'], 1)
+
+    def test_incremental_discovery(self):
+        self.queue_depth_collector.max_scans_per_collection = 1
+        self.queue_depth_collector.scan_count = 1
+
+        for collection_number in range(1000):
+            queues = self.collect()
+            if self.queue_depth_collector.nodes[0].cursor == 0:
+                break
+
+        queues = self.collect()
+        self.assertEqual(queues['collector_queue'], 3)
+        self.assertEqual(queues['collector_priority_queue'], 4)
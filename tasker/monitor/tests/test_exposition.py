@@ -0,0 +1,98 @@
+import unittest
+
+from .. import exposition
+from .. import statistics
+
+
+class MetricsExpositionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.statistics_obj = statistics.Statistics()
+        self.metrics_exposition = exposition.MetricsExposition(
+            statistics_obj=self.statistics_obj,
+        )
+
+    def test_counters(self):
+        self.statistics_obj.process_report(
+            message={
+                'hostname': 'host_1',
+                'worker_name': 'worker_"1"',
+                'metrics': {
+                    'success': 5,
+                },
+            },
+        )
+
+        snapshot = self.metrics_exposition.refresh().decode('utf-8')
+        self.assertIn('# TYPE tasker_tasks_total counter\n', snapshot)
+        self.assertIn(
+            'tasker_tasks_total{hostname="host_1",worker="worker_\\"1\\"",type="success"} 5\n',
+            snapshot,
+        )
+        self.assertEqual(self.metrics_exposition.snapshot, snapshot.encode('utf-8'))
+
+    def test_incremental_refresh(self):
+        for hostname in ['host_1', 'host_2']:
+            self.statistics_obj.process_report(
+                message={
+                    'hostname': hostname,
+                    'worker_name': 'worker_1',
+                    'metrics': {
+                        'process': 1,
+                    },
+                },
+            )
+        self.metrics_exposition.refresh()
+
+        rendered_lines = self.metrics_exposition.worker_counters_lines[('host_2', 'worker_1')]
+
+        self.statistics_obj.process_report(
+            message={
+                'hostname': 'host_1',
+                'worker_name': 'worker_1',
+                'metrics': {
+                    'process': 2,
+                },
+            },
+        )
+        snapshot = self.metrics_exposition.refresh().decode('utf-8')
+
+        self.assertIs(self.metrics_exposition.worker_counters_lines[('host_2', 'worker_1')], rendered_lines)
+        self.assertIn('tasker_tasks_total{hostname="host_1",worker="worker_1",type="process"} 3\n', snapshot)
+        self.assertIn('tasker_tasks_total{hostname="host_2",worker="worker_1",type="process"} 1\n', snapshot)
+
+    def test_rates_and_queue_depths(self):
+        self.metrics_exposition.update_rates(
+            rates={
+                'process_per_second': 2,
+            },
+        )
+        self.metrics_exposition.update_queue_depths(
+            queues={
+                'queue_1': 10,
+            },
+        )
+
+        snapshot = self.metrics_exposition.refresh().decode('utf-8')
+        self.assertIn('tasker_tasks_rate{type="process_per_second"} 2.0\n', snapshot)
+        self.assertIn('tasker_queue_depth{queue="queue_1"} 10\n', snapshot)
+
+    def test_latency_histograms(self):
+        self.statistics_obj.process_report(
+            message={
+                'hostname': 'host_1',
+                'worker_name': 'worker_1',
+                'metrics': {},
+                'histograms': {
+                    'work': {
+                        10: 3,
+                        100: 1,
+                    },
+                },
+            },
+        )
+
+        snapshot = self.metrics_exposition.refresh().decode('utf-8')
+        self.assertIn('# TYPE tasker_task_latency_seconds histogram\n', snapshot)
+        self.assertIn('tasker_task_latency_seconds_bucket{worker="worker_1",type="work",le="1.1e-05"} 3\n', snapshot)
+        self.assertIn('tasker_task_latency_seconds_bucket{worker="worker_1",type="work",le="+Inf"} 4\n', snapshot)
+        self.assertIn('tasker_task_latency_seconds_count{worker="worker_1",type="work"} 4\n', snapshot)
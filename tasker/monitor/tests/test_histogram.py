@@ -0,0 +1,82 @@
+import unittest
+
+from .. import histogram
+
+
+class HistogramTestCase(unittest.TestCase):
+    def test_record(self):
+        histogram_obj = histogram.Histogram()
+
+        for value in range(1, 1001):
+            histogram_obj.record(
+                value=value / 1000,
+            )
+
+        self.assertEqual(histogram_obj.total_count, 1000)
+        self.assertAlmostEqual(histogram_obj.percentile(50), 0.5, delta=0.5 * 0.07)
+        self.assertAlmostEqual(histogram_obj.percentile(95), 0.95, delta=0.95 * 0.07)
+        self.assertAlmostEqual(histogram_obj.percentile(99), 0.99, delta=0.99 * 0.07)
+
+    def test_bucket_bounds(self):
+        for value in [0, 1, 15, 16, 17, 31, 32, 1000, 123456, 10 ** 9]:
+            histogram_obj = histogram.Histogram()
+            histogram_obj.record(
+                value=value / histogram.Histogram.resolution,
+            )
+
+            bucket_index, = histogram_obj.get_bucket_counts().keys()
+            lower_bound, upper_bound = histogram.Histogram.get_bucket_bounds(
+                bucket_index=bucket_index,
+            )
+            self.assertLessEqual(lower_bound * histogram.Histogram.resolution, value)
+            self.assertLess(value, upper_bound * histogram.Histogram.resolution)
+
+    def test_out_of_range_values(self):
+        histogram_obj = histogram.Histogram()
+        histogram_obj.record(
+            value=-1.0,
+        )
+        histogram_obj.record(
+            value=10.0 ** 12,
+        )
+
+        self.assertEqual(
+            histogram_obj.get_bucket_counts(),
+            {
+                0: 1,
+                histogram.Histogram.number_of_buckets - 1: 1,
+            },
+        )
+
+    def test_merge(self):
+        first_histogram = histogram.Histogram()
+        second_histogram = histogram.Histogram()
+
+        first_histogram.record(
+            value=0.001,
+            count=10,
+        )
+        second_histogram.record(
+            value=0.1,
+            count=90,
+        )
+        first_histogram.merge(
+            histogram=second_histogram,
+        )
+
+        self.assertEqual(first_histogram.total_count, 100)
+        self.assertAlmostEqual(first_histogram.percentile(5), 0.001, delta=0.001 * 0.07)
+        self.assertAlmostEqual(first_histogram.percentile(50), 0.1, delta=0.1 * 0.07)
+
+        summary = first_histogram.get_summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertEqual(
+            sorted(summary.keys()),
+            ['count', 'p50', 'p95', 'p99'],
+        )
+
+    def test_empty(self):
+        histogram_obj = histogram.Histogram()
+
+        self.assertEqual(histogram_obj.percentile(99), 0.0)
+        self.assertEqual(histogram_obj.get_bucket_counts(), {})
@@ -0,0 +1,264 @@
+import unittest
+
+from .. import message
+
+
+class MessageTestCase(unittest.TestCase):
+    def test_serialize_unserialize(self):
+        serialized_message = message.Message.serialize(
+            hostname='host_1',
+            worker_name='worker_1',
+            message_type='success',
+            message_value=3,
+        )
+        self.assertIsInstance(serialized_message, bytes)
+
+        unserialized_message = message.Message.unserialize(
+            message=serialized_message,
+        )
+        self.assertEqual(
+            unserialized_message,
+            {
+                'source_id': 0,
+                'registration': True,
+                'hostname': 'host_1',
+                'worker_name': 'worker_1',
+                'metrics': {
+                    'success': 3,
+                },
+                'histograms': {},
+            },
+        )
+
+    def test_serialize_metrics(self):
+        serialized_message = message.Message.serialize_metrics(
+            hostname='hóst',
+            worker_name='worker_1',
+            metrics={
+                'success': 2 ** 40,
+                'failure': 1,
+                'retry': 2,
+                'process': 3,
+                'heartbeat': 4,
+            },
+        )
+
+        unserialized_message = message.Message.unserialize(
+            message=serialized_message,
+        )
+        self.assertEqual(unserialized_message['hostname'], 'hóst')
+        self.assertEqual(
+            unserialized_message['metrics'],
+            {
+                'success': 2 ** 40,
+                'failure': 1,
+                'retry': 2,
+                'process': 3,
+                'heartbeat': 4,
+            },
+        )
+
+    def test_interned_names(self):
+        registrations = {}
+
+        registration_message = message.Message.serialize_metrics(
+            hostname='host_1',
+            worker_name='worker_1',
+            metrics={},
+            source_id=7,
+        )
+        compact_message = message.Message.serialize_metrics(
+            hostname='host_1',
+            worker_name='worker_1',
+            metrics={
+                'process': 10,
+            },
+            source_id=7,
+            include_names=False,
+        )
+        self.assertLess(len(compact_message), len(registration_message) + message.Message.metric_struct.size)
+
+        with self.assertRaises(ValueError):
+            message.Message.unserialize(
+                message=compact_message,
+                registrations=registrations,
+            )
+
+        message.Message.unserialize(
+            message=registration_message,
+            registrations=registrations,
+        )
+        unserialized_message = message.Message.unserialize(
+            message=compact_message,
+            registrations=registrations,
+        )
+        self.assertEqual(unserialized_message['hostname'], 'host_1')
+        self.assertEqual(unserialized_message['worker_name'], 'worker_1')
+        self.assertEqual(unserialized_message['metrics'], {'process': 10})
+
+    def test_registrations_eviction(self):
+        registrations = {}
+        serialized_messages = {}
+        for source_id in range(1, 4):
+            serialized_messages[source_id] = message.Message.serialize_metrics(
+                hostname='host_1',
+                worker_name='worker_{source_id}'.format(
+                    source_id=source_id,
+                ),
+                metrics={
+                    'process': 1,
+                },
+                source_id=source_id,
+                include_names=False,
+            )
+
+        original_max_registrations = message.Message.max_registrations
+        message.Message.max_registrations = 2
+        try:
+            for source_id in range(1, 3):
+                message.Message.unserialize(
+                    message=message.Message.serialize_metrics(
+                        hostname='host_1',
+                        worker_name='worker_{source_id}'.format(
+                            source_id=source_id,
+                        ),
+                        metrics={},
+                        source_id=source_id,
+                    ),
+                    registrations=registrations,
+                )
+
+            message.Message.unserialize(
+                message=serialized_messages[1],
+                registrations=registrations,
+            )
+            message.Message.unserialize(
+                message=message.Message.serialize_metrics(
+                    hostname='host_1',
+                    worker_name='worker_3',
+                    metrics={},
+                    source_id=3,
+                ),
+                registrations=registrations,
+            )
+        finally:
+            message.Message.max_registrations = original_max_registrations
+
+        self.assertEqual(
+            list(registrations),
+            [1, 3],
+        )
+        with self.assertRaises(message.UnregisteredSourceError) as context:
+            message.Message.unserialize(
+                message=serialized_messages[2],
+                registrations=registrations,
+            )
+        self.assertEqual(context.exception.source_id, 2)
+
+        unserialized_message = message.Message.unserialize(
+            message=serialized_messages[1],
+            registrations=registrations,
+        )
+        self.assertEqual(unserialized_message['worker_name'], 'worker_1')
+        self.assertEqual(
+            list(registrations),
+            [3, 1],
+        )
+
+    def test_replies(self):
+        serialized_reply = message.Message.serialize_reply(
+            source_id=7,
+            flags=message.Message.flag_nack,
+        )
+        self.assertEqual(
+            message.Message.unserialize_reply(
+                message=serialized_reply,
+            ),
+            (
+                message.Message.flag_nack,
+                7,
+            ),
+        )
+
+        with self.assertRaises(ValueError):
+            message.Message.unserialize_reply(
+                message=serialized_reply[:-1],
+            )
+
+    def test_histograms(self):
+        serialized_message = message.Message.serialize_metrics(
+            hostname='host_1',
+            worker_name='worker_1',
+            metrics={
+                'process': 5,
+            },
+            histograms={
+                'queue_wait': {
+                    10: 3,
+                    300: 2,
+                },
+                'work': {
+                    0: 5,
+                },
+            },
+        )
+
+        unserialized_message = message.Message.unserialize(
+            message=serialized_message,
+        )
+        self.assertEqual(unserialized_message['metrics'], {'process': 5})
+        self.assertEqual(
+            unserialized_message['histograms'],
+            {
+                'queue_wait': {
+                    10: 3,
+                    300: 2,
+                },
+                'work': {
+                    0: 5,
+                },
+            },
+        )
+
+        with self.assertRaises(ValueError):
+            message.Message.serialize_metrics(
+                hostname='host_1',
+                worker_name='worker_1',
+                metrics={},
+                histograms={
+                    'unknown': {
+                        0: 1,
+                    },
+                },
+            )
+
+    def test_invalid_messages(self):
+        serialized_message = message.Message.serialize(
+            hostname='host_1',
+            worker_name='worker_1',
+            message_type='success',
+            message_value=1,
+        )
+
+        with self.assertRaises(ValueError):
+            message.Message.unserialize(
+                message=serialized_message[:-1],
+            )
+
+        with self.assertRaises(ValueError):
+            message.Message.unserialize(
+                message=b'\x02' + serialized_message[1:],
+            )
+
+        with self.assertRaises(ValueError):
+            message.Message.unserialize(
+                message=b'',
+            )
+
+        with self.assertRaises(ValueError):
+            message.Message.serialize(
+                hostname='host_1',
+                worker_name='worker_1',
+                message_type='unknown',
+                message_value=1,
+            )
@@ -0,0 +1,117 @@
+import unittest
+
+from .. import rates
+
+
+class RatesStoreTestCase(unittest.TestCase):
+    def test_constant_rate(self):
+        rates_store = rates.RatesStore()
+
+        total = 0
+        for tick_number in range(4000):
+            rates_store.update(
+                series_key='series',
+                total=total,
+            )
+            rates_store.tick()
+
+            total += 10
+
+        series_rates = rates_store.get_rates(
+            series_key='series',
+        )
+        for window_name in ['1s', '1m', '5m', '1h']:
+            self.assertAlmostEqual(series_rates[window_name], 10.0)
+
+    def test_windows(self):
+        rates_store = rates.RatesStore()
+
+        total = 0
+        for tick_number in range(600):
+            rates_store.update(
+                series_key='series',
+                total=total,
+            )
+            rates_store.tick()
+
+            if tick_number < 300:
+                total += 5
+
+        series_rates = rates_store.get_rates(
+            series_key='series',
+        )
+        self.assertEqual(series_rates['1s'], 0.0)
+        self.assertEqual(series_rates['1m'], 0.0)
+        self.assertAlmostEqual(series_rates['5m'], 0.0, delta=0.1)
+        self.assertAlmostEqual(series_rates['1h'], 2.5, delta=0.1)
+
+    def test_warm_up(self):
+        rates_store = rates.RatesStore()
+
+        for total in [0, 4, 8]:
+            rates_store.update(
+                series_key='series',
+                total=total,
+            )
+            rates_store.tick()
+
+        series_rates = rates_store.get_rates(
+            series_key='series',
+        )
+        self.assertAlmostEqual(series_rates['1m'], 8 / 3)
+        self.assertAlmostEqual(series_rates['1s'], 4.0)
+
+    def test_gauge_series(self):
+        rates_store = rates.RatesStore()
+
+        for total in [100, 90, 80]:
+            rates_store.update(
+                series_key='queue',
+                total=total,
+            )
+            rates_store.tick()
+
+        self.assertAlmostEqual(
+            rates_store.get_rates(
+                series_key='queue',
+            )['1s'],
+            -10.0,
+        )
+
+    def test_expiration(self):
+        rates_store = rates.RatesStore(
+            windows={
+                '1m': 60,
+            },
+            expiration_ticks=10,
+        )
+
+        rates_store.update(
+            series_key='series',
+            total=1,
+        )
+        for tick_number in range(11):
+            rates_store.tick()
+
+        self.assertNotIn('series', rates_store.series)
+        self.assertEqual(
+            rates_store.get_rates(
+                series_key='series',
+            ),
+            {
+                '1m': 0.0,
+            },
+        )
+
+    def test_bounded_memory(self):
+        rolling_window = rates.RollingWindow(
+            duration=3600,
+        )
+
+        for tick_number in range(10000):
+            rolling_window.add(
+                value=1,
+            )
+
+        self.assertEqual(len(rolling_window.buckets), 60)
+        self.assertEqual(rolling_window.window_sum, rolling_window.get_covered_ticks())
@@ -0,0 +1,96 @@
+import asyncio
+import json
+import unittest
+
+from .. import server
+
+
+class DummyWebSocket:
+    def __init__(self):
+        self.closed = False
+        self.sent_messages = []
+        self.send_allowed = asyncio.Event()
+
+    async def send_str(self, data):
+        await self.send_allowed.wait()
+
+        self.sent_messages.append(json.loads(data))
+
+
+class StatisticsSubscriberTestCase(unittest.TestCase):
+    def setUp(self):
+        self.event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.event_loop)
+
+    def tearDown(self):
+        self.event_loop.close()
+        asyncio.set_event_loop(None)
+
+    def test_coalesce_pending_sections(self):
+        async def run_subscriber():
+            websocket_obj = DummyWebSocket()
+            subscriber = server.StatisticsSubscriber(
+                websocket_obj=websocket_obj,
+            )
+            subscriber.start()
+
+            subscriber.publish(
+                sections={
+                    'metrics': '{"metrics": {"success": 1}}',
+                    'queues': '{}',
+                },
+            )
+            await asyncio.sleep(0.01)
+
+            for success in range(2, 100):
+                subscriber.publish(
+                    sections={
+                        'metrics': '{{"metrics": {{"success": {success}}}}}'.format(
+                            success=success,
+                        ),
+                    },
+                )
+            subscriber.publish(
+                sections={
+                    'queues': '{"queue_1": 5}',
+                },
+            )
+
+            websocket_obj.send_allowed.set()
+            await asyncio.sleep(0.01)
+
+            subscriber.stop()
+
+            return websocket_obj.sent_messages
+
+        sent_messages = self.event_loop.run_until_complete(run_subscriber())
+
+        self.assertEqual(
+            sent_messages,
+            [
+                {
+                    'type': 'snapshot',
+                    'data': {
+                        'metrics': {
+                            'metrics': {
+                                'success': 1,
+                            },
+                        },
+                        'queues': {},
+                    },
+                },
+                {
+                    'type': 'snapshot',
+                    'data': {
+                        'metrics': {
+                            'metrics': {
+                                'success': 99,
+                            },
+                        },
+                        'queues': {
+                            'queue_1': 5,
+                        },
+                    },
+                },
+            ],
+        )
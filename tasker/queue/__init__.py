@@ -1 +1,14 @@
+from . import priority
 from . import regular
+from . import reliable
+from . import stream
+
+from . import _queue
+
+
+__queues__ = {
+    priority.Queue.name: priority.Queue,
+    regular.Queue.name: regular.Queue,
+    reliable.Queue.name: reliable.Queue,
+    stream.Queue.name: stream.Queue,
+}
@@ -1,8 +1,14 @@
+import collections
+import time
+
 from .. import logger
 
 
 class Queue:
     name = 'Queue'
+    delayed_promotion_interval = 1.0
+    delayed_promotion_batch_size = 1000
+    frame_size = 0
 
     def __init__(
         self,
@@ -16,22 +22,146 @@ class Queue:
         self.connector = connector
         self.encoder = encoder
 
+        self.last_delayed_promotions = {}
+        self.last_known_lengths = {}
+        self.last_decode_durations = {}
+        self.frame_buffers = {}
+
+    def last_known_len(
+        self,
+        queue_name,
+    ):
+        return self.last_known_lengths.get(
+            queue_name,
+        )
+
+    def last_decode_duration(
+        self,
+        queue_name,
+    ):
+        return self.last_decode_durations.get(
+            queue_name,
+            0.0,
+        )
+
+    def get_delayed_queue_name(
+        self,
+        queue_name,
+    ):
+        return '{queue_name}.delayed'.format(
+            queue_name=queue_name,
+        )
+
+    def get_frame_counter_name(
+        self,
+        queue_name,
+    ):
+        return '{queue_name}.tasks'.format(
+            queue_name=queue_name,
+        )
+
+    def update_frame_counter(
+        self,
+        queue_name,
+        amount,
+    ):
+        return self.connector.key_increment(
+            key=self.get_frame_counter_name(
+                queue_name=queue_name,
+            ),
+            amount=amount,
+        )
+
+    def promote_delayed(
+        self,
+        queue_name,
+        force=False,
+    ):
+        try:
+            now = time.time()
+            last_delayed_promotion = self.last_delayed_promotions.get(
+                queue_name,
+                0.0,
+            )
+            if not force and now - last_delayed_promotion < self.delayed_promotion_interval:
+                return 0
+
+            self.last_delayed_promotions[queue_name] = now
+
+            total_promoted = 0
+            while True:
+                promoted = self._promote_delayed(
+                    queue_name=queue_name,
+                    now=now,
+                    count=self.delayed_promotion_batch_size,
+                )
+                total_promoted += promoted
+
+                if promoted < self.delayed_promotion_batch_size:
+                    if self.frame_size and total_promoted:
+                        self.update_frame_counter(
+                            queue_name=queue_name,
+                            amount=total_promoted,
+                        )
+
+                    return total_promoted
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
+            raise exception
+
+    def _promote_delayed(
+        self,
+        queue_name,
+        now,
+        count,
+    ):
+        raise NotImplementedError()
+
     def dequeue(
         self,
         queue_name,
+        timeout=0,
     ):
         try:
+            if self.frame_size or self.frame_buffers.get(queue_name):
+                decoded_values = self.dequeue_bulk(
+                    queue_name=queue_name,
+                    count=1,
+                    timeout=timeout,
+                )
+                if not decoded_values:
+                    return {}
+
+                return decoded_values[0]
+
+            self.promote_delayed(
+                queue_name=queue_name,
+            )
+
             value = self._dequeue(
                 queue_name=queue_name,
+                timeout=timeout,
             )
             if not value:
                 return {}
 
-            decoded_value = self.encoder.decode(
-                data=value,
+            decode_start_time = time.perf_counter()
+            decoded_values = self.unpack_frames(
+                queue_name=queue_name,
+                values=[
+                    value,
+                ],
+                count=1,
             )
+            self.last_decode_durations[queue_name] = time.perf_counter() - decode_start_time
+
+            if not decoded_values:
+                return {}
 
-            return decoded_value
+            return decoded_values[0]
         except Exception as exception:
             self.logger.error(
                 msg=exception,
@@ -42,6 +172,7 @@ class Queue:
     def _dequeue(
         self,
         queue_name,
+        timeout=0,
     ):
         raise NotImplementedError()
 
@@ -49,21 +180,44 @@ class Queue:
         self,
         queue_name,
         count,
+        timeout=0,
     ):
         try:
             decoded_values = []
 
-            values = self._dequeue_bulk(
+            frame_buffer = self.frame_buffers.get(queue_name)
+            if frame_buffer:
+                while frame_buffer and len(decoded_values) < count:
+                    decoded_values.append(frame_buffer.popleft())
+
+                if len(decoded_values) == count:
+                    return decoded_values
+
+                timeout = 0
+
+            self.promote_delayed(
                 queue_name=queue_name,
-                count=count,
             )
 
-            for value in values:
-                decoded_value = self.encoder.decode(
-                    data=value,
-                )
+            remaining_count = count - len(decoded_values)
+            if self.frame_size:
+                number_of_values = -(-remaining_count // self.frame_size)
+            else:
+                number_of_values = remaining_count
 
-                decoded_values.append(decoded_value)
+            values = self._dequeue_bulk(
+                queue_name=queue_name,
+                count=number_of_values,
+                timeout=timeout,
+            )
+
+            decode_start_time = time.perf_counter()
+            decoded_values += self.unpack_frames(
+                queue_name=queue_name,
+                values=values,
+                count=remaining_count,
+            )
+            self.last_decode_durations[queue_name] = time.perf_counter() - decode_start_time
 
             return decoded_values
         except Exception as exception:
@@ -77,6 +231,87 @@ class Queue:
         self,
         queue_name,
         count,
+        timeout=0,
+    ):
+        raise NotImplementedError()
+
+    def unpack_frames(
+        self,
+        queue_name,
+        values,
+        count,
+    ):
+        decoded_values = []
+
+        for value in values:
+            if self.encoder.is_frame(
+                data=value,
+            ):
+                decoded_values += self.encoder.decode_frame(
+                    data=value,
+                )
+            else:
+                decoded_values.append(
+                    self.encoder.decode(
+                        data=value,
+                    )
+                )
+
+        if self.frame_size and decoded_values:
+            remaining_tasks = self.update_frame_counter(
+                queue_name=queue_name,
+                amount=-len(decoded_values),
+            )
+        else:
+            remaining_tasks = None
+
+        if len(decoded_values) > count:
+            frame_buffer = self.frame_buffers.setdefault(
+                queue_name,
+                collections.deque(),
+            )
+            frame_buffer.extend(decoded_values[count:])
+            decoded_values = decoded_values[:count]
+
+        if remaining_tasks is not None:
+            self.last_known_lengths[queue_name] = max(remaining_tasks, 0) + len(self.frame_buffers.get(queue_name, ()))
+
+        return decoded_values
+
+    def requeue_buffered(
+        self,
+        queue_name,
+    ):
+        try:
+            frame_buffer = self.frame_buffers.pop(queue_name, None)
+            if not frame_buffer:
+                return 0
+
+            self._enqueue_front(
+                queue_name=queue_name,
+                value=self.encoder.encode_frame(
+                    values=frame_buffer,
+                ),
+            )
+
+            if self.frame_size:
+                self.update_frame_counter(
+                    queue_name=queue_name,
+                    amount=len(frame_buffer),
+                )
+
+            return len(frame_buffer)
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
+            raise exception
+
+    def _enqueue_front(
+        self,
+        queue_name,
+        value,
     ):
         raise NotImplementedError()
 
@@ -84,16 +319,37 @@ class Queue:
         self,
         queue_name,
         value,
+        priority=0,
+        eta=0,
     ):
         try:
             encoded_value = self.encoder.encode(
                 data=value,
             )
 
-            self._enqueue(
-                queue_name=queue_name,
-                value=encoded_value,
-            )
+            if eta:
+                self._enqueue_delayed(
+                    queue_name=queue_name,
+                    values=[
+                        encoded_value,
+                    ],
+                    priorities=[
+                        priority,
+                    ],
+                    eta=eta,
+                )
+            else:
+                self._enqueue(
+                    queue_name=queue_name,
+                    value=encoded_value,
+                    priority=priority,
+                )
+
+                if self.frame_size:
+                    self.update_frame_counter(
+                        queue_name=queue_name,
+                        amount=1,
+                    )
         except Exception as exception:
             self.logger.error(
                 msg=exception,
@@ -105,6 +361,7 @@ class Queue:
         self,
         queue_name,
         value,
+        priority=0,
     ):
         raise NotImplementedError()
 
@@ -112,20 +369,121 @@ class Queue:
         self,
         queue_name,
         values,
+        priorities=None,
+        eta=0,
     ):
         try:
-            encoded_values = []
+            if priorities is None:
+                priorities = [0] * len(values)
 
-            for value in values:
-                encoded_value = self.encoder.encode(
-                    data=value,
+            if self.frame_size and not eta:
+                encoded_values, priorities = self.pack_frames(
+                    values=values,
+                    priorities=priorities,
+                )
+            else:
+                encoded_values = []
+                for value in values:
+                    encoded_value = self.encoder.encode(
+                        data=value,
+                    )
+
+                    encoded_values.append(encoded_value)
+
+            if eta:
+                self._enqueue_delayed(
+                    queue_name=queue_name,
+                    values=encoded_values,
+                    priorities=priorities,
+                    eta=eta,
+                )
+            else:
+                self._enqueue_bulk(
+                    queue_name=queue_name,
+                    values=encoded_values,
+                    priorities=priorities,
                 )
 
-                encoded_values.append(encoded_value)
+                if self.frame_size and values:
+                    self.update_frame_counter(
+                        queue_name=queue_name,
+                        amount=len(values),
+                    )
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
+            raise exception
+
+    def pack_frames(
+        self,
+        values,
+        priorities,
+    ):
+        encoded_values = []
+        frame_priorities = []
+
+        frame_start = 0
+        while frame_start < len(values):
+            frame_priority = priorities[frame_start]
+
+            frame_end = frame_start + 1
+            while frame_end < len(values) and frame_end - frame_start < self.frame_size and priorities[frame_end] == frame_priority:
+                frame_end += 1
+
+            encoded_values.append(
+                self.encoder.encode_frame(
+                    values=values[frame_start:frame_end],
+                )
+            )
+            frame_priorities.append(frame_priority)
+
+            frame_start = frame_end
+
+        return encoded_values, frame_priorities
+
+    def _enqueue_bulk(
+        self,
+        queue_name,
+        values,
+        priorities,
+    ):
+        raise NotImplementedError()
 
-            self._enqueue_bulk(
+    def _enqueue_delayed(
+        self,
+        queue_name,
+        values,
+        priorities,
+        eta,
+    ):
+        raise NotImplementedError()
+
+    def delayed_len(
+        self,
+        queue_name,
+    ):
+        try:
+            return self.connector.delayed_len(
+                key=self.get_delayed_queue_name(
+                    queue_name=queue_name,
+                ),
+            )
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
+            raise exception
+
+    def ack(
+        self,
+        queue_name,
+    ):
+        try:
+            return self._ack(
                 queue_name=queue_name,
-                values=encoded_values,
             )
         except Exception as exception:
             self.logger.error(
@@ -134,10 +492,9 @@ class Queue:
 
             raise exception
 
-    def _enqueue_bulk(
+    def _ack(
         self,
         queue_name,
-        values,
     ):
         raise NotImplementedError()
 
@@ -189,6 +546,30 @@ class Queue:
     ):
         raise NotImplementedError()
 
+    def remove_results(
+        self,
+        queue_name,
+        values,
+    ):
+        try:
+            return self._remove_results(
+                queue_name=queue_name,
+                values=values,
+            )
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
+            raise exception
+
+    def _remove_results(
+        self,
+        queue_name,
+        values,
+    ):
+        raise NotImplementedError()
+
     def has_result(
         self,
         queue_name,
@@ -218,6 +599,15 @@ class Queue:
         queue_name,
     ):
         try:
+            if self.frame_size:
+                queue_len = self.connector.key_get(
+                    key=self.get_frame_counter_name(
+                        queue_name=queue_name,
+                    ),
+                )
+
+                return max(int(queue_len or 0), 0)
+
             return self._len(
                 queue_name=queue_name,
             )
@@ -239,6 +629,8 @@ class Queue:
         queue_name,
     ):
         try:
+            self.frame_buffers.pop(queue_name, None)
+
             return self._flush(
                 queue_name=queue_name,
             )
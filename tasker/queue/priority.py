@@ -0,0 +1,129 @@
+from . import regular
+
+
+class Queue(
+    regular.Queue,
+):
+    name = 'priority'
+
+    def _dequeue(
+        self,
+        queue_name,
+        timeout=0,
+    ):
+        values = self._dequeue_bulk(
+            queue_name=queue_name,
+            count=1,
+            timeout=timeout,
+        )
+
+        if not values:
+            return None
+
+        return values[0]
+
+    def _dequeue_bulk(
+        self,
+        queue_name,
+        count,
+        timeout=0,
+    ):
+        values = self.connector.priority_pop_bulk(
+            key=queue_name,
+            count=count,
+            timeout=timeout,
+        )
+
+        return values
+
+    def _enqueue(
+        self,
+        queue_name,
+        value,
+        priority=0,
+    ):
+        pushed = self.connector.priority_push_bulk(
+            key=queue_name,
+            values=[
+                value,
+            ],
+            priorities=[
+                priority,
+            ],
+        )
+
+        return pushed
+
+    def _enqueue_bulk(
+        self,
+        queue_name,
+        values,
+        priorities,
+    ):
+        pushed = self.connector.priority_push_bulk(
+            key=queue_name,
+            values=values,
+            priorities=priorities,
+        )
+
+        return pushed
+
+    def _enqueue_delayed(
+        self,
+        queue_name,
+        values,
+        priorities,
+        eta,
+    ):
+        pushed = self.connector.delayed_push_bulk(
+            key=self.get_delayed_queue_name(
+                queue_name=queue_name,
+            ),
+            values=[
+                str(int(priority)).encode() + b':' + value
+                for value, priority in zip(values, priorities)
+            ],
+            due_times=[eta] * len(values),
+        )
+
+        return pushed
+
+    def _promote_delayed(
+        self,
+        queue_name,
+        now,
+        count,
+    ):
+        promoted = self.connector.delayed_move_due_to_priority(
+            key=self.get_delayed_queue_name(
+                queue_name=queue_name,
+            ),
+            destination=queue_name,
+            now=now,
+            count=count,
+        )
+
+        return promoted
+
+    def _len(
+        self,
+        queue_name,
+    ):
+        queue_len = self.connector.priority_len(
+            key=queue_name,
+        )
+
+        return queue_len
+
+    def _flush(
+        self,
+        queue_name,
+    ):
+        super()._flush(
+            queue_name=queue_name,
+        )
+        self.connector.delete(
+            key='{queue_name}.sequence'.format(
+                queue_name=queue_name,
+            ),
+        )
@@ -6,28 +6,48 @@ class Queue(
 ):
     name = 'regular'
 
+    def __init__(
+        self,
+        connector,
+        encoder,
+        frame_size=0,
+    ):
+        super().__init__(
+            connector=connector,
+            encoder=encoder,
+        )
+
+        self.frame_size = frame_size
+
     def _dequeue(
         self,
         queue_name,
+        timeout=0,
     ):
-        value = self.connector.pop(
+        values, remaining = self.connector.pop_bulk_with_len(
             key=queue_name,
+            count=1,
+            timeout=timeout,
         )
+        self.last_known_lengths[queue_name] = remaining
 
-        if value is None:
+        if not values:
             return None
 
-        return value
+        return values[0]
 
     def _dequeue_bulk(
         self,
         queue_name,
         count,
+        timeout=0,
     ):
-        values = self.connector.pop_bulk(
+        values, remaining = self.connector.pop_bulk_with_len(
             key=queue_name,
             count=count,
+            timeout=timeout,
         )
+        self.last_known_lengths[queue_name] = remaining
 
         return values
 
@@ -35,6 +55,7 @@ class Queue(
         self,
         queue_name,
         value,
+        priority=0,
     ):
         pushed = self.connector.push(
             key=queue_name,
@@ -43,10 +64,23 @@ class Queue(
 
         return pushed
 
+    def _enqueue_front(
+        self,
+        queue_name,
+        value,
+    ):
+        pushed = self.connector.push_front(
+            key=queue_name,
+            value=value,
+        )
+
+        return pushed
+
     def _enqueue_bulk(
         self,
         queue_name,
         values,
+        priorities,
     ):
         pushed = self.connector.push_bulk(
             key=queue_name,
@@ -55,6 +89,46 @@ class Queue(
 
         return pushed
 
+    def _enqueue_delayed(
+        self,
+        queue_name,
+        values,
+        priorities,
+        eta,
+    ):
+        pushed = self.connector.delayed_push_bulk(
+            key=self.get_delayed_queue_name(
+                queue_name=queue_name,
+            ),
+            values=values,
+            due_times=[eta] * len(values),
+        )
+
+        return pushed
+
+    def _promote_delayed(
+        self,
+        queue_name,
+        now,
+        count,
+    ):
+        promoted = self.connector.delayed_move_due(
+            key=self.get_delayed_queue_name(
+                queue_name=queue_name,
+            ),
+            destination=queue_name,
+            now=now,
+            count=count,
+        )
+
+        return promoted
+
+    def _ack(
+        self,
+        queue_name,
+    ):
+        return True
+
     def _add_result(
         self,
         queue_name,
@@ -83,6 +157,20 @@ class Queue(
 
         return removed
 
+    def _remove_results(
+        self,
+        queue_name,
+        values,
+    ):
+        removed = self.connector.remove_from_set_bulk(
+            set_name='{queue_name}.results'.format(
+                queue_name=queue_name,
+            ),
+            values=values,
+        )
+
+        return removed
+
     def _has_result(
         self,
         queue_name,
@@ -119,3 +207,41 @@ class Queue(
                 queue_name=queue_name,
             ),
         )
+        self.connector.delete(
+            key=self.get_delayed_queue_name(
+                queue_name=queue_name,
+            ),
+        )
+        self.connector.delete(
+            key=self.get_frame_counter_name(
+                queue_name=queue_name,
+            ),
+        )
+        self.connector.delete(
+            key='{delayed_queue_name}.sequence'.format(
+                delayed_queue_name=self.get_delayed_queue_name(
+                    queue_name=queue_name,
+                ),
+            ),
+        )
+
+    def __getstate__(
+        self,
+    ):
+        state = {
+            'connector': self.connector,
+            'encoder': self.encoder,
+            'frame_size': self.frame_size,
+        }
+
+        return state
+
+    def __setstate__(
+        self,
+        state,
+    ):
+        self.__init__(
+            connector=state['connector'],
+            encoder=state['encoder'],
+            frame_size=state['frame_size'],
+        )
@@ -0,0 +1,218 @@
+import uuid
+
+from . import regular
+
+
+class Queue(
+    regular.Queue,
+):
+    name = 'reliable'
+
+    def __init__(
+        self,
+        connector,
+        encoder,
+        consumer_timeout=60.0,
+    ):
+        super().__init__(
+            connector=connector,
+            encoder=encoder,
+        )
+
+        self.consumer_timeout = consumer_timeout
+        self.consumer_id = uuid.uuid4().hex
+
+        self.registered_queue_names = set()
+
+    def get_processing_queue_name(
+        self,
+        queue_name,
+        consumer_id,
+    ):
+        return '{queue_name}.processing.{consumer_id}'.format(
+            queue_name=queue_name,
+            consumer_id=consumer_id,
+        )
+
+    def get_heartbeat_key_name(
+        self,
+        queue_name,
+        consumer_id,
+    ):
+        return '{queue_name}.heartbeat.{consumer_id}'.format(
+            queue_name=queue_name,
+            consumer_id=consumer_id,
+        )
+
+    def get_consumers_set_name(
+        self,
+        queue_name,
+    ):
+        return '{queue_name}.consumers'.format(
+            queue_name=queue_name,
+        )
+
+    def keep_alive(
+        self,
+        queue_name,
+    ):
+        try:
+            self.connector.key_refresh(
+                key=self.get_heartbeat_key_name(
+                    queue_name=queue_name,
+                    consumer_id=self.consumer_id,
+                ),
+                value=b'alive',
+                ttl=int(self.consumer_timeout * 1000),
+            )
+            self.connector.add_to_set(
+                set_name=self.get_consumers_set_name(
+                    queue_name=queue_name,
+                ),
+                value=self.consumer_id,
+            )
+
+            self.registered_queue_names.add(queue_name)
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
+            raise exception
+
+    def requeue_dead_consumers(
+        self,
+        queue_name,
+    ):
+        try:
+            consumers_set_name = self.get_consumers_set_name(
+                queue_name=queue_name,
+            )
+
+            consumer_ids = [
+                consumer_id.decode('utf-8')
+                for consumer_id in self.connector.get_set_members(
+                    set_name=consumers_set_name,
+                )
+            ]
+            consumers_alive = self.connector.keys_exist(
+                keys=[
+                    self.get_heartbeat_key_name(
+                        queue_name=queue_name,
+                        consumer_id=consumer_id,
+                    )
+                    for consumer_id in consumer_ids
+                ],
+            )
+
+            requeued = 0
+            for consumer_id, consumer_alive in zip(consumer_ids, consumers_alive):
+                if consumer_alive:
+                    continue
+
+                requeued += self.connector.move_all(
+                    key=self.get_processing_queue_name(
+                        queue_name=queue_name,
+                        consumer_id=consumer_id,
+                    ),
+                    destination=queue_name,
+                )
+                self.connector.remove_from_set(
+                    set_name=consumers_set_name,
+                    value=consumer_id,
+                )
+
+            return requeued
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
+            raise exception
+
+    def _dequeue(
+        self,
+        queue_name,
+        timeout=0,
+    ):
+        values = self._dequeue_bulk(
+            queue_name=queue_name,
+            count=1,
+            timeout=timeout,
+        )
+
+        if not values:
+            return None
+
+        return values[0]
+
+    def _dequeue_bulk(
+        self,
+        queue_name,
+        count,
+        timeout=0,
+    ):
+        if queue_name not in self.registered_queue_names:
+            self.keep_alive(
+                queue_name=queue_name,
+            )
+
+        values = self.connector.move_bulk(
+            key=queue_name,
+            destination=self.get_processing_queue_name(
+                queue_name=queue_name,
+                consumer_id=self.consumer_id,
+            ),
+            count=count,
+            timeout=timeout,
+        )
+
+        return values
+
+    def _ack(
+        self,
+        queue_name,
+    ):
+        self.connector.delete(
+            key=self.get_processing_queue_name(
+                queue_name=queue_name,
+                consumer_id=self.consumer_id,
+            ),
+        )
+
+        return True
+
+    def _flush(
+        self,
+        queue_name,
+    ):
+        super()._flush(
+            queue_name=queue_name,
+        )
+        self.connector.delete(
+            key=self.get_processing_queue_name(
+                queue_name=queue_name,
+                consumer_id=self.consumer_id,
+            ),
+        )
+
+    def __getstate__(
+        self,
+    ):
+        state = {
+            'connector': self.connector,
+            'encoder': self.encoder,
+            'consumer_timeout': self.consumer_timeout,
+        }
+
+        return state
+
+    def __setstate__(
+        self,
+        state,
+    ):
+        self.__init__(
+            connector=state['connector'],
+            encoder=state['encoder'],
+            consumer_timeout=state['consumer_timeout'],
+        )
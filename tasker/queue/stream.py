@@ -0,0 +1,218 @@
+import uuid
+
+from . import regular
+
+
+class Queue(
+    regular.Queue,
+):
+    name = 'stream'
+
+    def __init__(
+        self,
+        connector,
+        encoder,
+        group_name='tasker',
+        consumer_timeout=60.0,
+    ):
+        super().__init__(
+            connector=connector,
+            encoder=encoder,
+        )
+
+        self.group_name = group_name
+        self.consumer_timeout = consumer_timeout
+        self.consumer_id = uuid.uuid4().hex
+
+        self.pending_receipts = {}
+
+    def keep_alive(
+        self,
+        queue_name,
+    ):
+        try:
+            receipts = list(
+                self.pending_receipts.get(
+                    queue_name,
+                    [],
+                )
+            )
+
+            self.connector.stream_touch(
+                key=queue_name,
+                group_name=self.group_name,
+                consumer_name=self.consumer_id,
+                receipts=receipts,
+            )
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
+            raise exception
+
+    def requeue_dead_consumers(
+        self,
+        queue_name,
+    ):
+        try:
+            return self.connector.stream_requeue_idle(
+                key=queue_name,
+                group_name=self.group_name,
+                consumer_name=self.consumer_id,
+                min_idle_time=int(self.consumer_timeout * 1000),
+                count=1000,
+            )
+        except Exception as exception:
+            self.logger.error(
+                msg=exception,
+            )
+
+            raise exception
+
+    def _dequeue(
+        self,
+        queue_name,
+        timeout=0,
+    ):
+        values = self._dequeue_bulk(
+            queue_name=queue_name,
+            count=1,
+            timeout=timeout,
+        )
+
+        if not values:
+            return None
+
+        return values[0]
+
+    def _dequeue_bulk(
+        self,
+        queue_name,
+        count,
+        timeout=0,
+    ):
+        entries = self.connector.stream_read_group(
+            key=queue_name,
+            group_name=self.group_name,
+            consumer_name=self.consumer_id,
+            count=count,
+            timeout=timeout,
+        )
+
+        receipts = self.pending_receipts.setdefault(queue_name, [])
+        values = []
+        for receipt, value in entries:
+            receipts.append(receipt)
+            values.append(value)
+
+        return values
+
+    def _enqueue(
+        self,
+        queue_name,
+        value,
+        priority=0,
+    ):
+        added_ids = self.connector.stream_add_bulk(
+            key=queue_name,
+            values=[
+                value,
+            ],
+        )
+
+        return len(added_ids)
+
+    def _enqueue_bulk(
+        self,
+        queue_name,
+        values,
+        priorities,
+    ):
+        added_ids = self.connector.stream_add_bulk(
+            key=queue_name,
+            values=values,
+        )
+
+        return len(added_ids)
+
+    def _ack(
+        self,
+        queue_name,
+    ):
+        receipts = self.pending_receipts.pop(
+            queue_name,
+            [],
+        )
+
+        self.connector.stream_ack(
+            key=queue_name,
+            group_name=self.group_name,
+            receipts=receipts,
+        )
+
+        return True
+
+    def _len(
+        self,
+        queue_name,
+    ):
+        queue_len = self.connector.stream_len(
+            key=queue_name,
+            group_name=self.group_name,
+        )
+
+        return queue_len
+
+    def _promote_delayed(
+        self,
+        queue_name,
+        now,
+        count,
+    ):
+        promoted = self.connector.delayed_move_due_to_stream(
+            key=self.get_delayed_queue_name(
+                queue_name=queue_name,
+            ),
+            destination=queue_name,
+            now=now,
+            count=count,
+        )
+
+        return promoted
+
+    def _flush(
+        self,
+        queue_name,
+    ):
+        super()._flush(
+            queue_name=queue_name,
+        )
+
+        self.pending_receipts.pop(
+            queue_name,
+            None,
+        )
+
+    def __getstate__(
+        self,
+    ):
+        state = {
+            'connector': self.connector,
+            'encoder': self.encoder,
+            'group_name': self.group_name,
+            'consumer_timeout': self.consumer_timeout,
+        }
+
+        return state
+
+    def __setstate__(
+        self,
+        state,
+    ):
+        self.__init__(
+            connector=state['connector'],
+            encoder=state['encoder'],
+            group_name=state['group_name'],
+            consumer_timeout=state['consumer_timeout'],
+        )
@@ -3,6 +3,7 @@ import datetime
 import random
 
 from . import logger
+from . import task_record
 
 
 class TaskQueue:
@@ -47,12 +48,29 @@ class TaskQueue:
                 )
             )
 
+    def last_known_number_of_enqueued_tasks(
+        self,
+        task_name,
+    ):
+        return self.queue.last_known_len(
+            queue_name=task_name,
+        )
+
+    def last_decode_duration(
+        self,
+        task_name,
+    ):
+        return self.queue.last_decode_duration(
+            queue_name=task_name,
+        )
+
     def craft_task(
         self,
         task_name,
         args=(),
         kwargs={},
         report_completion=False,
+        priority=0,
     ):
         if report_completion:
             completion_key = self.create_completion_key(
@@ -61,17 +79,39 @@ class TaskQueue:
         else:
             completion_key = None
 
-        task = {
-            'name': task_name,
-            'date': datetime.datetime.utcnow().timestamp(),
-            'args': args,
-            'kwargs': kwargs,
-            'run_count': 0,
-            'completion_key': completion_key,
-        }
+        task = task_record.TaskRecord(
+            name=task_name,
+            date=time.time(),
+            args=args,
+            kwargs=kwargs,
+            run_count=0,
+            completion_key=completion_key,
+            priority=priority,
+        )
 
         return task
 
+    def pack_task(
+        self,
+        task,
+    ):
+        if not isinstance(task, task_record.TaskRecord):
+            task = task_record.TaskRecord.from_dict(
+                task=task,
+            )
+
+        return task.to_record()
+
+    def unpack_task(
+        self,
+        task_name,
+        record,
+    ):
+        return task_record.TaskRecord.from_record(
+            record=record,
+            name=task_name,
+        )
+
     def create_completion_key(
         self,
         task_name,
@@ -103,6 +143,29 @@ class TaskQueue:
         else:
             return True
 
+    def report_complete_many(
+        self,
+        tasks,
+    ):
+        task_name_to_completion_keys = {}
+        for task in tasks:
+            if not task['completion_key']:
+                continue
+
+            if task['name'] in task_name_to_completion_keys:
+                task_name_to_completion_keys[task['name']].append(task['completion_key'])
+            else:
+                task_name_to_completion_keys[task['name']] = [task['completion_key']]
+
+        removed = 0
+        for task_name, completion_keys in task_name_to_completion_keys.items():
+            removed += self.queue.remove_results(
+                queue_name=task_name,
+                values=completion_keys,
+            )
+
+        return removed
+
     def wait_task_finished(
         self,
         task,
@@ -149,14 +212,39 @@ class TaskQueue:
             time.sleep(1.0)
             remaining_time -= 1.0
 
+    def get_due_time(
+        self,
+        eta=None,
+        countdown=None,
+    ):
+        if eta is not None:
+            if isinstance(eta, datetime.datetime):
+                return eta.timestamp()
+
+            return float(eta)
+
+        if countdown is not None:
+            return time.time() + countdown
+
+        return 0
+
     def apply_async_one(
         self,
         task,
+        eta=None,
+        countdown=None,
     ):
         try:
             self.queue.enqueue(
                 queue_name=task['name'],
-                value=task,
+                value=self.pack_task(
+                    task=task,
+                ),
+                priority=task.get('priority', 0),
+                eta=self.get_due_time(
+                    eta=eta,
+                    countdown=countdown,
+                ),
             )
 
             return True
@@ -172,6 +260,8 @@ class TaskQueue:
     def apply_async_many(
         self,
         tasks,
+        eta=None,
+        countdown=None,
     ):
         if len(tasks) == 0:
             return True
@@ -183,11 +273,26 @@ class TaskQueue:
             else:
                 task_name_to_tasks[task['name']] = [task]
 
+        due_time = self.get_due_time(
+            eta=eta,
+            countdown=countdown,
+        )
+
         try:
             for task_name, tasks in task_name_to_tasks.items():
                 self.queue.enqueue_bulk(
                     queue_name=task_name,
-                    values=tasks,
+                    values=[
+                        self.pack_task(
+                            task=task,
+                        )
+                        for task in tasks
+                    ],
+                    priorities=[
+                        task.get('priority', 0)
+                        for task in tasks
+                    ],
+                    eta=due_time,
                 )
 
             return True
@@ -204,24 +309,38 @@ class TaskQueue:
         self,
         task_name,
         number_of_tasks,
+        timeout=0,
     ):
         try:
             if number_of_tasks == 1:
                 task = self.queue.dequeue(
                     queue_name=task_name,
+                    timeout=timeout,
                 )
 
                 if task:
-                    return [task]
+                    return [
+                        self.unpack_task(
+                            task_name=task_name,
+                            record=task,
+                        ),
+                    ]
                 else:
                     return []
             else:
-                tasks = self.queue.dequeue_bulk(
+                records = self.queue.dequeue_bulk(
                     queue_name=task_name,
                     count=number_of_tasks,
+                    timeout=timeout,
                 )
 
-                return tasks
+                return [
+                    self.unpack_task(
+                        task_name=task_name,
+                        record=record,
+                    )
+                    for record in records
+                ]
         except Exception as exception:
             self.logger.error(
                 msg='could not pull task: {exception}'.format(
@@ -231,14 +350,54 @@ class TaskQueue:
 
             return []
 
+    def requeue_buffered_tasks(
+        self,
+        task_name,
+    ):
+        try:
+            return self.queue.requeue_buffered(
+                queue_name=task_name,
+            )
+        except Exception as exception:
+            self.logger.error(
+                msg='could not requeue buffered tasks: {exception}'.format(
+                    exception=exception,
+                )
+            )
+
+            return 0
+
+    def ack_tasks(
+        self,
+        task_name,
+    ):
+        try:
+            self.queue.ack(
+                queue_name=task_name,
+            )
+
+            return True
+        except Exception as exception:
+            self.logger.error(
+                msg='could not ack tasks: {exception}'.format(
+                    exception=exception,
+                )
+            )
+
+            return False
+
     def retry(
         self,
         task,
+        eta=None,
+        countdown=None,
     ):
         task['run_count'] += 1
 
         return self.apply_async_one(
             task=task,
+            eta=eta,
+            countdown=countdown,
         )
 
     def requeue(
@@ -248,3 +407,26 @@ class TaskQueue:
         return self.apply_async_one(
             task=task,
         )
+
+    def retry_many(
+        self,
+        tasks,
+        eta=None,
+        countdown=None,
+    ):
+        for task in tasks:
+            task['run_count'] += 1
+
+        return self.apply_async_many(
+            tasks=tasks,
+            eta=eta,
+            countdown=countdown,
+        )
+
+    def requeue_many(
+        self,
+        tasks,
+    ):
+        return self.apply_async_many(
+            tasks=tasks,
+        )
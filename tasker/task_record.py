@@ -0,0 +1,290 @@
+RECORD_VERSION = 1
+
+OPTIONAL_FIELDS = (
+    ('kwargs', {}),
+    ('run_count', 0),
+    ('completion_key', None),
+    ('priority', 0),
+)
+
+FIELDS = (
+    'name',
+    'date',
+    'args',
+    'kwargs',
+    'run_count',
+    'completion_key',
+    'priority',
+)
+
+
+class TaskRecord:
+    __slots__ = FIELDS + (
+        'extras',
+    )
+
+    def __init__(
+        self,
+        name,
+        date,
+        args=(),
+        kwargs=None,
+        run_count=0,
+        completion_key=None,
+        priority=0,
+        extras=None,
+    ):
+        self.name = name
+        self.date = date
+        self.args = args
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.run_count = run_count
+        self.completion_key = completion_key
+        self.priority = priority
+        self.extras = extras or None
+
+    @classmethod
+    def from_dict(
+        cls,
+        task,
+    ):
+        return cls(
+            name=task['name'],
+            date=task['date'],
+            args=task.get('args', ()),
+            kwargs=task.get('kwargs'),
+            run_count=task.get('run_count', 0),
+            completion_key=task.get('completion_key'),
+            priority=task.get('priority', 0),
+            extras={
+                key: value
+                for key, value in task.items()
+                if key not in FIELDS
+            },
+        )
+
+    @classmethod
+    def from_record(
+        cls,
+        record,
+        name,
+    ):
+        if isinstance(record, cls):
+            return record
+
+        if isinstance(record, dict):
+            return cls.from_dict(
+                task=record,
+            )
+
+        header = record[0]
+        version = header >> 4
+        if version != RECORD_VERSION:
+            raise ValueError(
+                'unsupported task record version: {version}'.format(
+                    version=version,
+                )
+            )
+
+        task = cls(
+            name=name,
+            date=record[1],
+            args=record[2],
+        )
+
+        field_index = 3
+        for field_bit, (field_name, field_default) in enumerate(OPTIONAL_FIELDS):
+            if header & (1 << field_bit):
+                setattr(task, field_name, record[field_index])
+                field_index += 1
+
+        if len(record) > field_index:
+            task.extras = record[field_index]
+
+        return task
+
+    def to_record(
+        self,
+    ):
+        header = RECORD_VERSION << 4
+        record = [
+            header,
+            self.date,
+            self.args,
+        ]
+
+        for field_bit, (field_name, field_default) in enumerate(OPTIONAL_FIELDS):
+            field_value = getattr(self, field_name, field_default)
+            if field_value != field_default:
+                header |= 1 << field_bit
+                record.append(field_value)
+
+        record[0] = header
+
+        if self.extras:
+            record.append(self.extras)
+
+        return record
+
+    def __getitem__(
+        self,
+        key,
+    ):
+        if key in FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+
+        if self.extras is None:
+            raise KeyError(key)
+
+        return self.extras[key]
+
+    def __setitem__(
+        self,
+        key,
+        value,
+    ):
+        if key in FIELDS:
+            setattr(self, key, value)
+
+            return
+
+        if self.extras is None:
+            self.extras = {}
+
+        self.extras[key] = value
+
+    def __delitem__(
+        self,
+        key,
+    ):
+        if key in FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+
+            return
+
+        if self.extras is None:
+            raise KeyError(key)
+
+        del self.extras[key]
+        if not self.extras:
+            self.extras = None
+
+    def __contains__(
+        self,
+        key,
+    ):
+        if key in FIELDS:
+            return hasattr(self, key)
+
+        return self.extras is not None and key in self.extras
+
+    def __iter__(
+        self,
+    ):
+        return iter(self.keys())
+
+    def __len__(
+        self,
+    ):
+        return len(self.keys())
+
+    def __eq__(
+        self,
+        other,
+    ):
+        if isinstance(other, (TaskRecord, dict)):
+            return dict(self.items()) == dict(other.items())
+
+        return NotImplemented
+
+    def __repr__(
+        self,
+    ):
+        return 'TaskRecord({items})'.format(
+            items=dict(self.items()),
+        )
+
+    def get(
+        self,
+        key,
+        default=None,
+    ):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(
+        self,
+        key,
+        *default
+    ):
+        try:
+            value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+
+            raise
+
+        del self[key]
+
+        return value
+
+    def keys(
+        self,
+    ):
+        keys = [
+            key
+            for key in FIELDS
+            if hasattr(self, key)
+        ]
+        if self.extras is not None:
+            keys += self.extras.keys()
+
+        return keys
+
+    def values(
+        self,
+    ):
+        return [
+            self[key]
+            for key in self.keys()
+        ]
+
+    def items(
+        self,
+    ):
+        return [
+            (key, self[key])
+            for key in self.keys()
+        ]
+
+    def copy(
+        self,
+    ):
+        task = TaskRecord.__new__(TaskRecord)
+        task.extras = None
+        for key, value in self.items():
+            task[key] = value
+
+        return task
+
+    def __getstate__(
+        self,
+    ):
+        return dict(self.items())
+
+    def __setstate__(
+        self,
+        state,
+    ):
+        self.extras = None
+        for key, value in state.items():
+            self[key] = value
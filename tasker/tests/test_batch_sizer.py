@@ -0,0 +1,53 @@
+import unittest
+
+from .. import batch_sizer
+
+
+class BatchSizerTestCase(
+    unittest.TestCase,
+):
+    def setUp(self):
+        self.batch_sizer = batch_sizer.BatchSizer(
+            initial_batch_size=10,
+            min_batch_size=1,
+            max_batch_size=1000,
+            target_batch_duration=1.0,
+            smoothing_factor=0.5,
+        )
+
+    def test_grows_for_fast_tasks(self):
+        batch_sizes = [
+            self.batch_sizer.update(
+                number_of_tasks=self.batch_sizer.batch_size,
+                duration=self.batch_sizer.batch_size * 0.0001,
+            )
+            for i in range(10)
+        ]
+        self.assertEqual(batch_sizes[:3], [20, 40, 80])
+        self.assertEqual(batch_sizes[-1], 1000)
+
+    def test_shrinks_for_slow_tasks(self):
+        for i in range(10):
+            self.batch_sizer.update(
+                number_of_tasks=self.batch_sizer.batch_size,
+                duration=self.batch_sizer.batch_size * 2.0,
+            )
+        self.assertEqual(self.batch_sizer.batch_size, 1)
+
+    def test_bounded_by_queue_length(self):
+        for i in range(10):
+            self.batch_sizer.update(
+                number_of_tasks=self.batch_sizer.batch_size,
+                duration=0.0,
+                queue_length=30,
+            )
+        self.assertEqual(self.batch_sizer.batch_size, 30)
+
+    def test_ignores_empty_batches(self):
+        self.assertEqual(
+            self.batch_sizer.update(
+                number_of_tasks=0,
+                duration=1.0,
+            ),
+            10,
+        )
@@ -4,6 +4,9 @@ import os
 import sys
 import multiprocessing
 import signal
+import threading
+
+import psutil
 
 from .. import devices
 
@@ -15,6 +18,12 @@ class DummyMonitorClient:
     def increment_heartbeat(self):
         self.counter += 1
 
+    def flush(self):
+        pass
+
+    def flush_if_due(self):
+        pass
+
 
 class DevicesTestCase(unittest.TestCase):
     @classmethod
@@ -52,6 +61,51 @@ class DevicesTestCase(unittest.TestCase):
         time.sleep(1.2)
         self.assertEqual(monitor_client.counter, 2)
 
+    def test_deadline_timer(self):
+        deadline_timer = devices.deadline_timer.DeadlineTimer(
+            exception=TimeoutError,
+        )
+        deadline_timer.start()
+
+        timed_out = []
+
+        def run_until_deadline(timeout, busy_duration):
+            deadline_timer.set_deadline(
+                thread_id=threading.get_ident(),
+                timeout=timeout,
+            )
+            try:
+                end = time.time() + busy_duration
+                while time.time() < end:
+                    pass
+
+                deadline_timer.clear_deadline(
+                    thread_id=threading.get_ident(),
+                )
+            except TimeoutError:
+                timed_out.append(timeout)
+
+        threads = [
+            threading.Thread(
+                target=run_until_deadline,
+                args=(0.2, 1.0),
+            ),
+            threading.Thread(
+                target=run_until_deadline,
+                args=(1.0, 0.2),
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(timed_out, [0.2])
+        self.assertEqual(deadline_timer.deadlines, {})
+
+        deadline_timer.stop()
+        deadline_timer.join()
+
     def test_memory_local_killer(self):
         local_killer = devices.killer.LocalKiller(
             pid=os.getpid(),
@@ -220,6 +274,89 @@ class DevicesTestCase(unittest.TestCase):
         self.assertFalse(self.sigabrt_fired)
         self.assertFalse(self.sigint_fired)
 
+    def test_paused_time_local_killer(self):
+        local_killer = devices.killer.LocalKiller(
+            pid=os.getpid(),
+            soft_timeout=0.3,
+            soft_timeout_signal=signal.SIGINT,
+            hard_timeout=0.0,
+            hard_timeout_signal=signal.SIGABRT,
+            critical_timeout=0.0,
+            critical_timeout_signal=signal.SIGTERM,
+            memory_limit=0,
+            memory_limit_signal=signal.SIGINT,
+        )
+
+        local_killer.start()
+        time.sleep(0.2)
+        local_killer.stop()
+        time.sleep(0.5)
+        self.assertFalse(self.sigint_fired)
+
+        local_killer.start()
+        time.sleep(0.05)
+        self.assertFalse(self.sigint_fired)
+        time.sleep(0.1)
+        self.assertTrue(self.sigint_fired)
+        local_killer.stop()
+
+    def test_restart_local_killer(self):
+        local_killer = devices.killer.LocalKiller(
+            pid=os.getpid(),
+            soft_timeout=0.3,
+            soft_timeout_signal=signal.SIGINT,
+            hard_timeout=0.0,
+            hard_timeout_signal=signal.SIGABRT,
+            critical_timeout=0.0,
+            critical_timeout_signal=signal.SIGTERM,
+            memory_limit=0,
+            memory_limit_signal=signal.SIGINT,
+        )
+
+        local_killer.restart()
+        time.sleep(0.2)
+        local_killer.restart()
+        time.sleep(0.2)
+        self.assertFalse(self.sigint_fired)
+        time.sleep(0.2)
+        self.assertTrue(self.sigint_fired)
+
+        self.sigint_fired = False
+        local_killer.restart()
+        time.sleep(0.2)
+        self.assertFalse(self.sigint_fired)
+        time.sleep(0.2)
+        self.assertTrue(self.sigint_fired)
+        local_killer.stop()
+
+    def test_orphaned_remote_killer(self):
+        killer_pids = multiprocessing.Queue()
+        test_process_obj = TestProcess()
+        testing_process = multiprocessing.Process(
+            target=test_process_obj.orphan_killer,
+            kwargs={
+                'killer_pids': killer_pids,
+            },
+        )
+        testing_process.start()
+        killer_pid = killer_pids.get(
+            timeout=5,
+        )
+        testing_process.join()
+
+        time.sleep(2.5)
+        try:
+            killer_status = psutil.Process(killer_pid).status()
+        except psutil.NoSuchProcess:
+            killer_status = psutil.STATUS_DEAD
+        self.assertIn(
+            killer_status,
+            [
+                psutil.STATUS_DEAD,
+                psutil.STATUS_ZOMBIE,
+            ],
+        )
+
     def test_sleep_case_local_killer(self):
         test_process_obj = TestProcess()
         testing_process = multiprocessing.Process(
@@ -416,6 +553,29 @@ class TestProcess:
         signal.signal(signal.SIGABRT, lambda a, b: True)
         time.sleep(interval)
 
+    def orphan_killer(self, killer_pids):
+        '''
+        '''
+        remote_killer = devices.killer.RemoteKiller(
+            pid=os.getpid(),
+            soft_timeout=0.0,
+            soft_timeout_signal=signal.SIGINT,
+            hard_timeout=0.0,
+            hard_timeout_signal=signal.SIGABRT,
+            critical_timeout=0.0,
+            critical_timeout_signal=signal.SIGTERM,
+            memory_limit=0,
+            memory_limit_signal=signal.SIGINT,
+        )
+        remote_killer.start()
+
+        for child in psutil.Process().children():
+            killer_pids.put(child.pid)
+        killer_pids.close()
+        killer_pids.join_thread()
+
+        os._exit(0)
+
     def sigabrt_handler(self, signal_num, frame):
         '''
         '''
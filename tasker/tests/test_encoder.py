@@ -1,4 +1,8 @@
+import datetime
+import decimal
+import os
 import unittest
+import uuid
 
 from .. import encoder
 
@@ -44,6 +48,8 @@ class EncoderTestCase(unittest.TestCase):
         }
 
         serializers = [
+            encoder.serializer.json.Serializer(),
+            encoder.serializer.marshal.Serializer(),
             encoder.serializer.msgpack.Serializer(),
             encoder.serializer.pickle.Serializer(),
         ]
@@ -54,6 +60,37 @@ class EncoderTestCase(unittest.TestCase):
             deserialized = serializer.unserialize(serialized)
             self.assertEqual(deserialized, data)
 
+    def test_msgpack_extension_types(self):
+        data = {
+            'tuple': (1, (2, 'b'), [3]),
+            'bytes': b'\x00\x01',
+            'str': 'string',
+            'datetime': datetime.datetime(2019, 1, 2, 3, 4, 5, 6),
+            'aware_datetime': datetime.datetime(
+                2019, 1, 2, 3, 4, 5, 6,
+                tzinfo=datetime.timezone(
+                    datetime.timedelta(
+                        hours=2,
+                    ),
+                ),
+            ),
+            'decimal': decimal.Decimal('1.10'),
+            'uuid': uuid.UUID('12345678123456781234567812345678'),
+            1: 'integer key',
+        }
+
+        serializer = encoder.serializer.msgpack.Serializer()
+        serialized = serializer.serialize(data)
+        deserialized = serializer.unserialize(memoryview(serialized))
+        self.assertEqual(deserialized, data)
+        self.assertEqual(type(deserialized['tuple']), tuple)
+        self.assertEqual(type(deserialized['tuple'][2]), list)
+        self.assertEqual(type(deserialized['bytes']), bytes)
+        self.assertEqual(deserialized['aware_datetime'].utcoffset(), datetime.timedelta(hours=2))
+
+        with self.assertRaises(TypeError):
+            serializer.serialize(object())
+
     def test_encoder(self):
         data = {
             'a': 1,
@@ -85,3 +122,130 @@ class EncoderTestCase(unittest.TestCase):
                 decoded = encoder_obj.decode(data=encoded)
 
                 self.assertEqual(decoded, data)
+
+    def test_envelope(self):
+        data = {
+            'a': 1,
+            'b': [1, 2, 3, 4],
+            'c': 'c' * 100,
+        }
+
+        consumer_encoder = encoder.encoder.Encoder(
+            compressor_name='dummy',
+            serializer_name='pickle',
+        )
+
+        for compressor_name, compressor_class in encoder.compressor.__compressors__.items():
+            producer_encoder = encoder.encoder.Encoder(
+                compressor_name=compressor_name,
+                serializer_name='pickle',
+            )
+
+            encoded = producer_encoder.encode(data=data)
+            self.assertEqual(encoded[0], encoder.encoder.Encoder.envelope_marker)
+            self.assertEqual(encoded[1] & 0x0f, compressor_class.id)
+            self.assertEqual(encoded[1] >> 4, encoder.serializer.pickle.Serializer.id)
+
+            decoded = consumer_encoder.decode(data=encoded)
+            self.assertEqual(decoded, data)
+
+    def test_envelope_legacy_data(self):
+        data = {
+            'a': 1,
+            'b': [1, 2, 3, 4],
+        }
+
+        encoder_obj = encoder.encoder.Encoder(
+            compressor_name='zlib',
+            serializer_name='pickle',
+        )
+
+        legacy_encoded = encoder.compressor.zlib.Compressor.compress(
+            data=encoder.serializer.pickle.Serializer.serialize(
+                data=data,
+            ),
+        )
+        self.assertEqual(encoder_obj.decode(data=legacy_encoded), data)
+
+        with self.assertRaises(ValueError):
+            encoder_obj.decode(data=b'\xc1\xff' + legacy_encoded)
+
+    def test_compression_levels(self):
+        data = b'abcdefgh' * 1000
+
+        compressors = [
+            encoder.compressor.bzip2.Compressor(),
+            encoder.compressor.gzip.Compressor(),
+            encoder.compressor.lzma.Compressor(),
+            encoder.compressor.zlib.Compressor(),
+        ]
+        for compressor in compressors:
+            for level in [0, 1, 9]:
+                if level == 0 and compressor.name == 'bzip2':
+                    continue
+
+                compressed = compressor.compress(
+                    data=data,
+                    level=level,
+                )
+                decompressed = compressor.decompress(compressed)
+                self.assertEqual(decompressed, data)
+
+    def test_adaptive_compression(self):
+        encoder_obj = encoder.encoder.Encoder(
+            compressor_name='zlib',
+            serializer_name='pickle',
+            compression_level=1,
+            adaptive_compression=True,
+            compression_threshold=100,
+        )
+
+        small_data = {
+            'a': 1,
+        }
+        large_data = {
+            'a': 'a' * 1000,
+        }
+        encoded_small_data = encoder_obj.encode(data=small_data)
+        self.assertEqual(encoded_small_data[1] & 0x0f, encoder.compressor.dummy.Compressor.id)
+        self.assertEqual(encoder_obj.decode(data=encoded_small_data), small_data)
+
+        encoded_large_data = encoder_obj.encode(data=large_data)
+        self.assertEqual(encoded_large_data[1] & 0x0f, encoder.compressor.zlib.Compressor.id)
+        self.assertEqual(encoder_obj.decode(data=encoded_large_data), large_data)
+
+        incompressible_data = {
+            'a': os.urandom(1000),
+        }
+        encoded_incompressible_data = encoder_obj.encode(data=incompressible_data)
+        self.assertEqual(encoded_incompressible_data[1] & 0x0f, encoder.compressor.dummy.Compressor.id)
+        self.assertEqual(encoder_obj.decode(data=encoded_incompressible_data), incompressible_data)
+
+        compression_statistics = encoder_obj.get_compression_statistics()
+        self.assertEqual(compression_statistics['compressed_payloads'], 1)
+        self.assertEqual(compression_statistics['raw_payloads'], 2)
+        self.assertGreater(compression_statistics['uncompressed_bytes'], 2000)
+        self.assertGreater(compression_statistics['compression_time'], 0.0)
+        self.assertLess(compression_statistics['compression_ratio'], 1.0)
+
+    def test_compression_statistics(self):
+        encoder_obj = encoder.encoder.Encoder(
+            compressor_name='zlib',
+            serializer_name='pickle',
+        )
+
+        small_data = {
+            'a': 1,
+        }
+        large_data = {
+            'a': 'a' * 1000,
+        }
+        encoder_obj.encode(data=small_data)
+        encoder_obj.encode(data=large_data)
+
+        compression_statistics = encoder_obj.get_compression_statistics()
+        self.assertEqual(compression_statistics['compressed_payloads'], 2)
+        self.assertEqual(compression_statistics['raw_payloads'], 0)
+        self.assertGreater(compression_statistics['uncompressed_bytes'], 1000)
+        self.assertGreater(compression_statistics['compression_time'], 0.0)
+        self.assertLess(compression_statistics['compression_ratio'], 1.0)
@@ -1,7 +1,11 @@
 import uuid
 import unittest
+import time
 import pickle
 import datetime
+import multiprocessing
+import os
+import signal
 
 from .. import connector
 from .. import queue
@@ -205,6 +209,334 @@ class QueueTestCase(unittest.TestCase):
             enqueued_value=self.enqueued_value,
         )
 
+    def test_reliable_queue(self):
+        queue_name = 'reliable_queue'
+        test_queue = queue.reliable.Queue(
+            connector=self.redis_connector,
+            encoder=encoder.encoder.Encoder(
+                compressor_name='dummy',
+                serializer_name='pickle',
+            ),
+            consumer_timeout=10.0,
+        )
+        other_test_queue = queue.reliable.Queue(
+            connector=self.redis_connector,
+            encoder=encoder.encoder.Encoder(
+                compressor_name='dummy',
+                serializer_name='pickle',
+            ),
+            consumer_timeout=10.0,
+        )
+        test_queue.flush(
+            queue_name=queue_name,
+        )
+        processing_queue_name = test_queue.get_processing_queue_name(
+            queue_name=queue_name,
+            consumer_id=test_queue.consumer_id,
+        )
+
+        test_queue.enqueue_bulk(
+            queue_name=queue_name,
+            values=[self.enqueued_value] * 10,
+        )
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=4,
+        )
+        self.assertEqual(values, [self.enqueued_value] * 4)
+        self.assertEqual(test_queue.len(queue_name=queue_name), 6)
+        self.assertEqual(self.redis_connector.len(processing_queue_name), 4)
+
+        requeued = other_test_queue.requeue_dead_consumers(
+            queue_name=queue_name,
+        )
+        self.assertEqual(requeued, 0)
+
+        test_queue.ack(
+            queue_name=queue_name,
+        )
+        self.assertEqual(self.redis_connector.len(processing_queue_name), 0)
+
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=4,
+        )
+        self.assertEqual(test_queue.len(queue_name=queue_name), 2)
+        self.assertEqual(self.redis_connector.len(processing_queue_name), 4)
+
+        self.redis_connector.key_del(
+            keys=[
+                test_queue.get_heartbeat_key_name(
+                    queue_name=queue_name,
+                    consumer_id=test_queue.consumer_id,
+                ),
+            ],
+        )
+        requeued = other_test_queue.requeue_dead_consumers(
+            queue_name=queue_name,
+        )
+        self.assertEqual(requeued, 4)
+        self.assertEqual(test_queue.len(queue_name=queue_name), 6)
+        self.assertEqual(self.redis_connector.len(processing_queue_name), 0)
+
+        test_queue.flush(
+            queue_name=queue_name,
+        )
+
+    def test_frame_queue(self):
+        queue_name = 'frame_queue'
+        test_queue = queue.regular.Queue(
+            connector=self.redis_connector,
+            encoder=encoder.encoder.Encoder(
+                compressor_name='zlib',
+                serializer_name='pickle',
+            ),
+            frame_size=10,
+        )
+        other_test_queue = queue.regular.Queue(
+            connector=self.redis_connector,
+            encoder=encoder.encoder.Encoder(
+                compressor_name='dummy',
+                serializer_name='pickle',
+            ),
+            frame_size=10,
+        )
+        test_queue.flush(
+            queue_name=queue_name,
+        )
+
+        enqueued_values = [
+            {
+                'index': index,
+            }
+            for index in range(25)
+        ]
+        test_queue.enqueue_bulk(
+            queue_name=queue_name,
+            values=enqueued_values,
+        )
+        self.assertEqual(test_queue.len(queue_name=queue_name), 25)
+        self.assertEqual(self.redis_connector.len(queue_name), 3)
+
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=4,
+        )
+        self.assertEqual(values, enqueued_values[:4])
+        self.assertEqual(test_queue.len(queue_name=queue_name), 15)
+        self.assertEqual(test_queue.last_known_len(queue_name=queue_name), 21)
+        self.assertEqual(self.redis_connector.len(queue_name), 2)
+
+        value = test_queue.dequeue(
+            queue_name=queue_name,
+        )
+        self.assertEqual(value, enqueued_values[4])
+
+        values = other_test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=12,
+        )
+        self.assertEqual(values, enqueued_values[10:22])
+        self.assertEqual(test_queue.len(queue_name=queue_name), 0)
+
+        requeued = test_queue.requeue_buffered(
+            queue_name=queue_name,
+        )
+        self.assertEqual(requeued, 5)
+        self.assertEqual(test_queue.len(queue_name=queue_name), 5)
+
+        values = other_test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=100,
+        )
+        self.assertEqual(values, enqueued_values[22:] + enqueued_values[5:10])
+        self.assertEqual(test_queue.len(queue_name=queue_name), 0)
+
+        test_queue.enqueue(
+            queue_name=queue_name,
+            value=enqueued_values[0],
+        )
+        self.assertEqual(test_queue.len(queue_name=queue_name), 1)
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=10,
+        )
+        self.assertEqual(values, enqueued_values[:1])
+        self.assertEqual(test_queue.len(queue_name=queue_name), 0)
+
+        test_queue.enqueue_bulk(
+            queue_name=queue_name,
+            values=enqueued_values[:5],
+            priorities=[0, 0, 1, 1, 1],
+        )
+        self.assertEqual(test_queue.len(queue_name=queue_name), 5)
+        self.assertEqual(self.redis_connector.len(queue_name), 2)
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=10,
+        )
+        self.assertEqual(values, enqueued_values[:2])
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=10,
+        )
+        self.assertEqual(values, enqueued_values[2:5])
+
+        self.assertEqual(
+            pickle.loads(pickle.dumps(test_queue)).frame_size,
+            10,
+        )
+
+        test_queue.flush(
+            queue_name=queue_name,
+        )
+
+    def test_stream_queue(self):
+        queue_name = 'stream_queue'
+        test_queue = queue.stream.Queue(
+            connector=self.redis_connector,
+            encoder=encoder.encoder.Encoder(
+                compressor_name='dummy',
+                serializer_name='pickle',
+            ),
+            consumer_timeout=0.5,
+        )
+        other_test_queue = queue.stream.Queue(
+            connector=self.redis_connector,
+            encoder=encoder.encoder.Encoder(
+                compressor_name='dummy',
+                serializer_name='pickle',
+            ),
+            consumer_timeout=0.5,
+        )
+        test_queue.flush(
+            queue_name=queue_name,
+        )
+
+        test_queue.enqueue_bulk(
+            queue_name=queue_name,
+            values=[self.enqueued_value] * 10,
+        )
+        self.assertEqual(test_queue.len(queue_name=queue_name), 10)
+
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=4,
+        )
+        self.assertEqual(values, [self.enqueued_value] * 4)
+        values = other_test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=4,
+        )
+        self.assertEqual(values, [self.enqueued_value] * 4)
+
+        self.assertEqual(test_queue.len(queue_name=queue_name), 2)
+
+        test_queue.ack(
+            queue_name=queue_name,
+        )
+        self.assertEqual(test_queue.len(queue_name=queue_name), 2)
+
+        requeued = test_queue.requeue_dead_consumers(
+            queue_name=queue_name,
+        )
+        self.assertEqual(requeued, 0)
+
+        time.sleep(0.6)
+        requeued = test_queue.requeue_dead_consumers(
+            queue_name=queue_name,
+        )
+        self.assertEqual(requeued, 4)
+        other_test_queue.ack(
+            queue_name=queue_name,
+        )
+        self.assertEqual(test_queue.len(queue_name=queue_name), 6)
+
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=10,
+        )
+        self.assertEqual(values, [self.enqueued_value] * 6)
+        test_queue.ack(
+            queue_name=queue_name,
+        )
+        self.assertEqual(test_queue.len(queue_name=queue_name), 0)
+
+        before = time.time()
+        value = test_queue.dequeue(
+            queue_name=queue_name,
+            timeout=0.5,
+        )
+        after = time.time()
+        self.assertEqual(value, {})
+        self.assertGreaterEqual(after - before, 0.4)
+
+        test_queue.flush(
+            queue_name=queue_name,
+        )
+
+    def test_stream_queue_dead_consumer(self):
+        queue_name = 'stream_dead_consumer_queue'
+        test_queue = queue.stream.Queue(
+            connector=self.redis_connector,
+            encoder=encoder.encoder.Encoder(
+                compressor_name='dummy',
+                serializer_name='pickle',
+            ),
+            consumer_timeout=0.5,
+        )
+        test_queue.flush(
+            queue_name=queue_name,
+        )
+        test_queue.enqueue_bulk(
+            queue_name=queue_name,
+            values=list(range(10)),
+        )
+
+        batch_dequeued = multiprocessing.Event()
+        consumer_process = multiprocessing.Process(
+            target=consume_and_hang,
+            kwargs={
+                'test_queue': test_queue,
+                'queue_name': queue_name,
+                'count': 6,
+                'batch_dequeued': batch_dequeued,
+            },
+        )
+        consumer_process.start()
+        self.assertTrue(batch_dequeued.wait(timeout=10))
+        os.kill(consumer_process.pid, signal.SIGKILL)
+        consumer_process.join()
+
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=10,
+        )
+        self.assertEqual(values, list(range(6, 10)))
+        test_queue.ack(
+            queue_name=queue_name,
+        )
+
+        time.sleep(0.6)
+        requeued = test_queue.requeue_dead_consumers(
+            queue_name=queue_name,
+        )
+        self.assertEqual(requeued, 6)
+
+        values = test_queue.dequeue_bulk(
+            queue_name=queue_name,
+            count=10,
+        )
+        self.assertEqual(sorted(values), list(range(6)))
+        test_queue.ack(
+            queue_name=queue_name,
+        )
+        self.assertEqual(test_queue.len(queue_name=queue_name), 0)
+
+        test_queue.flush(
+            queue_name=queue_name,
+        )
+
     def queue_functionality(self, queue_name, test_queue, enqueued_value):
         test_queue.flush(
             queue_name=queue_name,
@@ -356,3 +688,13 @@ class QueueTestCase(unittest.TestCase):
             value=self.test_set_value,
         )
         self.assertFalse(removed)
+
+
+def consume_and_hang(test_queue, queue_name, count, batch_dequeued):
+    test_queue.dequeue_bulk(
+        queue_name=queue_name,
+        count=count,
+    )
+    batch_dequeued.set()
+
+    time.sleep(60)
@@ -1,5 +1,7 @@
 import unittest
 import pickle
+import threading
+import time
 
 from .. import connector
 
@@ -97,6 +99,208 @@ class RedisConnectorTestCase(unittest.TestCase):
         )
         self.assertFalse(removed)
 
+    def test_connector_pop_bulk_with_len(self):
+        values, remaining = self.redis_connector.pop_bulk_with_len(
+            key=self.test_key,
+            count=10,
+        )
+        self.assertEqual(values, [])
+        self.assertEqual(remaining, 0)
+
+        self.redis_connector.push_bulk(
+            key=self.test_key,
+            values=[self.test_value] * 15,
+        )
+        values, remaining = self.redis_connector.pop_bulk_with_len(
+            key=self.test_key,
+            count=10,
+        )
+        self.assertEqual(values, [self.test_value] * 10)
+        self.assertEqual(remaining, 5)
+
+        values, remaining = self.redis_connector.pop_bulk_with_len(
+            key=self.test_key,
+            count=10,
+        )
+        self.assertEqual(values, [self.test_value] * 5)
+        self.assertEqual(remaining, 0)
+        self.assertEqual(self.redis_connector.len(self.test_key), 0)
+
+        for connection in self.redis_connector.connections:
+            connection.rpush(self.test_key, *[self.test_value] * 10)
+        values, remaining = self.redis_connector.pop_bulk_with_len(
+            key=self.test_key,
+            count=5,
+        )
+        self.assertEqual(values, [self.test_value] * 5)
+        self.assertEqual(remaining, 15)
+        self.redis_connector.delete(
+            key=self.test_key,
+        )
+
+    def test_connector_priority_pop_bulk(self):
+        low_connection, high_connection = self.redis_connector.connections
+        self.redis_connector.priority_push_bulk(
+            key=self.test_key,
+            values=[b'low'] * 3,
+            priorities=[1] * 3,
+        )
+        self.redis_connector.connections = [
+            high_connection,
+            low_connection,
+        ]
+        self.redis_connector.priority_push_bulk(
+            key=self.test_key,
+            values=[b'high'] * 2,
+            priorities=[9] * 2,
+        )
+
+        self.redis_connector.connections = [
+            low_connection,
+            high_connection,
+        ]
+        values = self.redis_connector.priority_pop_bulk(
+            key=self.test_key,
+            count=3,
+        )
+        self.assertEqual(values, [b'high', b'high', b'low'])
+        self.assertEqual(self.redis_connector.priority_len(self.test_key), 2)
+
+        values = self.redis_connector.priority_pop_bulk(
+            key=self.test_key,
+            count=3,
+        )
+        self.assertEqual(values, [b'low', b'low'])
+
+        values = self.redis_connector.priority_pop_bulk(
+            key=self.test_key,
+            count=3,
+            timeout=0.2,
+        )
+        self.assertEqual(values, [])
+        self.redis_connector.delete(
+            key=self.test_key,
+        )
+
+    def test_connector_push_front(self):
+        for connection in self.redis_connector.connections:
+            connection.rpush(self.test_key, self.test_value)
+
+        for i in range(2):
+            self.redis_connector.push_front(
+                key=self.test_key,
+                value=b'front',
+            )
+
+        for connection in self.redis_connector.connections:
+            self.assertEqual(connection.lindex(self.test_key, 0), b'front')
+            self.assertEqual(connection.llen(self.test_key), 2)
+
+        self.redis_connector.delete(
+            key=self.test_key,
+        )
+
+    def test_connector_delayed(self):
+        delayed_key = '{key}.delayed'.format(
+            key=self.test_key,
+        )
+        self.redis_connector.delete(
+            key=delayed_key,
+        )
+        self.redis_connector.delete(
+            key=self.test_key,
+        )
+
+        now = time.time()
+        self.redis_connector.delayed_push_bulk(
+            key=delayed_key,
+            values=[self.test_value] * 3,
+            due_times=[now - 1, now - 1, now + 60],
+        )
+        self.assertEqual(self.redis_connector.delayed_len(delayed_key), 3)
+
+        moved = self.redis_connector.delayed_move_due(
+            key=delayed_key,
+            destination=self.test_key,
+            now=now,
+            count=1,
+        )
+        self.assertEqual(moved, 1)
+        moved = self.redis_connector.delayed_move_due(
+            key=delayed_key,
+            destination=self.test_key,
+            now=now,
+            count=10,
+        )
+        self.assertEqual(moved, 1)
+        self.assertEqual(self.redis_connector.len(self.test_key), 2)
+        self.assertEqual(self.redis_connector.delayed_len(delayed_key), 1)
+
+        values = self.redis_connector.delayed_pop_due(
+            key=delayed_key,
+            now=now + 120,
+            count=10,
+        )
+        self.assertEqual(values, [self.test_value])
+        self.assertEqual(self.redis_connector.delayed_len(delayed_key), 0)
+
+        self.redis_connector.delete(
+            key=self.test_key,
+        )
+
+    def test_connector_blocking_pop(self):
+        returned_value = self.redis_connector.pop(
+            key=self.test_key,
+            timeout=0.5,
+        )
+        self.assertIsNone(returned_value)
+
+        values = self.redis_connector.pop_bulk(
+            key=self.test_key,
+            count=10,
+            timeout=0.5,
+        )
+        self.assertEqual(values, [])
+
+        pusher_thread = threading.Timer(
+            interval=0.2,
+            function=self.redis_connector.push_bulk,
+            kwargs={
+                'key': self.test_key,
+                'values': [self.test_value] * 5,
+            },
+        )
+        pusher_thread.start()
+
+        before = time.time()
+        values = self.redis_connector.pop_bulk(
+            key=self.test_key,
+            count=10,
+            timeout=5,
+        )
+        after = time.time()
+
+        self.assertEqual(values, [self.test_value] * 5)
+        self.assertLess(after - before, 2.0)
+        self.assertEqual(self.redis_connector.len(self.test_key), 0)
+
+        pusher_thread = threading.Timer(
+            interval=0.2,
+            function=self.redis_connector.push,
+            kwargs={
+                'key': self.test_key,
+                'value': self.test_value,
+            },
+        )
+        pusher_thread.start()
+
+        returned_value = self.redis_connector.pop(
+            key=self.test_key,
+            timeout=5,
+        )
+        self.assertEqual(returned_value, self.test_value)
+        self.assertEqual(self.redis_connector.len(self.test_key), 0)
+
     def test_connector_pickleability(self):
         pickled_connector = pickle.dumps(self.redis_connector)
         pickled_connector = pickle.loads(pickled_connector)
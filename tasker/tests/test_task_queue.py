@@ -1,9 +1,11 @@
 import unittest
+import pickle
 import datetime
 import threading
 import time
 
 from .. import task_queue
+from .. import task_record
 from .. import connector
 from .. import queue
 from .. import encoder
@@ -117,6 +119,7 @@ class RedisTaskQueueTestCase:
                 'kwargs': {},
                 'run_count': 0,
                 'completion_key': None,
+                'priority': 0,
             }
         )
 
@@ -147,9 +150,105 @@ class RedisTaskQueueTestCase:
                     'b': 2,
                 },
                 'run_count': 0,
+                'priority': 0,
             }
         )
 
+    def test_task_record(self):
+        task = self.test_task_queue.craft_task(
+            task_name='test_task',
+            args=(1, 2),
+            kwargs={},
+            report_completion=False,
+        )
+        record = task.to_record()
+        self.assertEqual(len(record), 3)
+        self.assertEqual(record[1:], [task['date'], (1, 2)])
+        self.assertEqual(
+            task_record.TaskRecord.from_record(
+                record=record,
+                name='test_task',
+            ),
+            task,
+        )
+
+        task = self.test_task_queue.craft_task(
+            task_name='test_task',
+            args=(),
+            kwargs={
+                'a': 1,
+            },
+            report_completion=True,
+            priority=3,
+        )
+        task['run_count'] += 2
+        record = task.to_record()
+        self.assertEqual(len(record), 7)
+        self.assertEqual(
+            task_record.TaskRecord.from_record(
+                record=record,
+                name='test_task',
+            ),
+            task,
+        )
+
+        legacy_task = {
+            'name': 'test_task',
+            'date': task['date'],
+            'args': (),
+            'kwargs': {
+                'a': 1,
+            },
+            'run_count': 2,
+            'completion_key': task['completion_key'],
+            'priority': 3,
+        }
+        self.assertEqual(
+            task_record.TaskRecord.from_record(
+                record=legacy_task,
+                name='test_task',
+            ),
+            task,
+        )
+
+        self.assertIn('kwargs', task)
+        self.assertEqual(task.get('missing', 5), 5)
+        with self.assertRaises(KeyError):
+            task['missing']
+
+        with self.assertRaises(ValueError):
+            task_record.TaskRecord.from_record(
+                record=(0xf0, 0, ()),
+                name='test_task',
+            )
+
+        task['trace_id'] = 'abc'
+        self.assertIn('trace_id', task)
+        self.assertEqual(task['trace_id'], 'abc')
+        self.assertEqual(task.get('trace_id'), 'abc')
+        record = task.to_record()
+        self.assertEqual(len(record), 8)
+        unpacked_task = task_record.TaskRecord.from_record(
+            record=record,
+            name='test_task',
+        )
+        self.assertEqual(unpacked_task, task)
+        self.assertEqual(unpacked_task.copy(), task)
+        self.assertEqual(pickle.loads(pickle.dumps(task)), task)
+
+        legacy_task['trace_id'] = 'abc'
+        self.assertEqual(
+            task_record.TaskRecord.from_record(
+                record=legacy_task,
+                name='test_task',
+            ),
+            task,
+        )
+
+        self.assertEqual(task.pop('trace_id'), 'abc')
+        self.assertNotIn('trace_id', task)
+        self.assertEqual(len(task.to_record()), 7)
+
     def test_report_complete(self):
         self.test_task_queue.purge_tasks(
             task_name='test_task',
@@ -177,6 +276,31 @@ class RedisTaskQueueTestCase:
             )
         )
 
+    def test_report_complete_many(self):
+        self.test_task_queue.purge_tasks(
+            task_name='test_task',
+        )
+        tasks = [
+            self.test_task_queue.craft_task(
+                task_name='test_task',
+                args=(),
+                kwargs={},
+                report_completion=report_completion,
+            )
+            for report_completion in [True, True, False]
+        ]
+        removed = self.test_task_queue.report_complete_many(
+            tasks=tasks,
+        )
+        self.assertEqual(removed, 2)
+        for task in tasks[:2]:
+            self.assertFalse(
+                self.test_task_queue.queue.has_result(
+                    queue_name='test_task',
+                    value=task['completion_key'],
+                )
+            )
+
     def test_wait_task_finished(self):
         self.test_task_queue.purge_tasks(
             task_name='test_task',
@@ -253,15 +377,18 @@ class RedisTaskQueueTestCase:
         self.test_task_queue.apply_async_one(task_one)
         self.test_task_queue.apply_async_one(task_two)
         self.test_task_queue.apply_async_one(task_three)
-        task_one_test = self.test_task_queue.queue.dequeue(
-            queue_name='test_task',
-        )
-        task_two_test = self.test_task_queue.queue.dequeue(
-            queue_name='test_task',
-        )
-        task_three_test = self.test_task_queue.queue.dequeue(
-            queue_name='test_task',
-        )
+        task_one_test = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=1,
+        )[0]
+        task_two_test = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=1,
+        )[0]
+        task_three_test = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=1,
+        )[0]
         if self.order_matters:
             self.assertEqual(task_one, task_one_test)
             self.assertEqual(task_two, task_two_test)
@@ -344,15 +471,18 @@ class RedisTaskQueueTestCase:
                 task_three,
             ]
         )
-        task_one_test = self.test_task_queue.queue.dequeue(
-            queue_name='test_task_one',
-        )
-        task_two_test = self.test_task_queue.queue.dequeue(
-            queue_name='test_task_one',
-        )
-        task_three_test = self.test_task_queue.queue.dequeue(
-            queue_name='test_task_two',
-        )
+        task_one_test = self.test_task_queue.get_tasks(
+            task_name='test_task_one',
+            number_of_tasks=1,
+        )[0]
+        task_two_test = self.test_task_queue.get_tasks(
+            task_name='test_task_one',
+            number_of_tasks=1,
+        )[0]
+        task_three_test = self.test_task_queue.get_tasks(
+            task_name='test_task_two',
+            number_of_tasks=1,
+        )[0]
 
         if self.order_matters:
             self.assertEqual(task_one, task_one_test)
@@ -474,15 +604,107 @@ class RedisTaskQueueTestCase:
         )
         self.assertEqual(task_one['run_count'], 0)
         self.test_task_queue.apply_async_one(task_one)
-        task_one = self.test_task_queue.queue.dequeue(
-            queue_name='test_task',
-        )
+        task_one = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=1,
+        )[0]
 
         self.test_task_queue.retry(task_one)
-        task_one = self.test_task_queue.queue.dequeue(
+        task_one = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=1,
+        )[0]
+        self.assertEqual(task_one['run_count'], 1)
+
+    def test_delayed_tasks(self):
+        self.test_task_queue.purge_tasks(
+            task_name='test_task',
+        )
+        task_one = self.test_task_queue.craft_task(
+            task_name='test_task',
+            args=(1,),
+            kwargs={},
+            report_completion=False,
+        )
+        task_two = self.test_task_queue.craft_task(
+            task_name='test_task',
+            args=(2,),
+            kwargs={},
+            report_completion=False,
+        )
+        task_three = self.test_task_queue.craft_task(
+            task_name='test_task',
+            args=(3,),
+            kwargs={},
+            report_completion=False,
+        )
+        self.test_task_queue.apply_async_one(
+            task=task_one,
+            countdown=60,
+        )
+        self.test_task_queue.apply_async_one(
+            task=task_two,
+            eta=datetime.datetime.now() - datetime.timedelta(
+                seconds=1,
+            ),
+        )
+        self.test_task_queue.apply_async_many(
+            tasks=[
+                task_three,
+            ],
+            eta=time.time() + 60,
+        )
+        self.assertEqual(
+            first=self.test_task_queue.queue.delayed_len(
+                queue_name='test_task',
+            ),
+            second=3,
+        )
+        self.assertEqual(
+            first=self.test_task_queue.number_of_enqueued_tasks(
+                task_name='test_task',
+            ),
+            second=0,
+        )
+
+        promoted = self.test_task_queue.queue.promote_delayed(
             queue_name='test_task',
+            force=True,
+        )
+        self.assertEqual(promoted, 1)
+        self.assertEqual(
+            first=self.test_task_queue.queue.delayed_len(
+                queue_name='test_task',
+            ),
+            second=2,
+        )
+
+        tasks = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=3,
+        )
+        self.assertEqual(tasks, [task_two])
+
+        self.test_task_queue.retry(
+            task=tasks[0],
+            countdown=60,
+        )
+        self.assertEqual(
+            first=self.test_task_queue.queue.delayed_len(
+                queue_name='test_task',
+            ),
+            second=3,
+        )
+
+        self.test_task_queue.purge_tasks(
+            task_name='test_task',
+        )
+        self.assertEqual(
+            first=self.test_task_queue.queue.delayed_len(
+                queue_name='test_task',
+            ),
+            second=0,
         )
-        self.assertEqual(task_one['run_count'], 1)
 
     def test_requeue(self):
         self.test_task_queue.purge_tasks(
@@ -496,14 +718,16 @@ class RedisTaskQueueTestCase:
         )
         self.assertEqual(task_one['run_count'], 0)
         self.test_task_queue.apply_async_one(task_one)
-        task_one = self.test_task_queue.queue.dequeue(
-            queue_name='test_task',
-        )
+        task_one = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=1,
+        )[0]
 
         self.test_task_queue.requeue(task_one)
-        task_one = self.test_task_queue.queue.dequeue(
-            queue_name='test_task',
-        )
+        task_one = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=1,
+        )[0]
         self.assertEqual(task_one['run_count'], 0)
 
 
@@ -537,6 +761,68 @@ class RedisSingleServerTaskQueueTestCase(
         )
 
 
+class RedisSingleServerPriorityTaskQueueTestCase(
+    RedisTaskQueueTestCase,
+    unittest.TestCase,
+):
+    order_matters = True
+
+    def setUp(self):
+        redis_connector = connector.redis.Connector(
+            host='127.0.0.1',
+            port=6379,
+            password='e082ebf6c7fff3997c4bb1cb64d6bdecd0351fa270402d98d35acceef07c6b97',
+            database=0,
+        )
+
+        test_queue = queue.priority.Queue(
+            connector=redis_connector,
+            encoder=encoder.encoder.Encoder(
+                compressor_name='dummy',
+                serializer_name='pickle',
+            ),
+        )
+        self.test_task_queue = task_queue.TaskQueue(
+            queue=test_queue,
+        )
+
+    def test_priority_order(self):
+        self.test_task_queue.purge_tasks(
+            task_name='test_task',
+        )
+
+        tasks = []
+        for priority in [0, 5, 0, 9, 5]:
+            tasks.append(
+                self.test_task_queue.craft_task(
+                    task_name='test_task',
+                    args=(priority, len(tasks)),
+                    priority=priority,
+                )
+            )
+        self.test_task_queue.apply_async_many(tasks[:3])
+        self.test_task_queue.apply_async_one(tasks[3])
+        self.test_task_queue.apply_async_one(tasks[4])
+
+        pulled_tasks = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=3,
+        )
+        self.assertEqual(
+            [task['args'] for task in pulled_tasks],
+            [(9, 3), (5, 1), (5, 4)],
+        )
+
+        pulled_tasks = self.test_task_queue.get_tasks(
+            task_name='test_task',
+            number_of_tasks=10,
+        )
+        self.assertEqual(
+            [task['args'] for task in pulled_tasks],
+            [(0, 0), (0, 2)],
+        )
+
+
 class RedisClusterSingleServerTaskQueueTestCase(
     RedisTaskQueueTestCase,
     unittest.TestCase,
@@ -1,4 +1,6 @@
 import unittest
+import asyncio
+import os
 import time
 import multiprocessing
 import logging
@@ -122,6 +124,110 @@ class SingleServerThreadedEventsTestWorker(EventsTestWorker):
     )
 
 
+class SingleServerAsyncioEventsTestWorker(EventsTestWorker):
+    name = 'events_test_worker'
+
+    config = EventsTestWorker.config.copy()
+    config.update(
+        {
+            'connector': {
+                'type': 'redis',
+                'params': {
+                    'host': 'localhost',
+                    'port': 6379,
+                    'password': 'e082ebf6c7fff3997c4bb1cb64d6bdecd0351fa270402d98d35acceef07c6b97',
+                    'database': 0,
+                },
+            },
+            'executor': {
+                'type': 'asyncio',
+                'concurrency': 10,
+            },
+        }
+    )
+
+    async def work(self, action):
+        if action == 'timed_out':
+            await asyncio.sleep(3)
+        elif action == 'report_completion':
+            await asyncio.sleep(2)
+        else:
+            return super().work(action)
+
+
+class SingleServerProcessEventsTestWorker(EventsTestWorker):
+    name = 'events_test_worker'
+
+    config = EventsTestWorker.config.copy()
+    config.update(
+        {
+            'connector': {
+                'type': 'redis',
+                'params': {
+                    'host': 'localhost',
+                    'port': 6379,
+                    'password': 'e082ebf6c7fff3997c4bb1cb64d6bdecd0351fa270402d98d35acceef07c6b97',
+                    'database': 0,
+                },
+            },
+            'executor': {
+                'type': 'process',
+                'concurrency': 2,
+            },
+        }
+    )
+
+
+class SingleServerReliableEventsTestWorker(EventsTestWorker):
+    name = 'events_test_worker'
+
+    config = EventsTestWorker.config.copy()
+    config.update(
+        {
+            'connector': {
+                'type': 'redis',
+                'params': {
+                    'host': 'localhost',
+                    'port': 6379,
+                    'password': 'e082ebf6c7fff3997c4bb1cb64d6bdecd0351fa270402d98d35acceef07c6b97',
+                    'database': 0,
+                },
+            },
+            'queue': {
+                'type': 'reliable',
+                'params': {
+                    'consumer_timeout': 10.0,
+                },
+            },
+        }
+    )
+
+
+class SingleServerStreamEventsTestWorker(EventsTestWorker):
+    name = 'events_test_worker'
+
+    config = EventsTestWorker.config.copy()
+    config.update(
+        {
+            'connector': {
+                'type': 'redis',
+                'params': {
+                    'host': 'localhost',
+                    'port': 6379,
+                    'password': 'e082ebf6c7fff3997c4bb1cb64d6bdecd0351fa270402d98d35acceef07c6b97',
+                    'database': 0,
+                },
+            },
+            'queue': {
+                'type': 'stream',
+                'params': {
+                    'consumer_timeout': 10.0,
+                },
+            },
+        }
+    )
+
+
 class SingleServerClusterEventsTestWorker(EventsTestWorker):
     name = 'events_test_worker'
 
@@ -174,6 +280,251 @@ class MultiServerClusterEventsTestWorker(EventsTestWorker):
     )
 
 
+class MultiServerClusterStreamEventsTestWorker(MultiServerClusterEventsTestWorker):
+    name = 'events_test_worker'
+
+    config = MultiServerClusterEventsTestWorker.config.copy()
+    config.update(
+        {
+            'queue': {
+                'type': 'stream',
+                'params': {
+                    'consumer_timeout': 10.0,
+                },
+            },
+        }
+    )
+
+
+class SingleServerBatchTestWorker(SingleServerEventsTestWorker):
+    name = 'batch_test_worker'
+
+    config = SingleServerEventsTestWorker.config.copy()
+    config.update(
+        {
+            'max_tasks_per_run': 4,
+            'max_retries': 3,
+            'tasks_per_transaction': 4,
+        }
+    )
+
+    def init(self):
+        super().init()
+
+        self.batch_sizes = []
+        self.success_count = 0
+        self.failure_count = 0
+        self.retry_count = 0
+
+    def work_batch(self, tasks):
+        self.batch_sizes.append(len(tasks))
+
+        outcomes = []
+        for task in tasks:
+            action = task['kwargs']['action']
+            if action == 'succeeded':
+                outcomes.append('success')
+            elif action == 'failed':
+                outcomes.append(Exception())
+            elif action == 'retried':
+                outcomes.append(worker.WorkerRetry())
+            elif action == 'requeued':
+                outcomes.append(worker.WorkerRequeue())
+
+        return outcomes
+
+    def on_success(self, returned_value, args, kwargs):
+        self.success_count += 1
+
+    def on_failure(self, exception, exception_traceback, args, kwargs):
+        self.failure_count += 1
+
+    def on_retry(self, exception, exception_traceback, args, kwargs):
+        self.retry_count += 1
+
+
+class BatchWorkerTestCase(
+    unittest.TestCase,
+):
+    @classmethod
+    def setUpClass(self):
+        self.batch_test_worker = SingleServerBatchTestWorker()
+        self.batch_test_worker.init_worker()
+        self.batch_test_worker.purge_tasks()
+
+    @classmethod
+    def tearDownClass(self):
+        self.batch_test_worker.purge_tasks()
+
+    def test_work_batch(self):
+        self.batch_test_worker.purge_tasks()
+        tasks = [
+            self.batch_test_worker.craft_task(
+                action=action,
+            )
+            for action in [
+                'succeeded',
+                'failed',
+                'retried',
+                'requeued',
+            ]
+        ]
+        self.batch_test_worker.apply_async_many(
+            tasks=tasks,
+        )
+
+        self.batch_test_worker.work_loop()
+        self.assertEqual(self.batch_test_worker.batch_sizes, [4])
+        self.assertEqual(self.batch_test_worker.success_count, 1)
+        self.assertEqual(self.batch_test_worker.failure_count, 1)
+        self.assertEqual(self.batch_test_worker.retry_count, 1)
+        self.assertTrue(self.batch_test_worker.requeued)
+        self.assertEqual(
+            self.batch_test_worker.number_of_enqueued_tasks(),
+            2,
+        )
+        for task in tasks[:3]:
+            self.assertFalse(
+                self.batch_test_worker.task_queue.queue.has_result(
+                    queue_name=self.batch_test_worker.name,
+                    value=task['completion_key'],
+                )
+            )
+        self.assertTrue(
+            self.batch_test_worker.task_queue.queue.has_result(
+                queue_name=self.batch_test_worker.name,
+                value=tasks[3]['completion_key'],
+            )
+        )
+
+    def test_work_batch_unsupported_executor(self):
+        threaded_batch_test_worker = SingleServerBatchTestWorker()
+        threaded_batch_test_worker.config['executor'] = {
+            'type': 'threaded',
+            'concurrency': 2,
+        }
+
+        with self.assertRaises(worker.WorkerException):
+            threaded_batch_test_worker.init_worker()
+
+
+class SingleServerPrefetchTestWorker(SingleServerEventsTestWorker):
+    name = 'prefetch_test_worker'
+
+    config = SingleServerEventsTestWorker.config.copy()
+    config.update(
+        {
+            'max_tasks_per_run': 3,
+            'tasks_per_transaction': 2,
+            'prefetch_batches': 2,
+            'report_completion': False,
+        }
+    )
+
+    def init(self):
+        super().init()
+
+        self.executed_count = 0
+
+    def work(self, action):
+        self.executed_count += 1
+
+
+class PrefetchWorkerTestCase(
+    unittest.TestCase,
+):
+    @classmethod
+    def setUpClass(self):
+        self.prefetch_test_worker = SingleServerPrefetchTestWorker()
+        self.prefetch_test_worker.init_worker()
+        self.prefetch_test_worker.purge_tasks()
+
+    @classmethod
+    def tearDownClass(self):
+        self.prefetch_test_worker.purge_tasks()
+
+    def test_prefetched_tasks_requeued(self):
+        self.prefetch_test_worker.purge_tasks()
+        self.prefetch_test_worker.apply_async_many(
+            tasks=[
+                self.prefetch_test_worker.craft_task(
+                    action='succeeded',
+                )
+                for i in range(8)
+            ],
+        )
+
+        self.prefetch_test_worker.work_loop()
+        self.assertEqual(self.prefetch_test_worker.executed_count, 3)
+        self.assertEqual(
+            self.prefetch_test_worker.number_of_enqueued_tasks(),
+            5,
+        )
+
+
+class SingleServerCrashingProcessTestWorker(SingleServerProcessEventsTestWorker):
+    name = 'crashing_process_test_worker'
+
+    config = SingleServerProcessEventsTestWorker.config.copy()
+    config.update(
+        {
+            'max_tasks_per_run': 2,
+            'tasks_per_transaction': 1,
+            'report_completion': False,
+        }
+    )
+
+    def init(self):
+        super().init()
+
+        self.failure_count = 0
+
+    def work(self, action):
+        if action == 'crashed':
+            os._exit(1)
+
+        return super().work(action)
+
+    def on_failure(self, exception, exception_traceback, args, kwargs):
+        self.failure_count += 1
+
+
+class ProcessWorkerTestCase(
+    unittest.TestCase,
+):
+    @classmethod
+    def setUpClass(self):
+        self.crashing_test_worker = SingleServerCrashingProcessTestWorker()
+        self.crashing_test_worker.init_worker()
+        self.crashing_test_worker.purge_tasks()
+
+    @classmethod
+    def tearDownClass(self):
+        self.crashing_test_worker.purge_tasks()
+
+    def test_crashed_child_process(self):
+        self.crashing_test_worker.purge_tasks()
+        self.crashing_test_worker.apply_async_many(
+            tasks=[
+                self.crashing_test_worker.craft_task(
+                    action=action,
+                )
+                for action in [
+                    'crashed',
+                    'succeeded',
+                ]
+            ],
+        )
+
+        self.crashing_test_worker.work_loop()
+        self.assertEqual(self.crashing_test_worker.failure_count, 1)
+        self.assertTrue(self.crashing_test_worker.succeeded)
+        self.assertEqual(
+            self.crashing_test_worker.number_of_enqueued_tasks(),
+            0,
+        )
+
+
 class WorkerTestCase:
     def test_success_event(self):
         self.events_test_worker.purge_tasks()
@@ -372,6 +723,66 @@ class SingleServerThreadedWorkerTestCase(
         self.events_test_worker.purge_tasks()
 
 
+class SingleServerAsyncioWorkerTestCase(
+    WorkerTestCase,
+    unittest.TestCase,
+):
+    @classmethod
+    def setUpClass(self):
+        self.events_test_worker = SingleServerAsyncioEventsTestWorker()
+        self.events_test_worker.init_worker()
+        self.events_test_worker.purge_tasks()
+
+    @classmethod
+    def tearDownClass(self):
+        self.events_test_worker.purge_tasks()
+
+
+class SingleServerProcessWorkerTestCase(
+    WorkerTestCase,
+    unittest.TestCase,
+):
+    @classmethod
+    def setUpClass(self):
+        self.events_test_worker = SingleServerProcessEventsTestWorker()
+        self.events_test_worker.init_worker()
+        self.events_test_worker.purge_tasks()
+
+    @classmethod
+    def tearDownClass(self):
+        self.events_test_worker.purge_tasks()
+
+
+class SingleServerReliableWorkerTestCase(
+    WorkerTestCase,
+    unittest.TestCase,
+):
+    @classmethod
+    def setUpClass(self):
+        self.events_test_worker = SingleServerReliableEventsTestWorker()
+        self.events_test_worker.init_worker()
+        self.events_test_worker.purge_tasks()
+
+    @classmethod
+    def tearDownClass(self):
+        self.events_test_worker.purge_tasks()
+
+
+class SingleServerStreamWorkerTestCase(
+    WorkerTestCase,
+    unittest.TestCase,
+):
+    @classmethod
+    def setUpClass(self):
+        self.events_test_worker = SingleServerStreamEventsTestWorker()
+        self.events_test_worker.init_worker()
+        self.events_test_worker.purge_tasks()
+
+    @classmethod
+    def tearDownClass(self):
+        self.events_test_worker.purge_tasks()
+
+
 class SingleServerClusterWorkerTestCase(
     WorkerTestCase,
     unittest.TestCase,
@@ -400,3 +811,18 @@ class MultipleServerClusterWorkerTestCase(
     @classmethod
     def tearDownClass(self):
         self.events_test_worker.purge_tasks()
+
+
+class MultipleServerClusterStreamWorkerTestCase(
+    WorkerTestCase,
+    unittest.TestCase,
+):
+    @classmethod
+    def setUpClass(self):
+        self.events_test_worker = MultiServerClusterStreamEventsTestWorker()
+        self.events_test_worker.init_worker()
+        self.events_test_worker.purge_tasks()
+
+    @classmethod
+    def tearDownClass(self):
+        self.events_test_worker.purge_tasks()
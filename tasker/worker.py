@@ -1,5 +1,7 @@
 import os
-import ctypes
+import asyncio
+import multiprocessing
+import pickle
 import signal
 import time
 import traceback
@@ -7,6 +9,7 @@ import socket
 import threading
 import concurrent.futures
 
+from . import batch_sizer
 from . import connector
 from . import devices
 from . import encoder
@@ -16,20 +19,54 @@ from . import queue
 from . import storage
 from . import task_queue
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if hasattr(asyncio, 'current_task'):
+    get_current_asyncio_task = asyncio.current_task
+else:
+    get_current_asyncio_task = asyncio.Task.current_task
+
+
+def merge_config(
+    default_config,
+    config,
+):
+    merged_config = default_config.copy()
+
+    for key, value in config.items():
+        if key != 'params' and isinstance(value, dict) and isinstance(merged_config.get(key), dict):
+            merged_config[key] = merge_config(
+                default_config=merged_config[key],
+                config=value,
+            )
+        else:
+            merged_config[key] = value
+
+    return merged_config
+
 
 class Worker:
     name = 'worker_name'
+    work_batch = None
     config = {
         'encoder': {
             'compressor': 'dummy',
             'serializer': 'pickle',
+            'compression_level': None,
+            'adaptive_compression': False,
+            'compression_threshold': 1024,
         },
         'monitoring': {
             'host_name': socket.gethostname(),
             'stats_server': {
                 'host': '',
                 'port': 9999,
-            }
+            },
+            'flush_interval': 1.0,
+            'flush_size': 1000,
         },
         'connector': {
             'type': 'redis',
@@ -40,6 +77,10 @@ class Worker:
                 'database': 0,
             },
         },
+        'queue': {
+            'type': 'regular',
+            'params': {},
+        },
         'timeouts': {
             'soft_timeout': 30.0,
             'hard_timeout': 35.0,
@@ -48,6 +89,7 @@ class Worker:
         },
         'limits': {
             'memory': 0,
+            'memory_sample_interval': 0.5,
         },
         'executor': {
             'type': 'serial',
@@ -55,6 +97,15 @@ class Worker:
         'max_tasks_per_run': 10,
         'max_retries': 3,
         'tasks_per_transaction': 10,
+        'adaptive_batching': {
+            'enabled': False,
+            'min_tasks_per_transaction': 1,
+            'max_tasks_per_transaction': 5000,
+            'target_batch_duration': 1.0,
+            'smoothing_factor': 0.2,
+        },
+        'dequeue_timeout': 1.0,
+        'prefetch_batches': 0,
         'report_completion': False,
         'heartbeat_interval': 10.0,
     }
@@ -65,9 +116,17 @@ class Worker:
         self.logger = logger.logger.Logger(
             logger_name=self.name,
         )
+        self.config = merge_config(
+            default_config=Worker.config,
+            config=self.config,
+        )
 
         self.worker_initialized = False
         self.current_tasks = {}
+        self.get_current_task_key = threading.get_ident
+        self.heartbeater = devices.heartbeater.DummyHeartbeater()
+        self.prefetcher = None
+        self.batch_sizer = None
 
     def init_worker(
         self,
@@ -75,15 +134,27 @@ class Worker:
         if self.worker_initialized:
             return
 
-        encoder_obj = encoder.encoder.Encoder(
+        if self.work_batch is not None and self.config['executor']['type'] != 'serial':
+            raise WorkerException(
+                'work_batch is only supported by the serial executor, not {executor_type}'.format(
+                    executor_type=self.config['executor']['type'],
+                )
+            )
+
+        self.encoder = encoder.encoder.Encoder(
             compressor_name=self.config['encoder']['compressor'],
             serializer_name=self.config['encoder']['serializer'],
+            compression_level=self.config['encoder']['compression_level'],
+            adaptive_compression=self.config['encoder']['adaptive_compression'],
+            compression_threshold=self.config['encoder']['compression_threshold'],
         )
         connector_class = connector.__connectors__[self.config['connector']['type']]
         connector_obj = connector_class(**self.config['connector']['params'])
-        queue_obj = queue.regular.Queue(
+        queue_class = queue.__queues__[self.config['queue']['type']]
+        queue_obj = queue_class(
             connector=connector_obj,
-            encoder=encoder_obj,
+            encoder=self.encoder,
+            **self.config['queue']['params']
         )
 
         self.task_queue = task_queue.TaskQueue(
@@ -91,7 +162,7 @@ class Worker:
         )
         self.storage = storage.storage.Storage(
             connector=connector_obj,
-            encoder=encoder_obj,
+            encoder=self.encoder,
         )
 
         if self.config['monitoring']:
@@ -99,34 +170,61 @@ class Worker:
                 stats_server=self.config['monitoring']['stats_server'],
                 host_name=self.config['monitoring']['host_name'],
                 worker_name=self.name,
+                flush_interval=self.config['monitoring']['flush_interval'],
+                flush_size=self.config['monitoring']['flush_size'],
             )
-            self.heartbeater = devices.heartbeater.Heartbeater(
-                monitor_client=self.monitor_client,
-                interval=self.config['heartbeat_interval'],
-            )
-            self.heartbeater.start()
         else:
             self.monitor_client = monitor.client.StatisticsDummyClient(
                 stats_server=self.config['monitoring']['stats_server'],
                 host_name=self.config['monitoring']['host_name'],
                 worker_name=self.name,
             )
-            self.heartbeater = devices.heartbeater.DummyHeartbeater()
+        self.monitor_client.add_counters_source(
+            counters_function=self.get_compression_counters,
+        )
 
         self.worker_initialized = True
 
+    def get_compression_counters(
+        self,
+    ):
+        compression_statistics = self.encoder.get_compression_statistics()
+
+        return {
+            'compressed_payloads': compression_statistics['compressed_payloads'],
+            'raw_payloads': compression_statistics['raw_payloads'],
+            'uncompressed_bytes': compression_statistics['uncompressed_bytes'],
+            'compressed_bytes': compression_statistics['compressed_bytes'],
+            'compression_time_us': int(compression_statistics['compression_time'] * 1000000),
+        }
+
+    @property
+    def tasks_per_transaction(
+        self,
+    ):
+        if self.batch_sizer:
+            return self.batch_sizer.batch_size
+
+        return self.config['tasks_per_transaction']
+
+    @property
+    def current_task_key(
+        self,
+    ):
+        return self.get_current_task_key()
+
     @property
     def current_task(
         self,
     ):
-        return self.current_tasks[threading.get_ident()]
+        return self.current_tasks[self.current_task_key]
 
     @current_task.setter
     def current_task(
         self,
         value,
     ):
-        self.current_tasks[threading.get_ident()] = value
+        self.current_tasks[self.current_task_key] = value
 
     def purge_tasks(
         self,
@@ -146,12 +244,24 @@ class Worker:
         self,
         *args,
         **kwargs
+    ):
+        return self.craft_task_with_options(
+            args=args,
+            kwargs=kwargs,
+        )
+
+    def craft_task_with_options(
+        self,
+        args=(),
+        kwargs=None,
+        priority=0,
     ):
         task = self.task_queue.craft_task(
             task_name=self.name,
             args=args,
-            kwargs=kwargs,
+            kwargs=kwargs or {},
             report_completion=self.config['report_completion'],
+            priority=priority,
         )
 
         return task
@@ -164,6 +274,14 @@ class Worker:
             task=task,
         )
 
+    def report_complete_many(
+        self,
+        tasks,
+    ):
+        return self.task_queue.report_complete_many(
+            tasks=tasks,
+        )
+
     def wait_task_finished(
         self,
         task,
@@ -179,10 +297,29 @@ class Worker:
         *args,
         **kwargs
     ):
-        task = self.craft_task(*args, **kwargs)
+        return self.apply_async_one_with_options(
+            args=args,
+            kwargs=kwargs,
+        )
+
+    def apply_async_one_with_options(
+        self,
+        args=(),
+        kwargs=None,
+        priority=0,
+        eta=None,
+        countdown=None,
+    ):
+        task = self.craft_task_with_options(
+            args=args,
+            kwargs=kwargs,
+            priority=priority,
+        )
 
         self.task_queue.apply_async_one(
             task=task,
+            eta=eta,
+            countdown=countdown,
         )
 
         return task
@@ -190,26 +327,66 @@ class Worker:
     def apply_async_many(
         self,
         tasks,
+        eta=None,
+        countdown=None,
     ):
         return self.task_queue.apply_async_many(
             tasks=tasks,
+            eta=eta,
+            countdown=countdown,
+        )
+
+    def ack_tasks(
+        self,
+    ):
+        return self.task_queue.ack_tasks(
+            task_name=self.name,
         )
 
     def get_next_tasks(
         self,
         number_of_tasks,
+        timeout=0,
     ):
-        if number_of_tasks > self.config['tasks_per_transaction']:
-            return self.task_queue.get_tasks(
+        if number_of_tasks > self.tasks_per_transaction:
+            tasks = self.task_queue.get_tasks(
                 task_name=self.name,
-                number_of_tasks=self.config['tasks_per_transaction'],
+                number_of_tasks=self.tasks_per_transaction,
+                timeout=timeout,
             )
         else:
-            return self.task_queue.get_tasks(
+            tasks = self.task_queue.get_tasks(
                 task_name=self.name,
                 number_of_tasks=number_of_tasks,
+                timeout=timeout,
+            )
+
+        if tasks and self.config['monitoring']:
+            self.record_fetch_latencies(
+                tasks=tasks,
+            )
+
+        return tasks
+
+    def record_fetch_latencies(
+        self,
+        tasks,
+    ):
+        dequeue_time = time.time()
+        for task in tasks:
+            self.monitor_client.record_latency(
+                latency_type='queue_wait',
+                value=dequeue_time - task['date'],
             )
 
+        self.monitor_client.record_latency(
+            latency_type='decode',
+            value=self.task_queue.last_decode_duration(
+                task_name=self.name,
+            ) / len(tasks),
+            count=len(tasks),
+        )
+
     def work_loop(
         self,
     ):
@@ -224,23 +401,81 @@ class Worker:
                 self.executor = ThreadedExecutor(
                     worker=self,
                 )
+            elif self.config['executor']['type'] == 'asyncio':
+                self.executor = AsyncioExecutor(
+                    worker=self,
+                )
+            elif self.config['executor']['type'] == 'process':
+                self.executor = ProcessExecutor(
+                    worker=self,
+                )
+
+            self.reaper = devices.reaper.DummyReaper()
 
             self.executor.begin_working()
 
+            if self.config['monitoring']:
+                self.heartbeater = devices.heartbeater.Heartbeater(
+                    monitor_client=self.monitor_client,
+                    interval=self.config['heartbeat_interval'],
+                )
+            else:
+                self.heartbeater = devices.heartbeater.DummyHeartbeater()
+            self.heartbeater.start()
+
+            if self.config['queue']['type'] in [
+                'reliable',
+                'stream',
+            ]:
+                self.reaper = devices.reaper.Reaper(
+                    queue=self.task_queue.queue,
+                    queue_name=self.name,
+                )
+            self.reaper.start()
+
+            if self.config['adaptive_batching']['enabled']:
+                self.batch_sizer = batch_sizer.BatchSizer(
+                    initial_batch_size=self.config['tasks_per_transaction'],
+                    min_batch_size=self.config['adaptive_batching']['min_tasks_per_transaction'],
+                    max_batch_size=self.config['adaptive_batching']['max_tasks_per_transaction'],
+                    target_batch_duration=self.config['adaptive_batching']['target_batch_duration'],
+                    smoothing_factor=self.config['adaptive_batching']['smoothing_factor'],
+                )
+            else:
+                self.batch_sizer = None
+
+            if self.config['prefetch_batches'] and self.config['queue']['type'] not in [
+                'reliable',
+                'stream',
+            ]:
+                self.prefetcher = devices.prefetcher.Prefetcher(
+                    fetch_function=self.get_next_tasks,
+                    batch_size=self.tasks_per_transaction,
+                    prefetch_batches=self.config['prefetch_batches'],
+                    timeout=self.config['dequeue_timeout'],
+                )
+            else:
+                self.prefetcher = devices.prefetcher.DummyPrefetcher(
+                    fetch_function=self.get_next_tasks,
+                )
+            self.prefetcher.start()
+
             run_forever = self.config['max_tasks_per_run'] == 0
             tasks_left = self.config['max_tasks_per_run']
 
             while tasks_left > 0 or run_forever is True:
                 if run_forever:
-                    number_of_tasks = self.config['tasks_per_transaction']
+                    number_of_tasks = self.tasks_per_transaction
                 else:
                     number_of_tasks = tasks_left
 
-                tasks = self.get_next_tasks(
+                tasks = self.prefetcher.get_tasks(
                     number_of_tasks=number_of_tasks,
+                    timeout=self.config['dequeue_timeout'],
                 )
                 if not tasks:
-                    time.sleep(1)
+                    if self.config['dequeue_timeout'] == 0:
+                        time.sleep(1)
 
                     continue
 
@@ -248,9 +483,22 @@ class Worker:
                     value=len(tasks),
                 )
 
+                execution_start_time = time.monotonic()
+
                 self.executor.execute_tasks(
                     tasks=tasks,
                 )
+                self.ack_tasks()
+
+                if self.batch_sizer:
+                    self.batch_sizer.update(
+                        number_of_tasks=len(tasks),
+                        duration=time.monotonic() - execution_start_time,
+                        queue_length=self.task_queue.last_known_number_of_enqueued_tasks(
+                            task_name=self.name,
+                        ),
+                    )
+                    self.prefetcher.batch_size = self.batch_sizer.batch_size
 
                 if not run_forever:
                     tasks_left -= len(tasks)
@@ -265,11 +513,33 @@ class Worker:
                 exception_traceback=exception_traceback,
             )
         finally:
+            self.end_prefetching()
             self.executor.end_working()
+            self.reaper.stop()
+
+    def end_prefetching(
+        self,
+    ):
+        if self.prefetcher is None:
+            return
+
+        prefetched_tasks = self.prefetcher.stop()
+        self.prefetcher = None
+
+        self.task_queue.requeue_buffered_tasks(
+            task_name=self.name,
+        )
+
+        if prefetched_tasks:
+            self.task_queue.apply_async_many(
+                tasks=prefetched_tasks,
+            )
 
     def retry(
         self,
         exception=None,
+        eta=None,
+        countdown=None,
     ):
         task = self.current_task
         exception_traceback = ''.join(traceback.format_stack())
@@ -277,6 +547,23 @@ class Worker:
         if not exception:
             exception = WorkerRetry()
 
+        self._retry(
+            task=task,
+            exception=exception,
+            exception_traceback=exception_traceback,
+            eta=eta,
+            countdown=countdown,
+        )
+
+    def _retry(
+        self,
+        task,
+        exception,
+        exception_traceback,
+        eta=None,
+        countdown=None,
+        enqueue=True,
+    ):
         if self.config['max_retries'] <= task['run_count']:
             self._on_max_retries(
                 task=task,
@@ -285,9 +572,8 @@ class Worker:
                 args=task['args'],
                 kwargs=task['kwargs'],
             )
-            self.report_complete(
-                task=task,
-            )
+
+            return False
         else:
             self._on_retry(
                 task=task,
@@ -295,8 +581,13 @@ class Worker:
                 exception_traceback=exception_traceback,
                 args=task['args'],
                 kwargs=task['kwargs'],
+                eta=eta,
+                countdown=countdown,
+                enqueue=enqueue,
             )
 
+            return True
+
     def requeue(
         self,
     ):
@@ -381,6 +672,9 @@ class Worker:
         exception_traceback,
         args,
         kwargs,
+        eta=None,
+        countdown=None,
+        enqueue=True,
     ):
         self.monitor_client.increment_retry(
             value=1,
@@ -413,9 +707,12 @@ class Worker:
                 exception_traceback=exception_traceback,
             )
 
-        self.task_queue.retry(
-            task=task,
-        )
+        if enqueue:
+            self.task_queue.retry(
+                task=task,
+                eta=eta,
+                countdown=countdown,
+            )
 
     def _on_requeue(
         self,
@@ -424,6 +721,7 @@ class Worker:
         exception_traceback,
         args,
         kwargs,
+        enqueue=True,
     ):
         self.logger.log_task_failure(
             failure_reason='Requeue',
@@ -452,9 +750,10 @@ class Worker:
                 exception_traceback=exception_traceback,
             )
 
-        self.task_queue.requeue(
-            task=task,
-        )
+        if enqueue:
+            self.task_queue.requeue(
+                task=task,
+            )
 
     def _on_timeout(
         self,
@@ -648,6 +947,7 @@ class SerialExecutor:
                 exception_traceback=exception_traceback,
             )
 
+        self.worker.end_prefetching()
         self.end_working()
 
         os.kill(os.getpid(), signal.SIGTERM)
@@ -673,6 +973,7 @@ class SerialExecutor:
                 critical_timeout_signal=signal.SIGTERM,
                 memory_limit=self.worker.config['limits']['memory'],
                 memory_limit_signal=signal.SIGABRT,
+                memory_sample_interval=self.worker.config['limits']['memory_sample_interval'],
             )
         else:
             self.killer = devices.killer.RemoteKiller(
@@ -685,6 +986,7 @@ class SerialExecutor:
                 critical_timeout_signal=signal.SIGTERM,
                 memory_limit=self.worker.config['limits']['memory'],
                 memory_limit_signal=signal.SIGABRT,
+                memory_sample_interval=self.worker.config['limits']['memory_sample_interval'],
             )
 
         signal.signal(signal.SIGABRT, self.sigabrt_handler)
@@ -699,6 +1001,7 @@ class SerialExecutor:
             self.worker.task_queue.apply_async_many(
                 tasks=self.tasks_to_finish,
             )
+            self.worker.ack_tasks()
 
         signal.signal(signal.SIGABRT, signal.SIG_DFL)
         signal.signal(signal.SIGINT, signal.SIG_DFL)
@@ -712,25 +1015,163 @@ class SerialExecutor:
     ):
         self.tasks_to_finish = tasks.copy()
 
+        if self.worker.work_batch is not None:
+            self.execute_batch(
+                tasks=tasks,
+            )
+            self.tasks_to_finish = []
+
+            return
+
         for task in tasks:
             self.execute_task(
                 task=task,
             )
             self.tasks_to_finish.remove(task)
 
+    def execute_batch(
+        self,
+        tasks,
+    ):
+        try:
+            self.killer.restart()
+
+            work_start_time = time.perf_counter()
+            try:
+                outcomes = self.worker.work_batch(
+                    tasks=tasks,
+                )
+            finally:
+                self.worker.monitor_client.record_latency(
+                    latency_type='work',
+                    value=(time.perf_counter() - work_start_time) / len(tasks),
+                    count=len(tasks),
+                )
+
+            self.killer.stop()
+
+            if len(outcomes) != len(tasks):
+                raise WorkerException(
+                    'work_batch returned {number_of_outcomes} outcomes for {number_of_tasks} tasks'.format(
+                        number_of_outcomes=len(outcomes),
+                        number_of_tasks=len(tasks),
+                    )
+                )
+        except Exception as exception:
+            outcomes = [exception] * len(tasks)
+        finally:
+            self.killer.stop()
+
+        tasks_to_report = []
+        tasks_to_retry = []
+        tasks_to_requeue = []
+
+        for task, outcome in zip(tasks, outcomes):
+            if not isinstance(outcome, Exception):
+                self.worker._on_success(
+                    task=task,
+                    returned_value=outcome,
+                    args=task['args'],
+                    kwargs=task['kwargs'],
+                )
+                tasks_to_report.append(task)
+
+                continue
+
+            exception_traceback = ''.join(
+                traceback.format_exception(
+                    type(outcome),
+                    outcome,
+                    outcome.__traceback__,
+                )
+            )
+
+            if isinstance(outcome, WorkerRequeue):
+                self.worker._on_requeue(
+                    task=task,
+                    exception=outcome,
+                    exception_traceback=exception_traceback,
+                    args=task['args'],
+                    kwargs=task['kwargs'],
+                    enqueue=False,
+                )
+                tasks_to_requeue.append(task)
+
+                continue
+
+            if isinstance(outcome, WorkerRetry):
+                should_retry = self.worker._retry(
+                    task=task,
+                    exception=outcome,
+                    exception_traceback=exception_traceback,
+                    enqueue=False,
+                )
+                if should_retry:
+                    tasks_to_retry.append(task)
+            elif isinstance(
+                outcome,
+                (
+                    WorkerSoftTimedout,
+                    WorkerHardTimedout,
+                ),
+            ):
+                self.worker._on_timeout(
+                    task=task,
+                    exception=outcome,
+                    exception_traceback=exception_traceback,
+                    args=task['args'],
+                    kwargs=task['kwargs'],
+                )
+            else:
+                self.worker._on_failure(
+                    task=task,
+                    exception=outcome,
+                    exception_traceback=exception_traceback,
+                    args=task['args'],
+                    kwargs=task['kwargs'],
+                )
+
+            tasks_to_report.append(task)
+
+        if tasks_to_retry:
+            self.worker.task_queue.retry_many(
+                tasks=tasks_to_retry,
+            )
+        if tasks_to_requeue:
+            self.worker.task_queue.requeue_many(
+                tasks=tasks_to_requeue,
+            )
+        if tasks_to_report:
+            report_complete_start_time = time.perf_counter()
+            self.worker.report_complete_many(
+                tasks=tasks_to_report,
+            )
+            self.worker.monitor_client.record_latency(
+                latency_type='report_complete',
+                value=(time.perf_counter() - report_complete_start_time) / len(tasks_to_report),
+                count=len(tasks_to_report),
+            )
+
     def execute_task(
         self,
         task,
     ):
         try:
-            self.killer.reset()
-            self.killer.start()
+            self.killer.restart()
 
             self.worker.current_task = task
-            returned_value = self.worker.work(
-                *task['args'],
-                **task['kwargs']
-            )
+
+            work_start_time = time.perf_counter()
+            try:
+                returned_value = self.worker.work(
+                    *task['args'],
+                    **task['kwargs']
+                )
+            finally:
+                self.worker.monitor_client.record_latency(
+                    latency_type='work',
+                    value=time.perf_counter() - work_start_time,
+                )
 
             self.killer.stop()
 
@@ -780,15 +1221,19 @@ class SerialExecutor:
 
             status = 'failure'
         finally:
-            self.killer.reset()
             self.killer.stop()
 
             if status not in [
                 'requeue',
             ]:
+                report_complete_start_time = time.perf_counter()
                 self.worker.report_complete(
                     task=task,
                 )
+                self.worker.monitor_client.record_latency(
+                    latency_type='report_complete',
+                    value=time.perf_counter() - report_complete_start_time,
+                )
 
             del(self.worker.current_tasks[threading.get_ident()])
 
@@ -802,55 +1247,90 @@ class ThreadedExecutor:
     ):
         self.worker = worker
         self.concurrency = worker.config['executor']['concurrency']
+        self.max_in_flight = worker.config['executor'].get(
+            'max_in_flight',
+            self.concurrency * 2,
+        )
 
     def begin_working(
         self,
     ):
+        self.thread_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.concurrency,
+        )
+        self.in_flight_window = threading.BoundedSemaphore(
+            value=self.max_in_flight,
+        )
+        self.deadline_timer = devices.deadline_timer.DeadlineTimer(
+            exception=WorkerSoftTimedout,
+        )
+        self.deadline_timer.start()
+
         self.worker.init()
 
     def end_working(
         self,
     ):
+        self.thread_pool.shutdown(
+            wait=True,
+        )
+        self.deadline_timer.stop()
+
         self.worker.heartbeater.stop()
 
+    def release_in_flight_slot(
+        self,
+        future,
+    ):
+        self.in_flight_window.release()
+
     def execute_tasks(
         self,
         tasks,
     ):
-        future_to_task = {}
+        futures = []
 
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.concurrency,
-        ) as executor:
-            for task in tasks:
-                future = executor.submit(self.execute_task, task)
-                future_to_task[future] = task
+        for task in tasks:
+            self.in_flight_window.acquire()
+
+            future = self.thread_pool.submit(self.execute_task, task)
+            future.add_done_callback(self.release_in_flight_slot)
+            futures.append(future)
 
-        for future in concurrent.futures.as_completed(future_to_task):
-            pass
+        if self.worker.batch_sizer or self.worker.config['queue']['type'] in [
+            'reliable',
+            'stream',
+        ]:
+            concurrent.futures.wait(futures)
 
     def execute_task(
         self,
         task,
     ):
         try:
-            timeout_timer = threading.Timer(
-                interval=self.worker.config['timeouts']['soft_timeout'],
-                function=ctypes.pythonapi.PyThreadState_SetAsyncExc,
-                args=(
-                    ctypes.c_long(threading.get_ident()),
-                    ctypes.py_object(WorkerSoftTimedout),
+            if self.worker.config['timeouts']['soft_timeout']:
+                self.deadline_timer.set_deadline(
+                    thread_id=threading.get_ident(),
+                    timeout=self.worker.config['timeouts']['soft_timeout'],
                 )
-            )
-            timeout_timer.start()
 
             self.worker.current_task = task
-            returned_value = self.worker.work(
-                *task['args'],
-                **task['kwargs']
-            )
 
-            timeout_timer.cancel()
+            work_start_time = time.perf_counter()
+            try:
+                returned_value = self.worker.work(
+                    *task['args'],
+                    **task['kwargs']
+                )
+            finally:
+                self.worker.monitor_client.record_latency(
+                    latency_type='work',
+                    value=time.perf_counter() - work_start_time,
+                )
+
+            self.deadline_timer.clear_deadline(
+                thread_id=threading.get_ident(),
+            )
 
             self.worker._on_success(
                 task=task,
@@ -895,20 +1375,507 @@ class ThreadedExecutor:
 
             status = 'failure'
         finally:
-            timeout_timer.cancel()
+            self.deadline_timer.clear_deadline(
+                thread_id=threading.get_ident(),
+            )
 
             if status not in [
                 'requeue',
             ]:
+                report_complete_start_time = time.perf_counter()
                 self.worker.report_complete(
                     task=task,
                 )
+                self.worker.monitor_client.record_latency(
+                    latency_type='report_complete',
+                    value=time.perf_counter() - report_complete_start_time,
+                )
 
             del(self.worker.current_tasks[threading.get_ident()])
 
             return status
 
 
+class AsyncioExecutor:
+    def __init__(
+        self,
+        worker,
+    ):
+        self.worker = worker
+        self.concurrency = worker.config['executor']['concurrency']
+
+        self.pending_retries = {}
+
+    def begin_working(
+        self,
+    ):
+        if uvloop:
+            self.event_loop = uvloop.new_event_loop()
+        else:
+            self.event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.event_loop)
+
+        self.concurrency_semaphore = asyncio.Semaphore(
+            value=self.concurrency,
+        )
+
+        self.worker.get_current_task_key = get_current_asyncio_task
+        self.worker_retry = self.worker._retry
+        self.worker._retry = self.record_retry
+
+        self.worker.init()
+
+    def end_working(
+        self,
+    ):
+        self.event_loop.close()
+
+        self.worker.get_current_task_key = threading.get_ident
+        self.worker._retry = self.worker_retry
+
+        self.worker.heartbeater.stop()
+
+    def record_retry(
+        self,
+        task,
+        exception,
+        exception_traceback,
+        eta=None,
+        countdown=None,
+    ):
+        self.pending_retries.setdefault(
+            id(task),
+            [],
+        ).append(
+            {
+                'exception': exception,
+                'exception_traceback': exception_traceback,
+                'eta': eta,
+                'countdown': countdown,
+            }
+        )
+
+    def execute_tasks(
+        self,
+        tasks,
+    ):
+        results = self.event_loop.run_until_complete(
+            asyncio.gather(
+                *[
+                    self.execute_task(
+                        task=task,
+                    )
+                    for task in tasks
+                ]
+            )
+        )
+
+        tasks_to_report = []
+        for task, result in zip(tasks, results):
+            self.handle_result(
+                task=task,
+                result=result,
+            )
+
+            if result['status'] not in [
+                'requeue',
+            ]:
+                tasks_to_report.append(task)
+
+        if tasks_to_report:
+            report_complete_start_time = time.perf_counter()
+            self.worker.report_complete_many(
+                tasks=tasks_to_report,
+            )
+            self.worker.monitor_client.record_latency(
+                latency_type='report_complete',
+                value=(time.perf_counter() - report_complete_start_time) / len(tasks_to_report),
+                count=len(tasks_to_report),
+            )
+
+    def handle_result(
+        self,
+        task,
+        result,
+    ):
+        for pending_retry in self.pending_retries.pop(id(task), []):
+            self.worker_retry(
+                task=task,
+                **pending_retry
+            )
+
+        if result['status'] == 'success':
+            self.worker._on_success(
+                task=task,
+                returned_value=result['returned_value'],
+                args=task['args'],
+                kwargs=task['kwargs'],
+            )
+        elif result['status'] == 'timeout':
+            self.worker._on_timeout(
+                task=task,
+                exception=result['exception'],
+                exception_traceback=result['exception_traceback'],
+                args=task['args'],
+                kwargs=task['kwargs'],
+            )
+        elif result['status'] == 'requeue':
+            self.worker._on_requeue(
+                task=task,
+                exception=result['exception'],
+                exception_traceback=result['exception_traceback'],
+                args=task['args'],
+                kwargs=task['kwargs'],
+            )
+        else:
+            self.worker._on_failure(
+                task=task,
+                exception=result['exception'],
+                exception_traceback=result['exception_traceback'],
+                args=task['args'],
+                kwargs=task['kwargs'],
+            )
+
+    async def run_work(
+        self,
+        task,
+    ):
+        self.worker.current_task = task
+
+        try:
+            return await self.worker.work(
+                *task['args'],
+                **task['kwargs']
+            )
+        finally:
+            del(self.worker.current_tasks[self.worker.current_task_key])
+
+    async def execute_task(
+        self,
+        task,
+    ):
+        result = {
+            'status': 'failure',
+            'returned_value': None,
+            'exception': None,
+            'exception_traceback': None,
+        }
+
+        if self.worker.config['timeouts']['soft_timeout']:
+            timeout = self.worker.config['timeouts']['soft_timeout']
+            timeout_exception = WorkerSoftTimedout
+        else:
+            timeout = self.worker.config['timeouts']['hard_timeout'] or None
+            timeout_exception = WorkerHardTimedout
+
+        async with self.concurrency_semaphore:
+            work_start_time = time.perf_counter()
+            try:
+                result['returned_value'] = await asyncio.wait_for(
+                    self.run_work(
+                        task=task,
+                    ),
+                    timeout=timeout,
+                )
+                result['status'] = 'success'
+            except asyncio.TimeoutError:
+                result['status'] = 'timeout'
+                result['exception'] = timeout_exception()
+                result['exception_traceback'] = traceback.format_exc()
+            except WorkerRequeue as exception:
+                result['status'] = 'requeue'
+                result['exception'] = exception
+                result['exception_traceback'] = traceback.format_exc()
+            except Exception as exception:
+                result['status'] = 'failure'
+                result['exception'] = exception
+                result['exception_traceback'] = traceback.format_exc()
+            finally:
+                self.worker.monitor_client.record_latency(
+                    latency_type='work',
+                    value=time.perf_counter() - work_start_time,
+                )
+
+        return result
+
+
+current_process_executor = None
+
+
+def init_process_executor(
+    executor,
+):
+    global current_process_executor
+
+    current_process_executor = executor
+    current_process_executor.init_child()
+
+
+def execute_task_in_process(
+    task,
+):
+    return current_process_executor.execute_task(
+        task=task,
+    )
+
+
+def make_picklable_exception(
+    exception,
+):
+    try:
+        pickle.loads(pickle.dumps(exception))
+
+        return exception
+    except Exception:
+        return WorkerException(repr(exception))
+
+
+class ProcessExecutor:
+    def __init__(
+        self,
+        worker,
+    ):
+        self.worker = worker
+        self.concurrency = worker.config['executor']['concurrency']
+
+    def begin_working(
+        self,
+    ):
+        self.worker.init()
+
+        self.start_process_pool()
+
+    def start_process_pool(
+        self,
+    ):
+        self.process_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.concurrency,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=init_process_executor,
+            initargs=(
+                self,
+            ),
+        )
+        self.process_pool.submit(os.getpid).result()
+
+    def end_working(
+        self,
+    ):
+        self.process_pool.shutdown(
+            wait=True,
+        )
+
+        self.worker.heartbeater.stop()
+
+    def init_child(
+        self,
+    ):
+        signal.signal(signal.SIGINT, self.sigint_handler)
+        signal.signal(signal.SIGABRT, self.sigabrt_handler)
+
+        self.killer = devices.killer.LocalKiller(
+            pid=os.getpid(),
+            soft_timeout=self.worker.config['timeouts']['soft_timeout'],
+            soft_timeout_signal=signal.SIGINT,
+            hard_timeout=self.worker.config['timeouts']['hard_timeout'],
+            hard_timeout_signal=signal.SIGABRT,
+            critical_timeout=self.worker.config['timeouts']['critical_timeout'],
+            critical_timeout_signal=signal.SIGTERM,
+            memory_limit=self.worker.config['limits']['memory'],
+            memory_limit_signal=signal.SIGTERM,
+            memory_sample_interval=self.worker.config['limits']['memory_sample_interval'],
+        )
+
+        self.pending_retries = []
+        self.worker._retry = self.record_retry
+
+    def sigint_handler(
+        self,
+        signal_num,
+        frame,
+    ):
+        raise WorkerSoftTimedout()
+
+    def sigabrt_handler(
+        self,
+        signal_num,
+        frame,
+    ):
+        raise WorkerHardTimedout()
+
+    def record_retry(
+        self,
+        task,
+        exception,
+        exception_traceback,
+        eta=None,
+        countdown=None,
+    ):
+        self.pending_retries.append(
+            {
+                'exception': make_picklable_exception(
+                    exception=exception,
+                ),
+                'exception_traceback': exception_traceback,
+                'eta': eta,
+                'countdown': countdown,
+            }
+        )
+
+    def execute_tasks(
+        self,
+        tasks,
+    ):
+        futures = [
+            self.process_pool.submit(
+                execute_task_in_process,
+                task,
+            )
+            for task in tasks
+        ]
+
+        process_pool_broken = False
+        for task, future in zip(tasks, futures):
+            try:
+                result = future.result()
+            except Exception as exception:
+                if isinstance(exception, concurrent.futures.BrokenExecutor):
+                    process_pool_broken = True
+
+                result = {
+                    'status': 'failure',
+                    'returned_value': None,
+                    'exception': exception,
+                    'exception_traceback': traceback.format_exc(),
+                    'retries': [],
+                    'work_duration': None,
+                }
+
+            self.handle_result(
+                task=task,
+                result=result,
+            )
+
+        if process_pool_broken:
+            self.process_pool.shutdown(
+                wait=False,
+            )
+            self.start_process_pool()
+
+    def handle_result(
+        self,
+        task,
+        result,
+    ):
+        if result['work_duration'] is not None:
+            self.worker.monitor_client.record_latency(
+                latency_type='work',
+                value=result['work_duration'],
+            )
+
+        for pending_retry in result['retries']:
+            self.worker._retry(
+                task=task,
+                **pending_retry
+            )
+
+        if result['status'] == 'success':
+            self.worker._on_success(
+                task=task,
+                returned_value=result['returned_value'],
+                args=task['args'],
+                kwargs=task['kwargs'],
+            )
+        elif result['status'] == 'timeout':
+            self.worker._on_timeout(
+                task=task,
+                exception=result['exception'],
+                exception_traceback=result['exception_traceback'],
+                args=task['args'],
+                kwargs=task['kwargs'],
+            )
+        elif result['status'] == 'requeue':
+            self.worker._on_requeue(
+                task=task,
+                exception=result['exception'],
+                exception_traceback=result['exception_traceback'],
+                args=task['args'],
+                kwargs=task['kwargs'],
+            )
+        else:
+            self.worker._on_failure(
+                task=task,
+                exception=result['exception'],
+                exception_traceback=result['exception_traceback'],
+                args=task['args'],
+                kwargs=task['kwargs'],
+            )
+
+        if result['status'] not in [
+            'requeue',
+        ]:
+            report_complete_start_time = time.perf_counter()
+            self.worker.report_complete(
+                task=task,
+            )
+            self.worker.monitor_client.record_latency(
+                latency_type='report_complete',
+                value=time.perf_counter() - report_complete_start_time,
+            )
+
+    def execute_task(
+        self,
+        task,
+    ):
+        self.pending_retries = []
+
+        result = {
+            'status': 'success',
+            'returned_value': None,
+            'exception': None,
+            'exception_traceback': None,
+            'retries': self.pending_retries,
+            'work_duration': None,
+        }
+
+        work_start_time = time.perf_counter()
+        try:
+            self.killer.restart()
+
+            self.worker.current_task = task
+            result['returned_value'] = self.worker.work(
+                *task['args'],
+                **task['kwargs']
+            )
+
+            self.killer.stop()
+        except (
+            WorkerSoftTimedout,
+            WorkerHardTimedout,
+        ) as exception:
+            result['status'] = 'timeout'
+            result['exception'] = exception
+            result['exception_traceback'] = traceback.format_exc()
+        except WorkerRequeue as exception:
+            result['status'] = 'requeue'
+            result['exception'] = exception
+            result['exception_traceback'] = traceback.format_exc()
+        except Exception as exception:
+            result['status'] = 'failure'
+            result['exception'] = make_picklable_exception(
+                exception=exception,
+            )
+            result['exception_traceback'] = traceback.format_exc()
+        finally:
+            self.killer.stop()
+
+            result['work_duration'] = time.perf_counter() - work_start_time
+
+            del(self.worker.current_tasks[threading.get_ident()])
+
+        return result
+
+
 class WorkerException(
     Exception,
 ):